@@ -0,0 +1,142 @@
+"""
+In-process response caches for BibleMVP.
+Bible text only changes on import, so assembled payloads are cached in memory
+and invalidated whenever the database data version changes.
+"""
+from collections import OrderedDict
+import asyncio
+import json
+import os
+import threading
+
+CHAPTER_CACHE_MAX_BYTES = int(os.environ.get("CHAPTER_CACHE_MAX_BYTES", str(64 * 1024 * 1024)))
+COMPRESSED_CACHE_MAX_BYTES = int(os.environ.get("COMPRESSED_CACHE_MAX_BYTES", str(64 * 1024 * 1024)))
+SEARCH_CACHE_MAX_BYTES = int(os.environ.get("SEARCH_CACHE_MAX_BYTES", str(16 * 1024 * 1024)))
+
+
+def estimate_size(value) -> int:
+    """Approximate memory footprint of a JSON-able payload (its encoded length)."""
+    return len(json.dumps(value, separators=(",", ":"), ensure_ascii=False, default=str))
+
+
+class LRUCache:
+    """
+    Least-recently-used cache bounded by total payload size in bytes.
+
+    Entries are tagged with the data version they were built from; a lookup
+    with a different version drops every entry so stale data is never served.
+    """
+
+    def __init__(self, max_bytes: int, name: str = "cache"):
+        self.name = name
+        self.max_bytes = max_bytes
+        self.version = None
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def get(self, key, version=None):
+        """Return the cached value for `key`, or None on a miss."""
+        with self._lock:
+            if version != self.version:
+                self._reset(version)
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key, value, version=None, size: int = None):
+        """Store `value` under `key`, evicting least-recently-used entries to fit."""
+        if size is None:
+            size = estimate_size(value)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            if version != self.version:
+                self._reset(version)
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= old[1]
+            self._entries[key] = (value, size)
+            self._bytes += size
+            while self._bytes > self.max_bytes:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._bytes -= evicted_size
+                self.evictions += 1
+
+    def clear(self):
+        """Drop every entry (counters are kept)."""
+        with self._lock:
+            self._reset(self.version)
+
+    def _reset(self, version):
+        if self._entries:
+            self.invalidations += 1
+        self._entries.clear()
+        self._bytes = 0
+        self.version = version
+
+    def stats(self) -> dict:
+        """Hit/miss/eviction counters and current occupancy."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "name": self.name,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+                "data_version": self.version,
+            }
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent builds of the same key: the first caller starts the
+    build, later callers await the same task instead of repeating the work.
+    The build is shielded, so a disconnecting first caller doesn't cancel it
+    for the others.
+    """
+
+    def __init__(self):
+        self._inflight = {}
+        self.coalesced = 0
+
+    async def run(self, key, build):
+        """Await `build()` for `key`, sharing a build already in flight."""
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(build())
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        else:
+            self.coalesced += 1
+        return await asyncio.shield(task)
+
+    def stats(self) -> dict:
+        return {"in_flight": len(self._inflight), "coalesced": self.coalesced}
+
+
+chapter_cache = LRUCache(CHAPTER_CACHE_MAX_BYTES, name="chapters")
+
+# Compressed response bodies keyed by (ETag, encoding); ETags already change
+# with the data version, so stale entries simply age out
+compressed_cache = LRUCache(COMPRESSED_CACHE_MAX_BYTES, name="compressed")
+
+# Search payloads keyed by normalized query, scope, page size and cursor
+search_cache = LRUCache(SEARCH_CACHE_MAX_BYTES, name="search")
+search_flight = SingleFlight()
+
+# Builds of the /api/suggest index, keyed by data version
+suggest_flight = SingleFlight()
@@ -0,0 +1,223 @@
+"""
+Negotiated response compression for BibleMVP.
+
+Responses are compressed with the best encoding the client accepts: zstd and
+brotli when their optional packages (`zstandard`, `brotli`) are installed,
+otherwise gzip. Bodies below COMPRESSION_MIN_BYTES are sent as is. Streamed
+responses are compressed chunk by chunk and flushed after each one, so
+/api/offline/book still delivers each chapter as soon as it is ready.
+
+Content responses with an ETag from HTTPCacheMiddleware depend only on the
+data version and the request. Their compressed bytes are kept in a side
+cache keyed by (ETag, encoding), and a repeat request is answered from it
+without running the endpoint or compressing again.
+"""
+import os
+import zlib
+
+from starlette.concurrency import run_in_threadpool
+from starlette.datastructures import Headers, MutableHeaders
+
+from .cache import compressed_cache
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+COMPRESSION_MIN_BYTES = int(os.environ.get("COMPRESSION_MIN_BYTES", "1024"))
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 5
+ZSTD_LEVEL = 3
+
+# Chunks larger than this are compressed on a worker thread, off the event loop
+THREADPOOL_MIN_BYTES = 64 * 1024
+
+COMPRESSIBLE_TYPES = (
+    "application/json", "application/x-ndjson", "application/javascript",
+    "application/manifest+json", "image/svg+xml", "text/",
+)
+
+
+def _gzip():
+    compressor = zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, 31)
+    return (compressor.compress,
+            lambda: compressor.flush(zlib.Z_SYNC_FLUSH),
+            compressor.flush)
+
+
+def _brotli():
+    compressor = brotli.Compressor(quality=BROTLI_QUALITY)
+    return compressor.process, compressor.flush, compressor.finish
+
+
+def _zstd():
+    compressor = zstandard.ZstdCompressor(level=ZSTD_LEVEL).compressobj()
+    return (compressor.compress,
+            lambda: compressor.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK),
+            compressor.flush)
+
+
+# Encoding -> factory returning (compress, flush, finish), in server preference order
+ENCODERS = {}
+if zstandard is not None:
+    ENCODERS["zstd"] = _zstd
+if brotli is not None:
+    ENCODERS["br"] = _brotli
+ENCODERS["gzip"] = _gzip
+
+
+def negotiate(accept_encoding: str):
+    """Pick the encoding to use for an Accept-Encoding header, or None."""
+    weights = {}
+    for item in accept_encoding.split(","):
+        name, _, params = item.strip().partition(";")
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                continue
+        if name:
+            weights[name.strip().lower()] = q
+    best, best_q = None, 0.0
+    for name in ENCODERS:
+        q = weights.get(name, weights.get("*", 0.0))
+        if q > best_q:
+            best, best_q = name, q
+    return best
+
+
+def encoded_etag(etag: str, encoding: str) -> str:
+    """Strong ETag of the `encoding` representation of a response."""
+    return f'{etag[:-1]}-{encoding}"'
+
+
+class CompressionMiddleware:
+    """ASGI middleware compressing GET responses and caching immutable compressed bodies."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] != "GET":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = negotiate(Headers(scope=scope).get("accept-encoding", ""))
+        etag = scope.get("etag")
+        if encoding and etag:
+            cached = compressed_cache.get((etag, encoding))
+            if cached is not None:
+                headers, body = cached
+                await send({"type": "http.response.start", "status": 200, "headers": headers})
+                await send({"type": "http.response.body", "body": body})
+                return
+
+        responder = _CompressingResponder(send, encoding, etag)
+        await self.app(scope, receive, responder.send)
+
+
+class _CompressingResponder:
+    """Per-request `send` wrapper: holds the start message until the first body chunk."""
+
+    def __init__(self, send, encoding, etag):
+        self._send = send
+        self.encoding = encoding
+        self.etag = etag
+        self.start = None
+        self.headers = None      # raw headers of the compressed response
+        self.passthrough = False
+        self.compressor = None
+        self.cached = []         # compressed chunks kept for the side cache
+        self.cached_bytes = 0
+
+    async def send(self, message):
+        if message["type"] == "http.response.start":
+            self.start = message
+            return
+        if message["type"] != "http.response.body" or self.passthrough:
+            await self._send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+        if self.start is not None:
+            await self._begin(body, more_body)
+            return
+
+        # Later chunks of a compressed streaming response
+        data = await self._compress_chunk(body, final=not more_body)
+        await self._send({"type": "http.response.body", "body": data, "more_body": more_body})
+        if not more_body:
+            self._store()
+
+    async def _begin(self, body: bytes, more_body: bool):
+        start, self.start = self.start, None
+        headers = MutableHeaders(scope=start)
+        eligible = (
+            start["status"] == 200
+            and "content-encoding" not in headers
+            and headers.get("content-type", "").startswith(COMPRESSIBLE_TYPES)
+            and (more_body or len(body) >= COMPRESSION_MIN_BYTES)
+        )
+        if not eligible:
+            self.passthrough = True
+            await self._send(start)
+            await self._send({"type": "http.response.body", "body": body, "more_body": more_body})
+            return
+
+        headers.add_vary_header("Accept-Encoding")
+        if self.encoding is None:
+            self.passthrough = True
+            await self._send(start)
+            await self._send({"type": "http.response.body", "body": body, "more_body": more_body})
+            return
+
+        self.compressor = ENCODERS[self.encoding]()
+        headers["content-encoding"] = self.encoding
+        if self.etag is not None:
+            headers["etag"] = encoded_etag(self.etag, self.encoding)
+        elif "etag" in headers and not headers["etag"].startswith("W/"):
+            # e.g. static files: the validator no longer matches these bytes exactly
+            headers["etag"] = "W/" + headers["etag"]
+        if "content-length" in headers:
+            del headers["content-length"]
+
+        data = await self._compress_chunk(body, final=not more_body)
+        if not more_body:
+            headers["content-length"] = str(len(data))
+        self.headers = start["headers"]
+        await self._send(start)
+        await self._send({"type": "http.response.body", "body": data, "more_body": more_body})
+        if not more_body:
+            self._store()
+
+    async def _compress_chunk(self, body: bytes, final: bool) -> bytes:
+        compress_chunk, flush, finish = self.compressor
+
+        def run():
+            return compress_chunk(body) + (finish() if final else flush())
+
+        data = await run_in_threadpool(run) if len(body) >= THREADPOOL_MIN_BYTES else run()
+        if self.etag is not None and self.cached is not None:
+            self.cached_bytes += len(data)
+            if self.cached_bytes > compressed_cache.max_bytes:
+                self.cached = None
+            else:
+                self.cached.append(data)
+        return data
+
+    def _store(self):
+        if self.etag is None or self.cached is None:
+            return
+        body = b"".join(self.cached)
+        headers = MutableHeaders(raw=list(self.headers))
+        headers["content-length"] = str(len(body))
+        compressed_cache.put((self.etag, self.encoding), (headers.raw, body), size=len(body))
@@ -2,189 +2,561 @@
 Database initialization and connection management for BibleMVP.
 Uses SQLite with FTS5 for full-text search.
 """
+import asyncio
+import contextvars
 import sqlite3
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 from pathlib import Path
+from contextlib import contextmanager
 import logging
-import re
+import os
+import queue
+import threading
+import time
+
+from . import metrics
+from .migrations import (
+    SCHEMA_VERSION, pending_migrations, refresh_search_vocabulary, refresh_verse_search, schema_version,
+    set_schema_version
+)
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 DATABASE_PATH = Path(__file__).parent.parent / "data" / "bible.db"
 
+# Read-only connection pool settings (overridable per deployment)
+POOL_SIZE = int(os.environ.get("DB_POOL_SIZE", "8"))
+POOL_TIMEOUT = float(os.environ.get("DB_POOL_TIMEOUT", "10"))
+MMAP_SIZE = int(os.environ.get("DB_MMAP_SIZE", str(256 * 1024 * 1024)))
+CACHE_SIZE_KB = int(os.environ.get("DB_CACHE_SIZE_KB", str(32 * 1024)))
+
+# Query execution limits: total concurrent DB jobs, and how many of those
+# may be bulk exports so they can't starve the chapter-reading path
+MAX_CONCURRENCY = int(os.environ.get("DB_MAX_CONCURRENCY", str(POOL_SIZE)))
+BULK_CONCURRENCY = int(os.environ.get("DB_BULK_CONCURRENCY", "2"))
+
+# Seconds a streaming export may wait on a consumer that stopped reading
+# before it gives up and frees its worker
+STREAM_STALL_TIMEOUT = float(os.environ.get("DB_STREAM_STALL_TIMEOUT", "60"))
+
+# How often (seconds) running servers re-check the data version stamp
+DATA_VERSION_TTL = float(os.environ.get("DATA_VERSION_TTL", "5"))
+
 
 def get_db_connection() -> sqlite3.Connection:
-    """Get a database connection with row factory enabled."""
+    """Get a writable database connection with row factory enabled.
+
+    Used for schema setup, migrations and import scripts. API requests
+    should borrow a read-only connection from `db_pool` instead.
+    """
     conn = sqlite3.connect(DATABASE_PATH)
     conn.row_factory = sqlite3.Row
     return conn
 
 
-def init_db():
-    """Initialize the database schema."""
-    logger.info(f"Database path: {DATABASE_PATH}")
-    logger.info(f"Database exists: {DATABASE_PATH.exists()}")
-
-    if DATABASE_PATH.exists():
-        # Check if it has data
-        conn = get_db_connection()
+class PoolTimeout(Exception):
+    """Raised when no pooled connection becomes free within the timeout."""
+
+
+class StreamClosed(Exception):
+    """Raised inside a streaming producer when its consumer has gone away."""
+
+
+class ConnectionPool:
+    """
+    Fixed-size pool of read-only SQLite connections shared by API requests.
+
+    Connections are opened with `mode=ro`, tuned with per-connection PRAGMAs
+    and pre-warmed at startup so requests skip the file open, schema parse
+    and cold page cache. Idle connections are reused LIFO to keep the most
+    recently used (hottest) cache in play.
+    """
+
+    def __init__(self, size: int = POOL_SIZE, timeout: float = POOL_TIMEOUT):
+        self.size = size
+        self.timeout = timeout
+        self.path = None
+        self._idle = queue.LifoQueue()
+        self._lock = threading.Lock()
+        self._created = 0
+        self._checkouts = 0
+        self._waits = 0
+        self._wait_seconds = 0.0
+        self._timeouts = 0
+
+    def open(self, path: Path = None, warm: bool = True):
+        """Point the pool at a database file and optionally pre-open every connection."""
+        self.close()
+        self.path = Path(path or DATABASE_PATH)
+        if warm:
+            for _ in range(self.size):
+                conn = self._connect()
+                with self._lock:
+                    self._created += 1
+                self._idle.put(conn)
+            logger.info(f"Connection pool warmed: {self.size} read-only connections")
+
+    def _connect(self) -> sqlite3.Connection:
+        if self.path is None:
+            raise RuntimeError("Connection pool has not been opened")
+        conn = sqlite3.connect(
+            f"{self.path.resolve().as_uri()}?mode=ro",
+            uri=True,
+            check_same_thread=False,
+        )
+        conn.row_factory = sqlite3.Row
+        conn.execute(f"PRAGMA mmap_size = {MMAP_SIZE}")
+        conn.execute(f"PRAGMA cache_size = -{CACHE_SIZE_KB}")
+        conn.execute("PRAGMA temp_store = MEMORY")
+        # Force the schema to be parsed now rather than on the first request
+        conn.execute("SELECT COUNT(*) FROM sqlite_master").fetchone()
+        return conn
+
+    def acquire(self) -> sqlite3.Connection:
+        """Check out a connection, opening a new one if the pool is not yet full."""
         try:
-            cursor = conn.execute("SELECT COUNT(*) FROM verses")
-            count = cursor.fetchone()[0]
-            logger.info(f"Verses in database: {count}")
-
-            # Run one-time migrations
-            _migrate_commentary_links(conn)
-        except Exception as e:
-            logger.error(f"Error checking database: {e}")
+            conn = self._idle.get_nowait()
+        except queue.Empty:
+            with self._lock:
+                can_grow = self._created < self.size
+                if can_grow:
+                    self._created += 1
+            if can_grow:
+                try:
+                    conn = self._connect()
+                except Exception:
+                    with self._lock:
+                        self._created -= 1
+                    raise
+            else:
+                started = time.perf_counter()
+                try:
+                    conn = self._idle.get(timeout=self.timeout)
+                except queue.Empty:
+                    with self._lock:
+                        self._timeouts += 1
+                    raise PoolTimeout(f"No database connection free after {self.timeout}s")
+                with self._lock:
+                    self._waits += 1
+                    self._wait_seconds += time.perf_counter() - started
+        with self._lock:
+            self._checkouts += 1
+        return conn
+
+    def release(self, conn: sqlite3.Connection):
+        """Return a connection to the pool."""
+        if conn.in_transaction:
+            conn.rollback()
+        self._idle.put(conn)
+
+    @contextmanager
+    def connection(self):
+        """Borrow a connection for the duration of a `with` block."""
+        conn = self.acquire()
+        try:
+            yield conn
         finally:
+            self.release(conn)
+
+    def close(self):
+        """Close every idle connection."""
+        while True:
+            try:
+                conn = self._idle.get_nowait()
+            except queue.Empty:
+                break
             conn.close()
-    else:
-        logger.warning("Database file not found! Creating empty schema...")
-        DATABASE_PATH.parent.mkdir(parents=True, exist_ok=True)
+            with self._lock:
+                self._created -= 1
+
+    def stats(self) -> dict:
+        """Pool health and usage counters."""
+        with self._lock:
+            idle = self._idle.qsize()
+            return {
+                "path": str(self.path) if self.path else None,
+                "size": self.size,
+                "open": self._created,
+                "idle": idle,
+                "in_use": self._created - idle,
+                "checkouts": self._checkouts,
+                "waits": self._waits,
+                "avg_wait_ms": round(self._wait_seconds / self._waits * 1000, 3) if self._waits else 0.0,
+                "timeouts": self._timeouts,
+                "mmap_size": MMAP_SIZE,
+                "cache_size_kb": CACHE_SIZE_KB,
+            }
+
+
+class Database:
+    """
+    Awaitable query API that runs SQLite work off the asyncio event loop.
+
+    Queries execute on a dedicated thread pool where each thread owns one
+    pooled read-only connection. A semaphore caps concurrent DB work, and
+    bulk jobs (offline exports) additionally pass through a smaller one so
+    they can never hold every worker at once.
+    """
+
+    def __init__(self, pool: ConnectionPool, max_concurrency: int = MAX_CONCURRENCY,
+                 bulk_concurrency: int = BULK_CONCURRENCY):
+        self.pool = pool
+        self.max_concurrency = max_concurrency
+        self.bulk_concurrency = min(bulk_concurrency, max_concurrency)
+        self.workers = 0
+        self._executor = None
+        self._slots = None
+        self._bulk_slots = None
+        self._active = 0
+        self._bulk_active = 0
+        self._local = threading.local()
+        self._thread_conns = []
+        self._lock = threading.Lock()
+        self._data_version = None
+        self._data_version_checked = 0.0
+
+    def start(self):
+        """Create the worker threads and concurrency limits (call from the running loop)."""
+        self.stop()
+        self._data_version = None
+        self.workers = min(self.max_concurrency, self.pool.size)
+        self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="sqlite")
+        self._slots = asyncio.Semaphore(self.workers)
+        self._bulk_slots = asyncio.Semaphore(self.bulk_concurrency)
+
+    def stop(self):
+        """Shut down worker threads and hand their connections back to the pool."""
+        if self._executor is None:
+            return
+        self._executor.shutdown(wait=True)
+        self._executor = None
+        self.workers = 0
+        self._local = threading.local()
+        with self._lock:
+            conns, self._thread_conns = self._thread_conns, []
+        for conn in conns:
+            self.pool.release(conn)
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._local.conn = self.pool.acquire()
+            with self._lock:
+                self._thread_conns.append(conn)
+        return conn
+
+    def _call(self, fn, args):
+        conn = self._connection()
+        try:
+            if metrics.METRICS_ENABLED:
+                return fn(metrics.ProfiledConnection(conn), *args)
+            return fn(conn, *args)
+        finally:
+            if conn.in_transaction:
+                conn.rollback()
+
+    async def run(self, fn, *args, bulk: bool = False):
+        """Run `fn(conn, *args)` on a DB worker thread and await its result."""
+        if self._executor is None:
+            raise RuntimeError("Database executor has not been started")
+        if bulk:
+            async with self._bulk_slots:
+                self._bulk_active += 1
+                try:
+                    return await self._submit(fn, args)
+                finally:
+                    self._bulk_active -= 1
+        return await self._submit(fn, args)
+
+    async def _submit(self, fn, args):
+        async with self._slots:
+            self._active += 1
+            try:
+                loop = asyncio.get_running_loop()
+                if metrics.METRICS_ENABLED:
+                    # Carry the request context so SQL stats land on the right route
+                    context = contextvars.copy_context()
+                    return await loop.run_in_executor(self._executor, context.run, self._call, fn, args)
+                return await loop.run_in_executor(self._executor, self._call, fn, args)
+            finally:
+                self._active -= 1
+
+    async def stream(self, fn, *args, bulk: bool = False, buffer: int = 8,
+                     stall_timeout: float = STREAM_STALL_TIMEOUT):
+        """
+        Run `fn(conn, emit, *args)` on a DB worker thread and yield every item
+        it passes to `emit` as soon as it is produced.
+
+        At most `buffer` items are held at once: the worker waits while the
+        consumer catches up, and `emit` raises StreamClosed if the consumer
+        stops early, so a disconnected client releases the worker. A consumer
+        that stays connected but takes no item for `stall_timeout` seconds is
+        treated the same way, and raises StreamClosed once it reads again.
+        """
+        loop = asyncio.get_running_loop()
+        items = asyncio.Queue(buffer)
+        closed = threading.Event()
+        done = object()
+
+        def put(item):
+            future = asyncio.run_coroutine_threadsafe(items.put(item), loop)
+            deadline = time.monotonic() + stall_timeout
+            while True:
+                try:
+                    return future.result(timeout=min(1, stall_timeout))
+                except FutureTimeoutError:
+                    if closed.is_set() or time.monotonic() >= deadline:
+                        future.cancel()
+                        raise StreamClosed()
+
+        def emit(item):
+            if closed.is_set():
+                raise StreamClosed()
+            put(item)
+
+        def produce(conn):
+            try:
+                try:
+                    fn(conn, emit, *args)
+                except StreamClosed:
+                    raise
+                except Exception as e:
+                    put(e)
+                else:
+                    put(done)
+            except StreamClosed:
+                pass
+
+        producer = asyncio.ensure_future(self.run(produce, bulk=bulk))
+        try:
+            while True:
+                if items.empty() and producer.done():
+                    # The producer gave up on a stalled consumer (or never started)
+                    producer.result()
+                    raise StreamClosed("Stream abandoned after the consumer stalled")
+                item = await items.get()
+                if item is done:
+                    break
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            closed.set()
+            while not items.empty():
+                items.get_nowait()
+            await producer
+
+    async def data_version(self) -> str:
+        """Current data version stamp, re-read at most every DATA_VERSION_TTL seconds."""
+        now = time.monotonic()
+        if self._data_version is None or now - self._data_version_checked >= DATA_VERSION_TTL:
+            self._data_version = await self.run(read_data_version, self.pool.path)
+            self._data_version_checked = now
+        return self._data_version
+
+    async def fetch_all(self, sql: str, params=(), bulk: bool = False) -> list:
+        """Execute a query and return all rows."""
+        return await self.run(_fetch_all, sql, params, bulk=bulk)
+
+    async def fetch_one(self, sql: str, params=(), bulk: bool = False):
+        """Execute a query and return the first row (or None)."""
+        return await self.run(_fetch_one, sql, params, bulk=bulk)
+
+    async def fetch_dicts(self, sql: str, params=(), bulk: bool = False) -> list:
+        """Execute a query and return all rows as plain dicts, ready to encode as JSON."""
+        return await self.run(_fetch_dicts, sql, params, bulk=bulk)
+
+    def stats(self) -> dict:
+        """Executor configuration and current load."""
+        return {
+            "workers": self.workers,
+            "bulk_concurrency": self.bulk_concurrency,
+            "active": self._active,
+            "bulk_active": self._bulk_active,
+        }
+
+
+def _fetch_all(conn: sqlite3.Connection, sql: str, params) -> list:
+    return conn.execute(sql, params).fetchall()
+
+
+def _fetch_one(conn: sqlite3.Connection, sql: str, params):
+    return conn.execute(sql, params).fetchone()
+
+
+def _fetch_dicts(conn: sqlite3.Connection, sql: str, params) -> list:
+    cursor = conn.execute(sql, params)
+    # Plain tuples zipped with column names captured once, rather than a
+    # sqlite3.Row per row that is then copied into a dict
+    cursor.row_factory = None
+    names = [column[0] for column in cursor.description]
+    return [dict(zip(names, row)) for row in cursor.fetchall()]
+
+
+db_pool = ConnectionPool()
+db = Database(db_pool)
+
+
+def stamp_data_version(conn: sqlite3.Connection, version: str = None) -> str:
+    """
+    Record a new data version stamp in the `meta` table.
+
+    Call after importing or rewriting content so caches keyed on the data
+    version (chapter cache, ETags) are invalidated.
+    """
+    if version is None:
+        version = time.strftime("%Y%m%d%H%M%S", time.gmtime())
+    conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL)")
+    conn.execute(
+        "INSERT OR REPLACE INTO meta (key, value) VALUES ('data_version', ?)", (version,)
+    )
+    conn.commit()
+    return version
+
+
+def read_data_version(conn: sqlite3.Connection, path: Path = None) -> str:
+    """
+    Read the data version stamp, falling back to the DB file's size and mtime
+    when no stamp has been recorded (so un-stamped imports still invalidate).
+    """
+    try:
+        row = conn.execute("SELECT value FROM meta WHERE key = 'data_version'").fetchone()
+        if row:
+            return row[0]
+    except sqlite3.OperationalError:
+        pass
+    stat = Path(path or DATABASE_PATH).stat()
+    return f"file-{stat.st_size}-{stat.st_mtime_ns}"
+
+
+def init_db() -> int:
+    """
+    Create the schema for a new database, or check an existing database's
+    schema version. Only reads `PRAGMA user_version`, so startup cost does not
+    grow with the data; migrations are applied with scripts/migrate.py.
+    Returns the schema version.
+    """
+    logger.info(f"Database path: {DATABASE_PATH}")
+
+    if DATABASE_PATH.exists():
         conn = get_db_connection()
         try:
-            conn.executescript(SCHEMA)
-            conn.commit()
+            version = schema_version(conn)
+            if version < SCHEMA_VERSION:
+                pending = ", ".join(pending_migrations(conn))
+                logger.warning(
+                    f"Database schema version {version} is behind {SCHEMA_VERSION} "
+                    f"(pending: {pending}); run `python scripts/migrate.py`"
+                )
+            return version
         finally:
             conn.close()
 
+    logger.warning("Database file not found! Creating empty schema...")
+    DATABASE_PATH.parent.mkdir(parents=True, exist_ok=True)
+    conn = get_db_connection()
+    try:
+        conn.executescript(SCHEMA)
+        refresh_verse_search(conn)
+        refresh_search_vocabulary(conn)
+        conn.commit()
+        # Tables created from SCHEMA already have every migration's columns
+        set_schema_version(conn, SCHEMA_VERSION)
+    finally:
+        conn.close()
+    return SCHEMA_VERSION
+
+
+# Tables the import scripts (re)create are defined here too, so a fresh import
+# gets the same verse keys, triggers and indexes as SCHEMA and the migrations
+
+# Original-language words with glosses (scripts/import_stepbible_alignment.py)
+WORD_ALIGNMENTS_SCHEMA = """
+CREATE TABLE IF NOT EXISTS word_alignments (
+    id INTEGER PRIMARY KEY,
+    book TEXT NOT NULL,
+    chapter INTEGER NOT NULL,
+    verse INTEGER NOT NULL,
+    word_position INTEGER NOT NULL,  -- Position in Hebrew text (1-based)
+    hebrew_text TEXT,                -- Original Hebrew with prefixes
+    transliteration TEXT,
+    english_gloss TEXT,              -- English translation/gloss
+    strong_number TEXT,              -- Primary Strong's number (e.g., H0430)
+    strong_canonical TEXT,           -- Same number as keyed in lexicon (e.g., H430)
+    grammar TEXT,                    -- Morphology code
+    verse_key INTEGER,               -- BBCCCVVV of book/chapter/verse
+    UNIQUE(book, chapter, verse, word_position)
+);
 
-def _migrate_commentary_links(conn):
-    """Add clickable Bible reference links to commentary (one-time migration)."""
-    # Check if already migrated by looking for existing links
-    cursor = conn.execute(
-        "SELECT content FROM commentary_entries WHERE content LIKE '%commentary-ref%' LIMIT 1"
-    )
-    if cursor.fetchone():
-        logger.info("Commentary links already present, skipping migration")
-        return
-
-    # Check if there's any commentary to process
-    cursor = conn.execute("SELECT COUNT(*) FROM commentary_entries")
-    count = cursor.fetchone()[0]
-    if count == 0:
-        logger.info("No commentary entries to process")
-        return
-
-    logger.info(f"Migrating commentary links for {count} entries...")
-
-    # Book abbreviation mappings
-    BOOK_ABBREVS = {
-        # Old Testament
-        'Gen': 'Genesis', 'Ge': 'Genesis', 'Exod': 'Exodus', 'Exo': 'Exodus', 'Ex': 'Exodus',
-        'Lev': 'Leviticus', 'Le': 'Leviticus',
-        'Num': 'Numbers', 'Nu': 'Numbers', 'Deut': 'Deuteronomy', 'Deu': 'Deuteronomy', 'De': 'Deuteronomy',
-        'Josh': 'Joshua', 'Jos': 'Joshua', 'Judg': 'Judges', 'Jdg': 'Judges',
-        'Rth': 'Ruth', 'Ru': 'Ruth',
-        '1Sam': '1 Samuel', '1Sa': '1 Samuel', 'Sa1': '1 Samuel',
-        '2Sam': '2 Samuel', '2Sa': '2 Samuel', 'Sa2': '2 Samuel',
-        '1Kgs': '1 Kings', '1Ki': '1 Kings', 'Kg1': '1 Kings', '1Kg': '1 Kings',
-        '2Kgs': '2 Kings', '2Ki': '2 Kings', 'Kg2': '2 Kings', '2Kg': '2 Kings',
-        '1Chr': '1 Chronicles', '1Ch': '1 Chronicles', 'Ch1': '1 Chronicles',
-        '2Chr': '2 Chronicles', '2Ch': '2 Chronicles', 'Ch2': '2 Chronicles',
-        'Ezr': 'Ezra', 'Ne': 'Nehemiah',
-        'Esth': 'Esther', 'Est': 'Esther', 'Es': 'Esther',
-        'Psa': 'Psalms', 'Ps': 'Psalms',
-        'Prov': 'Proverbs', 'Pro': 'Proverbs', 'Pr': 'Proverbs',
-        'Eccl': 'Ecclesiastes', 'Ecc': 'Ecclesiastes', 'Ec': 'Ecclesiastes',
-        'Song': 'Song of Solomon', 'Sol': 'Song of Solomon', 'So': 'Song of Solomon', 'Ca': 'Song of Solomon',
-        'Isa': 'Isaiah', 'Is': 'Isaiah', 'Je': 'Jeremiah',
-        'Lam': 'Lamentations', 'La': 'Lamentations',
-        'Ezek': 'Ezekiel', 'Eze': 'Ezekiel', 'Da': 'Daniel',
-        'Ho': 'Hosea', 'Joe': 'Joel',
-        'Am': 'Amos', 'Obad': 'Obadiah', 'Oba': 'Obadiah', 'Ob': 'Obadiah',
-        'Jon': 'Jonah', 'Mi': 'Micah',
-        'Na': 'Nahum',
-        'Zeph': 'Zephaniah', 'Zep': 'Zephaniah',
-        'Zech': 'Zechariah', 'Zec': 'Zechariah', 'Zac': 'Zechariah',
-        # Full names
-        'Genesis': 'Genesis', 'Exodus': 'Exodus', 'Leviticus': 'Leviticus', 'Numbers': 'Numbers',
-        'Deuteronomy': 'Deuteronomy', 'Joshua': 'Joshua', 'Judges': 'Judges', 'Ruth': 'Ruth',
-        'Ezra': 'Ezra', 'Nehemiah': 'Nehemiah', 'Esther': 'Esther', 'Job': 'Job',
-        'Psalms': 'Psalms', 'Proverbs': 'Proverbs', 'Ecclesiastes': 'Ecclesiastes',
-        'Isaiah': 'Isaiah', 'Jeremiah': 'Jeremiah', 'Lamentations': 'Lamentations',
-        'Ezekiel': 'Ezekiel', 'Daniel': 'Daniel', 'Hosea': 'Hosea', 'Joel': 'Joel',
-        'Amos': 'Amos', 'Obadiah': 'Obadiah', 'Jonah': 'Jonah', 'Micah': 'Micah',
-        'Nahum': 'Nahum', 'Habakkuk': 'Habakkuk', 'Hab': 'Habakkuk',
-        'Zephaniah': 'Zephaniah', 'Haggai': 'Haggai', 'Hag': 'Haggai',
-        'Zechariah': 'Zechariah', 'Malachi': 'Malachi', 'Mal': 'Malachi',
-        # New Testament
-        'Mat': 'Matthew', 'Matt': 'Matthew', 'Mt': 'Matthew',
-        'Mar': 'Mark', 'Mk': 'Mark', 'Lk': 'Luke', 'Lu': 'Luke',
-        'Joh': 'John', 'Jn': 'John', 'Act': 'Acts', 'Ac': 'Acts',
-        'Rom': 'Romans', 'Ro': 'Romans',
-        '1Cor': '1 Corinthians', '1Co': '1 Corinthians', 'Co1': '1 Corinthians',
-        '2Cor': '2 Corinthians', '2Co': '2 Corinthians', 'Co2': '2 Corinthians',
-        'Gal': 'Galatians', 'Ga': 'Galatians',
-        'Eph': 'Ephesians', 'Phil': 'Philippians', 'Php': 'Philippians',
-        'Col': 'Colossians',
-        '1Thes': '1 Thessalonians', '1Th': '1 Thessalonians', 'Th1': '1 Thessalonians',
-        '2Thes': '2 Thessalonians', '2Th': '2 Thessalonians', 'Th2': '2 Thessalonians',
-        '1Tim': '1 Timothy', '1Ti': '1 Timothy', 'Ti1': '1 Timothy',
-        '2Tim': '2 Timothy', '2Ti': '2 Timothy', 'Ti2': '2 Timothy',
-        'Tit': 'Titus', 'Phm': 'Philemon', 'Philem': 'Philemon',
-        'Jam': 'James', 'Jas': 'James',
-        '1Pet': '1 Peter', '1Pe': '1 Peter', 'Pe1': '1 Peter',
-        '2Pet': '2 Peter', '2Pe': '2 Peter', 'Pe2': '2 Peter',
-        '1Joh': '1 John', '1Jn': '1 John', 'Jo1': '1 John',
-        '2Joh': '2 John', '2Jn': '2 John', 'Jo2': '2 John',
-        '3Joh': '3 John', '3Jn': '3 John', 'Jo3': '3 John',
-        'Jud': 'Jude',
-        'Rev': 'Revelation', 'Re': 'Revelation',
-        'Matthew': 'Matthew', 'Mark': 'Mark', 'Luke': 'Luke', 'John': 'John', 'Acts': 'Acts',
-        'Romans': 'Romans', 'Galatians': 'Galatians', 'Ephesians': 'Ephesians',
-        'Philippians': 'Philippians', 'Colossians': 'Colossians',
-        'Titus': 'Titus', 'Hebrews': 'Hebrews', 'Heb': 'Hebrews',
-        'James': 'James', 'Jude': 'Jude', 'Revelation': 'Revelation',
-        'Peter': '1 Peter', 'Luk': 'Luke',
-    }
-
-    abbrev_pattern = '|'.join(re.escape(k) for k in sorted(BOOK_ABBREVS.keys(), key=len, reverse=True))
-    REF_PATTERN = re.compile(rf'\b({abbrev_pattern})\s+(\d+):(\d+)(?:-(\d+))?\b', re.IGNORECASE)
-
-    def normalize_book(abbrev):
-        if abbrev in BOOK_ABBREVS:
-            return BOOK_ABBREVS[abbrev]
-        for key, val in BOOK_ABBREVS.items():
-            if key.lower() == abbrev.lower():
-                return val
-        return None
-
-    def add_links(content):
-        def replace_ref(match):
-            abbrev, chapter, verse_start, verse_end = match.groups()
-            book = normalize_book(abbrev)
-            if not book:
-                return match.group(0)
-            if verse_end:
-                ref = f"{book} {chapter}:{verse_start}-{verse_end}"
-                display = f"{abbrev} {chapter}:{verse_start}-{verse_end}"
-            else:
-                ref = f"{book} {chapter}:{verse_start}"
-                display = f"{abbrev} {chapter}:{verse_start}"
-            return f'<a href="#" class="commentary-ref" data-ref="{ref}">{display}</a>'
-        return REF_PATTERN.sub(replace_ref, content)
-
-    # Process all entries
-    cursor = conn.execute("SELECT id, content FROM commentary_entries")
-    entries = cursor.fetchall()
-    updated = 0
-
-    for entry in entries:
-        entry_id, content = entry['id'], entry['content']
-        if not content:
-            continue
-        new_content = add_links(content)
-        if new_content != content:
-            conn.execute("UPDATE commentary_entries SET content = ? WHERE id = ?", (new_content, entry_id))
-            updated += 1
+CREATE INDEX IF NOT EXISTS idx_alignment_key ON word_alignments(verse_key, word_position);
+CREATE INDEX IF NOT EXISTS idx_alignment_strong_canonical ON word_alignments(strong_canonical);
 
-    conn.commit()
-    logger.info(f"Commentary links migration complete: updated {updated} entries")
+CREATE TRIGGER IF NOT EXISTS word_alignments_key_ai AFTER INSERT ON word_alignments
+WHEN new.verse_key IS NULL BEGIN
+    UPDATE word_alignments SET
+        verse_key = (SELECT book_order FROM books WHERE name = book) * 1000000 + chapter * 1000 + verse
+    WHERE rowid = new.rowid;
+END;
+"""
+
+# English words mapped to original-language words (scripts/build_english_alignments.py)
+ENGLISH_WORD_ALIGNMENTS_SCHEMA = """
+CREATE TABLE IF NOT EXISTS english_word_alignments (
+    id INTEGER PRIMARY KEY,
+    translation_id TEXT NOT NULL,     -- KJV, WEB, etc.
+    book TEXT NOT NULL,
+    chapter INTEGER NOT NULL,
+    verse INTEGER NOT NULL,
+    english_word_position INTEGER NOT NULL,  -- 1-based position in English text
+    english_word TEXT NOT NULL,              -- The actual English word
+    original_word_position INTEGER NOT NULL, -- Position in Hebrew/Greek (word_alignments)
+    confidence REAL DEFAULT 1.0,             -- Match confidence (1.0 = exact, <1.0 = inferred)
+    verse_key INTEGER,                       -- BBCCCVVV of book/chapter/verse
+    UNIQUE(translation_id, book, chapter, verse, english_word_position)
+);
+
+CREATE INDEX IF NOT EXISTS idx_eng_align_key
+ON english_word_alignments(translation_id, verse_key, english_word_position);
+
+CREATE TRIGGER IF NOT EXISTS english_word_alignments_key_ai AFTER INSERT ON english_word_alignments
+WHEN new.verse_key IS NULL BEGIN
+    UPDATE english_word_alignments SET
+        verse_key = (SELECT book_order FROM books WHERE name = book) * 1000000 + chapter * 1000 + verse
+    WHERE rowid = new.rowid;
+END;
+"""
 
+# Verses with divine speech for red-letter display (scripts/import_speakers.py)
+SPEAKER_VERSES_SCHEMA = """
+CREATE TABLE IF NOT EXISTS speaker_verses (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    book TEXT NOT NULL,
+    chapter INTEGER NOT NULL,
+    verse INTEGER NOT NULL,
+    speaker TEXT NOT NULL,
+    is_divine BOOLEAN DEFAULT 0,
+    verse_key INTEGER,  -- BBCCCVVV of book/chapter/verse
+    UNIQUE(book, chapter, verse, speaker)
+);
+
+CREATE INDEX IF NOT EXISTS idx_speaker_verses_key ON speaker_verses(verse_key, is_divine);
+
+CREATE TRIGGER IF NOT EXISTS speaker_verses_key_ai AFTER INSERT ON speaker_verses
+WHEN new.verse_key IS NULL BEGIN
+    UPDATE speaker_verses SET
+        verse_key = (SELECT book_order FROM books WHERE name = book) * 1000000 + chapter * 1000 + verse
+    WHERE rowid = new.rowid;
+END;
+"""
 
 SCHEMA = """
+-- Key/value metadata (data version stamp, schema version)
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+
 -- Translations table
 CREATE TABLE IF NOT EXISTS translations (
     id TEXT PRIMARY KEY,
@@ -212,41 +584,23 @@ CREATE TABLE IF NOT EXISTS verses (
     chapter INTEGER NOT NULL,
     verse INTEGER NOT NULL,
     text TEXT NOT NULL,
+    verse_key INTEGER,  -- BBCCCVVV: book_order * 1000000 + chapter * 1000 + verse
     FOREIGN KEY (translation_id) REFERENCES translations(id),
     UNIQUE (translation_id, book, chapter, verse)
 );
 
--- Create index for verse lookups
-CREATE INDEX IF NOT EXISTS idx_verses_lookup
-ON verses(book, chapter, verse, translation_id);
+-- Verse lookups are integer range scans on the canonical key
+CREATE INDEX IF NOT EXISTS idx_verses_key
+ON verses(translation_id, verse_key);
 
--- Full-text search for verses
-CREATE VIRTUAL TABLE IF NOT EXISTS verses_fts USING fts5(
-    text,
-    book,
-    chapter,
-    verse,
-    content='verses',
-    content_rowid='id'
-);
-
--- Triggers to keep FTS in sync
-CREATE TRIGGER IF NOT EXISTS verses_ai AFTER INSERT ON verses BEGIN
-    INSERT INTO verses_fts(rowid, text, book, chapter, verse)
-    VALUES (new.id, new.text, new.book, new.chapter, new.verse);
+CREATE TRIGGER IF NOT EXISTS verses_key_ai AFTER INSERT ON verses
+WHEN new.verse_key IS NULL BEGIN
+    UPDATE verses SET verse_key = book_order * 1000000 + chapter * 1000 + verse
+    WHERE rowid = new.rowid;
 END;
 
-CREATE TRIGGER IF NOT EXISTS verses_ad AFTER DELETE ON verses BEGIN
-    INSERT INTO verses_fts(verses_fts, rowid, text, book, chapter, verse)
-    VALUES ('delete', old.id, old.text, old.book, old.chapter, old.verse);
-END;
-
-CREATE TRIGGER IF NOT EXISTS verses_au AFTER UPDATE ON verses BEGIN
-    INSERT INTO verses_fts(verses_fts, rowid, text, book, chapter, verse)
-    VALUES ('delete', old.id, old.text, old.book, old.chapter, old.verse);
-    INSERT INTO verses_fts(rowid, text, book, chapter, verse)
-    VALUES (new.id, new.text, new.book, new.chapter, new.verse);
-END;
+-- Verse full-text search indexes are per translation (verses_fts_<id>),
+-- created by backend.migrations.refresh_verse_search
 
 -- Lexicon (Strong's definitions)
 CREATE TABLE IF NOT EXISTS lexicon (
@@ -269,12 +623,54 @@ CREATE TABLE IF NOT EXISTS words (
     strong_number TEXT,
     parsing TEXT,
     translation TEXT,
+    verse_key INTEGER,  -- key of verse_id's verse, for paging occurrences in canonical order
     FOREIGN KEY (verse_id) REFERENCES verses(id),
     FOREIGN KEY (strong_number) REFERENCES lexicon(strong_number)
 );
 
 CREATE INDEX IF NOT EXISTS idx_words_verse ON words(verse_id);
-CREATE INDEX IF NOT EXISTS idx_words_strong ON words(strong_number);
+CREATE INDEX IF NOT EXISTS idx_words_strong_key ON words(strong_number, verse_key, position);
+
+CREATE TRIGGER IF NOT EXISTS words_key_ai AFTER INSERT ON words
+WHEN new.verse_key IS NULL BEGIN
+    UPDATE words SET verse_key = (SELECT verse_key FROM verses WHERE id = new.verse_id)
+    WHERE rowid = new.rowid;
+END;
+
+-- Occurrences of each Strong's number per book (rebuilt by scripts/build_concordance.py)
+CREATE TABLE IF NOT EXISTS word_book_counts (
+    strong_number TEXT NOT NULL,
+    book_order INTEGER NOT NULL,
+    count INTEGER NOT NULL,
+    PRIMARY KEY (strong_number, book_order)
+) WITHOUT ROWID;
+
+-- Concordance: totals per Strong's number (rebuilt by scripts/build_concordance.py)
+CREATE TABLE IF NOT EXISTS word_stats (
+    strong_number TEXT PRIMARY KEY,
+    occurrences INTEGER NOT NULL,
+    verses INTEGER NOT NULL,
+    books INTEGER NOT NULL,
+    frequency_rank INTEGER NOT NULL  -- 1 = most frequent word of its language
+) WITHOUT ROWID;
+
+-- How each word is rendered in each aligned translation, most frequent first
+CREATE TABLE IF NOT EXISTS word_renderings (
+    strong_number TEXT NOT NULL,
+    translation_id TEXT NOT NULL,
+    rank INTEGER NOT NULL,
+    rendering TEXT NOT NULL,
+    count INTEGER NOT NULL,
+    PRIMARY KEY (strong_number, translation_id, rank)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS word_rendering_totals (
+    strong_number TEXT NOT NULL,
+    translation_id TEXT NOT NULL,
+    aligned INTEGER NOT NULL,     -- aligned occurrences
+    renderings INTEGER NOT NULL,  -- distinct renderings
+    PRIMARY KEY (strong_number, translation_id)
+) WITHOUT ROWID;
 
 -- Commentary entries
 CREATE TABLE IF NOT EXISTS commentary_entries (
@@ -285,11 +681,23 @@ CREATE TABLE IF NOT EXISTS commentary_entries (
     reference_start INTEGER NOT NULL DEFAULT 1,
     reference_end INTEGER,
     content TEXT NOT NULL,
-    searchable_text TEXT
+    searchable_text TEXT,
+    start_key INTEGER,  -- verse keys of reference_start / reference_end
+    end_key INTEGER
 );
 
-CREATE INDEX IF NOT EXISTS idx_commentary_lookup
-ON commentary_entries(book, chapter, reference_start, reference_end);
+CREATE INDEX IF NOT EXISTS idx_commentary_key
+ON commentary_entries(start_key, end_key);
+
+CREATE TRIGGER IF NOT EXISTS commentary_entries_key_ai AFTER INSERT ON commentary_entries
+WHEN new.start_key IS NULL BEGIN
+    UPDATE commentary_entries SET
+        start_key = (SELECT book_order FROM books WHERE name = book) * 1000000
+                    + chapter * 1000 + reference_start,
+        end_key = (SELECT book_order FROM books WHERE name = book) * 1000000
+                  + chapter * 1000 + reference_end
+    WHERE rowid = new.rowid;
+END;
 
 -- Full-text search for commentary
 CREATE VIRTUAL TABLE IF NOT EXISTS commentary_fts USING fts5(
@@ -322,11 +730,27 @@ CREATE TABLE IF NOT EXISTS cross_references (
     target_chapter INTEGER NOT NULL,
     target_verse INTEGER NOT NULL,
     target_book_order INTEGER NOT NULL,
-    relationship_type TEXT
+    relationship_type TEXT,
+    votes INTEGER,  -- OpenBible.info helpfulness votes
+    source_key INTEGER,  -- verse keys of the source and target verses
+    target_key INTEGER
 );
 
-CREATE INDEX IF NOT EXISTS idx_crossref_source
-ON cross_references(source_book, source_chapter, source_verse);
+CREATE INDEX IF NOT EXISTS idx_crossref_key
+ON cross_references(source_key, target_key, relationship_type);
+
+CREATE INDEX IF NOT EXISTS idx_crossref_votes
+ON cross_references(source_key, votes DESC, target_key, relationship_type);
+
+CREATE TRIGGER IF NOT EXISTS cross_references_key_ai AFTER INSERT ON cross_references
+WHEN new.source_key IS NULL BEGIN
+    UPDATE cross_references SET
+        source_key = (SELECT book_order FROM books WHERE name = source_book) * 1000000
+                     + source_chapter * 1000 + source_verse,
+        target_key = (SELECT book_order FROM books WHERE name = target_book) * 1000000
+                     + target_chapter * 1000 + target_verse
+    WHERE rowid = new.rowid;
+END;
 
 -- Devotionals
 CREATE TABLE IF NOT EXISTS devotionals (
@@ -430,4 +854,4 @@ INSERT OR IGNORE INTO books (id, name, abbreviation, testament, book_order) VALU
     (64, '3 John', '3John', 'NT', 64),
     (65, 'Jude', 'Jude', 'NT', 65),
     (66, 'Revelation', 'Rev', 'NT', 66);
-"""
+""" + WORD_ALIGNMENTS_SCHEMA + ENGLISH_WORD_ALIGNMENTS_SCHEMA + SPEAKER_VERSES_SCHEMA
@@ -0,0 +1,159 @@
+"""
+Fuzzy search support for BibleMVP.
+
+Misspelled and partial words are looked up in a precomputed vocabulary of
+every term in the verse and commentary indexes (search_vocabulary, built by
+backend.migrations.refresh_search_vocabulary) through an FTS5 trigram index,
+and ranked by trigram similarity. The search itself then runs on the regular
+indexes with each word replaced by its closest terms, so a trigram index over
+the verse text is never needed. Lexicon transliterations are indexed the same
+way (lexicon_trigram).
+"""
+import re
+import unicodedata
+from typing import Optional
+
+FUZZY_MIN_SIMILARITY = 0.3
+FUZZY_RELATIVE_SIMILARITY = 0.7   # expansions must be this close to the best match
+FUZZY_EXPANSIONS = 6      # vocabulary terms searched for each query word
+FUZZY_CANDIDATES = 200    # trigram matches scored per query word
+FUZZY_MIN_LENGTH = 3      # shorter words are only prefix-matched
+
+WORD_PATTERN = re.compile(r"\w+")
+
+
+def fold(text: str) -> str:
+    """Lower case without diacritics, as the FTS5 unicode61 tokenizer indexes it."""
+    decomposed = unicodedata.normalize("NFKD", text.lower())
+    return "".join(c for c in decomposed if not unicodedata.combining(c))
+
+
+def trigrams(word: str) -> set:
+    """Trigrams of a word padded like pg_trgm ("  w", " wo", ..., "d ")."""
+    padded = f"  {word} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def similarity(a: str, b: str) -> float:
+    """Trigram similarity of two words: shared trigrams over all trigrams (0..1)."""
+    ta, tb = trigrams(a), trigrams(b)
+    return len(ta & tb) / len(ta | tb)
+
+
+def _trigram_match(word: str) -> str:
+    """FTS5 query matching terms that share any trigram with `word`."""
+    return " OR ".join(f'"{word[i:i + 3]}"' for i in range(len(word) - 2))
+
+
+def _score(word: str, rows) -> list:
+    """[(term, similarity, *rest)] for candidate rows (term, *rest), best first."""
+    scored = {}
+    for row in rows:
+        row = tuple(row)
+        score = similarity(word, row[0])
+        if word in row[0]:
+            # Partial words ("chadnez") are always worth offering
+            score = max(score, FUZZY_MIN_SIMILARITY)
+        if score >= FUZZY_MIN_SIMILARITY:
+            scored[row] = round(score, 3)
+    return sorted(((row[0], score, *row[1:]) for row, score in scored.items()),
+                  key=lambda item: (-item[1], item[0]))
+
+
+def similar_terms(conn, word: str, limit: int = FUZZY_EXPANSIONS) -> list:
+    """
+    Vocabulary terms closest to `word` as [(term, similarity, documents)],
+    from the best trigram matches plus the terms containing the word.
+    """
+    if len(word) < FUZZY_MIN_LENGTH:
+        return []
+    rows = conn.execute("""
+        SELECT term, documents FROM search_vocabulary
+        WHERE search_vocabulary MATCH ?
+        ORDER BY rank
+        LIMIT ?
+    """, (_trigram_match(word), FUZZY_CANDIDATES)).fetchall()
+    rows += conn.execute("""
+        SELECT term, documents FROM search_vocabulary
+        WHERE search_vocabulary MATCH ?
+        ORDER BY documents DESC
+        LIMIT ?
+    """, (f'"{word}"', FUZZY_CANDIDATES)).fetchall()
+    ranked = _score(word, rows)
+    if not ranked:
+        return []
+    # Only terms nearly as close as the best one: a correctly spelled word
+    # keeps to itself, a misspelled one to its likely corrections. Equally
+    # similar terms: the word itself, then the more common first
+    cutoff = ranked[0][1] * FUZZY_RELATIVE_SIMILARITY
+    ranked = [item for item in ranked if item[1] >= cutoff]
+    ranked.sort(key=lambda item: (item[0] != word, -item[1], -item[2], item[0]))
+    return ranked[:limit]
+
+
+def expand_query(conn, q: str) -> dict:
+    """{query word: [closest vocabulary terms]} for every word of `q`, in order."""
+    expansions = {}
+    for word in WORD_PATTERN.findall(fold(q)):
+        if word not in expansions:
+            expansions[word] = [term for term, _, _ in similar_terms(conn, word)]
+    return expansions
+
+
+def fuzzy_fts_query(expansions: dict) -> str:
+    """
+    FTS5 query requiring, for each word, any of its expansions. Words too
+    short to expand (or with no close terms) are prefix-matched as typed.
+    """
+    groups = []
+    for word, terms in expansions.items():
+        if terms:
+            groups.append("(" + " OR ".join(f'"{term}"' for term in terms) + ")")
+        else:
+            groups.append(f'"{word}"*')
+    return " AND ".join(groups)
+
+
+def did_you_mean(expansions: dict) -> Optional[str]:
+    """The query with each word replaced by its closest term, if that changes anything."""
+    suggestion = [terms[0] if terms else word for word, terms in expansions.items()]
+    if suggestion == list(expansions):
+        return None
+    return " ".join(suggestion)
+
+
+def suggest_query(conn, q: str) -> Optional[str]:
+    """A "did you mean" spelling for a query, or None if every word is already a term."""
+    return did_you_mean(expand_query(conn, q))
+
+
+def similar_lexicon_words(conn, word: str, limit: int = 5) -> list:
+    """Lexicon entries whose transliteration is closest to `word`."""
+    word = fold(word)
+    if len(word) < FUZZY_MIN_LENGTH:
+        return []
+    rows = conn.execute("""
+        SELECT transliteration, strong_number FROM lexicon_trigram
+        WHERE lexicon_trigram MATCH ?
+        ORDER BY rank
+        LIMIT ?
+    """, (_trigram_match(word), FUZZY_CANDIDATES)).fetchall()
+    best = {}
+    for transliteration, score, strong_number in _score(word, rows):
+        best.setdefault(strong_number, score)
+        if len(best) == limit:
+            break
+    if not best:
+        return []
+    cursor = conn.execute(f"""
+        SELECT strong_number, original, transliteration, definition
+        FROM lexicon
+        WHERE strong_number IN ({','.join('?' * len(best))})
+    """, tuple(best))
+    cursor.row_factory = None
+    names = [column[0] for column in cursor.description]
+    entries = [dict(zip(names, row)) for row in cursor]
+    for entry in entries:
+        entry["similarity"] = best[entry["strong_number"]]
+    entries.sort(key=lambda entry: -entry["similarity"])
+    return entries
@@ -0,0 +1,191 @@
+"""
+HTTP validators and cache policies for BibleMVP.
+
+Content responses depend only on the request (path and query string), the
+data in the database and the code serving it. A strong ETag can therefore be
+computed from the data version, a build hash and the request before the
+endpoint runs. Only 200 responses carry it, so a matching If-None-Match is
+answered with an empty 304 without touching the database. If-Modified-Since
+(and If-None-Match: *) can't tell a missing reference from a present one, so
+those run the endpoint and only turn a 200 into a 304. 200 responses get ETag,
+Last-Modified and the Cache-Control policy of their route family.
+"""
+from email.utils import formatdate, parsedate_to_datetime
+from pathlib import Path
+from urllib.parse import parse_qsl, urlencode
+import hashlib
+
+from starlette.datastructures import Headers, MutableHeaders
+
+# (path prefix, Cache-Control) checked in order; the first match wins. Paths
+# not listed get no validators (e.g. /api/devotional, which defaults to today).
+CACHE_POLICIES = (
+    ("/api/offline/manifest", None),  # sets its own headers
+    ("/api/offline/", "public, max-age=86400"),
+    ("/api/passage/", "public, max-age=3600, stale-while-revalidate=86400"),
+    ("/api/passages", "public, max-age=3600, stale-while-revalidate=86400"),
+    ("/api/verse/", "public, max-age=3600, stale-while-revalidate=86400"),
+    ("/api/verses", "public, max-age=3600, stale-while-revalidate=86400"),
+    ("/api/word/", "public, max-age=3600, stale-while-revalidate=86400"),
+    ("/api/word-alignment", "public, max-age=3600, stale-while-revalidate=86400"),
+    ("/api/search", "public, max-age=300"),
+    ("/api/suggest", "public, max-age=3600"),
+    ("/api/devotional/sources", "public, max-age=3600"),
+    ("/api/reading-plans", "public, max-age=3600"),
+)
+
+# Operational endpoints that must never be served from a cache
+NO_STORE_PATHS = ("/api/health", "/api/ready", "/api/_metrics")
+
+# Response shapes change with the code, and reading plans are read from JSON
+# files in the repo, so both are part of the ETag alongside the data version
+_ROOT = Path(__file__).parent.parent
+BUILD_FILES = sorted(_ROOT.glob("backend/*.py")) + sorted(_ROOT.glob("data/reading-plan-*.json"))
+
+
+def _build_fingerprint() -> tuple:
+    digest = hashlib.blake2b(digest_size=8)
+    newest = 0.0
+    for path in BUILD_FILES:
+        digest.update(path.name.encode())
+        digest.update(path.read_bytes())
+        newest = max(newest, path.stat().st_mtime)
+    return digest.hexdigest(), newest
+
+
+BUILD_HASH, BUILD_MTIME = _build_fingerprint()
+
+
+def cache_policy(path: str):
+    """Cache-Control for a request path, "no-store", or None for no caching headers."""
+    if path.startswith(NO_STORE_PATHS):
+        return "no-store"
+    for prefix, policy in CACHE_POLICIES:
+        if path.startswith(prefix):
+            return policy
+    return None
+
+
+def make_etag(version: str, path: str, query_string: bytes) -> str:
+    """Strong ETag for a request: data version, build and normalized parameters."""
+    query = urlencode(sorted(parse_qsl(query_string.decode("latin-1"), keep_blank_values=True)))
+    digest = hashlib.blake2b(f"{version}\0{BUILD_HASH}\0{path}\0{query}".encode(), digest_size=12)
+    return f'"{digest.hexdigest()}"'
+
+
+def etag_matches(if_none_match: str, etag: str):
+    """
+    If-None-Match comparison (weak, as RFC 9110 requires for GET). Returns the
+    matching tag, which may be a compressed representation's `"<etag>-<encoding>"`.
+    """
+    for tag in if_none_match.split(","):
+        tag = tag.strip().removeprefix("W/")
+        if tag == etag or (tag.startswith(etag[:-1] + "-") and tag.endswith('"')):
+            return tag
+    return None
+
+
+class HTTPCacheMiddleware:
+    """ASGI middleware adding validators and Cache-Control, and answering 304s early."""
+
+    def __init__(self, app, database):
+        self.app = app
+        self.database = database
+        self._validators = (None, None, None)  # (data version, Last-Modified, its timestamp)
+
+    def last_modified(self, version: str) -> tuple:
+        """(HTTP date, timestamp): the newer of the database file and the build."""
+        if self._validators[0] != version:
+            mtime = max(Path(self.database.pool.path).stat().st_mtime, BUILD_MTIME)
+            self._validators = (version, formatdate(mtime, usegmt=True), int(mtime))
+        return self._validators[1], self._validators[2]
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] != "GET":
+            await self.app(scope, receive, send)
+            return
+
+        policy = cache_policy(scope["path"])
+        if policy is None:
+            await self.app(scope, receive, send)
+            return
+        if policy == "no-store":
+            await self.app(scope, receive, _with_headers(send, {"cache-control": "no-store"}, statuses=None))
+            return
+
+        version = await self.database.data_version()
+        etag = make_etag(version, scope["path"], scope["query_string"])
+        last_modified, modified_at = self.last_modified(version)
+        headers = {"etag": etag, "last-modified": last_modified, "cache-control": policy}
+
+        request_headers = Headers(scope=scope)
+        if_none_match = request_headers.get("if-none-match")
+        if if_none_match is not None and if_none_match.strip() != "*":
+            # Only a 200 from this request carried the tag, so the resource exists
+            matched = etag_matches(if_none_match, etag)
+            if matched is not None:
+                await _send_not_modified(send, {**headers, "etag": matched, "vary": "Accept-Encoding"})
+                return
+            revalidate = False
+        elif if_none_match is not None:
+            revalidate = True
+        else:
+            revalidate = _not_modified_since(request_headers.get("if-modified-since"), modified_at)
+
+        # Inner middleware (compression) keys its cache on the ETag
+        scope["etag"] = etag
+        if revalidate:
+            send = _not_modified_if_ok(send)
+        await self.app(scope, receive, _with_headers(send, headers))
+
+
+def _not_modified_since(if_modified_since, modified_at: int) -> bool:
+    if not if_modified_since:
+        return False
+    try:
+        return modified_at <= parsedate_to_datetime(if_modified_since).timestamp()
+    except (TypeError, ValueError):
+        return False
+
+
+async def _send_not_modified(send, headers: dict):
+    """Send an empty 304 with `headers`."""
+    await send({
+        "type": "http.response.start",
+        "status": 304,
+        "headers": [(name.encode(), value.encode()) for name, value in headers.items()],
+    })
+    await send({"type": "http.response.body", "body": b""})
+
+
+# Headers a 304 repeats from the 200 it stands for (RFC 9110 15.4.5)
+NOT_MODIFIED_HEADERS = ("cache-control", "content-location", "date", "etag", "expires", "last-modified", "vary")
+
+
+def _not_modified_if_ok(send):
+    """Wrap `send` to answer a 200 with an empty 304 carrying its validators, dropping the body."""
+    replaced = False
+
+    async def send_wrapper(message):
+        nonlocal replaced
+        if message["type"] == "http.response.start" and message["status"] == 200:
+            replaced = True
+            response_headers = Headers(raw=message["headers"])
+            headers = {name: response_headers[name] for name in NOT_MODIFIED_HEADERS if name in response_headers}
+            headers.setdefault("vary", "Accept-Encoding")
+            await _send_not_modified(send, headers)
+        elif not (replaced and message["type"] == "http.response.body"):
+            await send(message)
+    return send_wrapper
+
+
+def _with_headers(send, headers: dict, statuses=(200,)):
+    """Wrap `send` to add `headers` to responses (of `statuses`, or all) that don't set them."""
+    async def send_wrapper(message):
+        if message["type"] == "http.response.start" and (statuses is None or message["status"] in statuses):
+            response_headers = MutableHeaders(scope=message)
+            for name, value in headers.items():
+                if name not in response_headers:
+                    response_headers[name] = value
+        await send(message)
+    return send_wrapper
@@ -4,13 +4,24 @@ A free, open-source Bible study platform.
 """
 from fastapi import FastAPI, HTTPException, Query
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, JSONResponse, PlainTextResponse, StreamingResponse
 from pathlib import Path
 from typing import Optional
+import asyncio
 import sqlite3
 
-from .database import get_db_connection, init_db
-from .models import Passage, SearchResult, WordDetail, CommentaryEntry
+from .cache import chapter_cache, compressed_cache, search_cache, search_flight, suggest_flight
+from .compression import CompressionMiddleware
+from .database import db, db_pool, init_db
+from .fuzzy import did_you_mean, expand_query, fuzzy_fts_query, similar_lexicon_words, suggest_query
+from .http_cache import HTTPCacheMiddleware
+from .metrics import METRICS_ENABLED, MetricsMiddleware, metrics
+from .migrations import SCHEMA_VERSION, schema_version, verses_fts_table
+from .offline import bundle_path, load_bundle_manifest, write_book_json, write_book_ndjson
+from .references import BOOK_ALIASES, BOOK_ORDER, MAX_CHAPTER, NT_BOOKS, OT_BOOKS, parse_references, verse_key
+from .responses import FastJSONResponse, dumps
+from .suggest import cached_suggest_index, load_suggest_index
+from .models import Passage, SearchResult, WordDetail, CommentaryEntry, VersesRequest
 
 app = FastAPI(
     title="BibleMVP API",
@@ -18,6 +29,40 @@ app = FastAPI(
     version="0.1.0"
 )
 
+# Negotiated compression, inside the HTTP cache so it can key compressed
+# bodies on the ETag; ETag matches are answered before either runs the endpoint
+app.add_middleware(CompressionMiddleware)
+
+# ETag/Last-Modified validators and per-route Cache-Control (ETag 304s skip the endpoint)
+app.add_middleware(HTTPCacheMiddleware, database=db)
+
+# Request timing and SQL profiling are only wired in when enabled
+if METRICS_ENABLED:
+    app.add_middleware(MetricsMiddleware)
+
+# Default and maximum number of /api/suggest completions
+SUGGEST_LIMIT = 8
+SUGGEST_MAX = 20
+
+# Most verses one /api/passages response may hold (Genesis is 1,533)
+PASSAGES_MAX_VERSES = 2500
+
+# Most references one /api/verses request may look up, and the verses of
+# each reference's text (previews show the start of a range)
+VERSES_MAX_REFS = 500
+VERSE_PREVIEW_MAX = 3
+
+# Most best-voted cross-references per source verse (/crossrefs?top=)
+CROSSREF_TOP_MAX = 100
+
+# Default and maximum page size for /api/word occurrences
+WORD_PAGE_SIZE = 100
+WORD_PAGE_MAX = 1000
+
+# Default and maximum page size per result type for /api/search
+SEARCH_PAGE_SIZE = 50
+SEARCH_PAGE_MAX = 200
+
 # Static files
 frontend_path = Path(__file__).parent.parent / "frontend"
 app.mount("/static", StaticFiles(directory=frontend_path / "static"), name="static")
@@ -25,8 +70,17 @@ app.mount("/static", StaticFiles(directory=frontend_path / "static"), name="stat
 
 @app.on_event("startup")
 async def startup():
-    """Initialize database on startup."""
+    """Initialize database, pre-warm the connection pool and start DB workers."""
     init_db()
+    db_pool.open()
+    db.start()
+
+
+@app.on_event("shutdown")
+async def shutdown():
+    """Stop DB workers and close pooled database connections."""
+    db.stop()
+    db_pool.close()
 
 
 @app.get("/")
@@ -35,6 +89,84 @@ async def root():
     return FileResponse(frontend_path / "index.html")
 
 
+@app.get("/api/health")
+async def health():
+    """Report service health, connection pool and DB executor stats."""
+    pool = db_pool.stats()
+    return {
+        "status": "ok" if pool["open"] > 0 else "degraded",
+        "database": pool,
+        "executor": db.stats(),
+        "chapter_cache": chapter_cache.stats(),
+        "compressed_cache": compressed_cache.stats(),
+        "search_cache": {**search_cache.stats(), **search_flight.stats()}
+    }
+
+
+@app.get("/api/ready")
+async def ready():
+    """
+    Readiness probe: 200 once the connection pool is warm, DB workers are
+    running and the schema is current; 503 (with the failing checks) otherwise.
+    """
+    pool = db_pool.stats()
+    checks = {
+        "pool_warm": pool["size"] > 0 and pool["open"] >= pool["size"],
+        "workers_started": db.workers > 0,
+        "schema_current": False,
+    }
+    version = None
+    if checks["workers_started"]:
+        try:
+            version = await db.run(schema_version)
+            checks["schema_current"] = version >= SCHEMA_VERSION
+        except sqlite3.Error:
+            pass
+
+    is_ready = all(checks.values())
+    return JSONResponse({
+        "ready": is_ready,
+        "checks": checks,
+        "schema_version": version,
+        "expected_schema_version": SCHEMA_VERSION
+    }, status_code=200 if is_ready else 503)
+
+
+@app.get("/api/_metrics")
+async def get_metrics():
+    """Per-route latency and per-statement SQL stats (enable with METRICS_ENABLED=1)."""
+    return metrics.snapshot()
+
+
+@app.get("/api/_metrics/prometheus")
+async def get_metrics_prometheus():
+    """The same metrics in Prometheus text exposition format."""
+    pool = db_pool.stats()
+    cache = chapter_cache.stats()
+    compressed = compressed_cache.stats()
+    searches = search_cache.stats()
+    gauges = {
+        "bible_db_pool_in_use": pool["in_use"],
+        "bible_db_pool_checkouts": pool["checkouts"],
+        "bible_db_pool_timeouts": pool["timeouts"],
+        "bible_db_active_queries": db.stats()["active"],
+        "bible_chapter_cache_entries": cache["entries"],
+        "bible_chapter_cache_bytes": cache["bytes"],
+        "bible_chapter_cache_hits": cache["hits"],
+        "bible_chapter_cache_misses": cache["misses"],
+        "bible_compressed_cache_entries": compressed["entries"],
+        "bible_compressed_cache_bytes": compressed["bytes"],
+        "bible_compressed_cache_hits": compressed["hits"],
+        "bible_compressed_cache_misses": compressed["misses"],
+        "bible_search_cache_entries": searches["entries"],
+        "bible_search_cache_bytes": searches["bytes"],
+        "bible_search_cache_hits": searches["hits"],
+        "bible_search_cache_misses": searches["misses"],
+        "bible_search_coalesced": search_flight.coalesced,
+    }
+    return PlainTextResponse(metrics.prometheus(gauges), media_type="text/plain; version=0.0.4")
+
+
 @app.get("/api/passage/{reference}")
 async def get_passage(
     reference: str,
@@ -49,103 +181,111 @@ async def get_passage(
     - John 3 (full chapter) - returns full chapter, no highlighting
     - Rom 3:25 (abbreviations supported)
     """
-    conn = get_db_connection()
-    try:
-        # Parse reference and fetch verses
-        parsed = parse_reference(reference)
-        if not parsed:
-            raise HTTPException(status_code=400, detail=f"Invalid reference: {reference}")
-
-        book, chapter, verse_start, verse_end, has_verse = parsed
-
-        # Always fetch the full chapter
-        cursor = conn.execute("""
-            SELECT v.id, v.book, v.chapter, v.verse, v.text,
-                   GROUP_CONCAT(w.id) as word_ids
-            FROM verses v
-            LEFT JOIN words w ON w.verse_id = v.id
-            WHERE v.book = ? AND v.chapter = ?
-                  AND v.translation_id = ?
-            GROUP BY v.id
-            ORDER BY v.verse
-        """, (book, chapter, translation))
-
-        verses = cursor.fetchall()
-        if not verses:
-            raise HTTPException(status_code=404, detail=f"Passage not found: {reference}")
-
-        # Build highlighted verses list (only if specific verse was requested)
-        highlighted_verses = []
-        if has_verse:
-            highlighted_verses = list(range(verse_start, verse_end + 1))
-
-        # Get cross-references for the requested verses
-        cross_refs = get_cross_references(conn, book, chapter, verse_start, verse_end)
-
-        # Get verses with divine speech for red-letter display
-        speaker_verses = get_speaker_verses(conn, book, chapter)
-
-        return {
-            "reference": f"{book} {chapter}" if not has_verse else reference,
-            "translation": translation,
-            "verses": [dict(v) for v in verses],
-            "cross_references": cross_refs,
-            "highlighted_verses": highlighted_verses,
-            "speaker_verses": speaker_verses
-        }
-    finally:
-        conn.close()
+    # Parse reference and fetch verses
+    parsed = parse_reference(reference)
+    if not parsed:
+        raise HTTPException(status_code=400, detail=f"Invalid reference: {reference}")
+
+    book, chapter, verse_start, verse_end, has_verse = parsed
+
+    # Always fetch the full chapter (shared cache entry for every verse in it)
+    chapter_data = await get_chapter(book, chapter, translation)
+    if chapter_data is None:
+        raise HTTPException(status_code=404, detail=f"Passage not found: {reference}")
+
+    # Build highlighted verses list (only if specific verse was requested)
+    highlighted_verses = []
+    if has_verse:
+        highlighted_verses = [
+            v["verse"] for v in chapter_data["verses"] if verse_start <= v["verse"] <= verse_end
+        ]
+
+    # Narrow the chapter's cross-references to the requested verses
+    cross_refs = [
+        r for r in chapter_data["cross_references"]
+        if verse_start <= r["source_verse"] <= verse_end
+    ]
+
+    return FastJSONResponse({
+        "reference": f"{book} {chapter}" if not has_verse else reference,
+        "translation": translation,
+        "verses": chapter_data["verses"],
+        "cross_references": cross_refs,
+        "highlighted_verses": highlighted_verses,
+        "speaker_verses": chapter_data["speaker_verses"]
+    })
 
 
 @app.get("/api/passage/{reference}/commentary")
 async def get_commentary(reference: str):
     """Get commentary entries for a passage."""
-    conn = get_db_connection()
-    try:
-        parsed = parse_reference(reference)
-        if not parsed:
-            raise HTTPException(status_code=400, detail=f"Invalid reference: {reference}")
-
-        book, chapter, verse_start, verse_end, _ = parsed
-
-        # If viewing full chapter (verse_end=999), get all commentary for chapter
-        # Otherwise, get commentary that overlaps with the requested verse range
-        if verse_end == 999:
-            cursor = conn.execute("""
-                SELECT source, content, reference_start, reference_end
-                FROM commentary_entries
-                WHERE book = ? AND chapter = ?
-                ORDER BY reference_start, source
-            """, (book, chapter))
-        else:
-            cursor = conn.execute("""
-                SELECT source, content, reference_start, reference_end
-                FROM commentary_entries
-                WHERE book = ? AND chapter = ?
-                      AND reference_start <= ? AND reference_end >= ?
-                ORDER BY reference_start, source
-            """, (book, chapter, verse_end, verse_start))
-
-        entries = cursor.fetchall()
-        return {"reference": reference, "entries": [dict(e) for e in entries]}
-    finally:
-        conn.close()
+    parsed = parse_reference(reference)
+    if not parsed:
+        raise HTTPException(status_code=400, detail=f"Invalid reference: {reference}")
+
+    book, chapter, verse_start, verse_end, _ = parsed
+    first_key, last_key = chapter_key_range(book, chapter)
+
+    # If viewing full chapter (verse_end=999), get all commentary for chapter
+    # Otherwise, get commentary that overlaps with the requested verse range
+    if verse_end == 999:
+        entries = await db.fetch_dicts("""
+            SELECT source, content, reference_start, reference_end
+            FROM commentary_entries
+            WHERE start_key BETWEEN ? AND ?
+            ORDER BY start_key, source
+        """, (first_key, last_key))
+    else:
+        entries = await db.fetch_dicts("""
+            SELECT source, content, reference_start, reference_end
+            FROM commentary_entries
+            WHERE start_key BETWEEN ? AND ? AND end_key >= ?
+            ORDER BY start_key, source
+        """, (first_key, first_key + verse_end, first_key + verse_start))
+
+    return FastJSONResponse({"reference": reference, "entries": entries})
 
 
 @app.get("/api/passage/{reference}/crossrefs")
-async def get_crossrefs(reference: str):
-    """Get cross-references for a passage."""
-    conn = get_db_connection()
-    try:
-        parsed = parse_reference(reference)
-        if not parsed:
-            raise HTTPException(status_code=400, detail=f"Invalid reference: {reference}")
+async def get_crossrefs(
+    reference: str,
+    include_text: bool = Query(default=False, description="Inline each target verse's text as target_text"),
+    translation: str = Query(default="WEB", description="Bible translation of target_text"),
+    min_votes: Optional[int] = Query(default=None, ge=0, description="Only references with at least this many votes"),
+    top: Optional[int] = Query(default=None, ge=1, le=CROSSREF_TOP_MAX,
+                               description="Best-voted references to keep per source verse"),
+    sort: str = Query(default="canonical", pattern="^(canonical|votes)$",
+                      description="canonical (target order) or votes (most voted first)"),
+    group: Optional[str] = Query(default=None, pattern="^verse$",
+                                 description='"verse" groups the references by source verse')
+):
+    """
+    Get cross-references for a passage, optionally with their target verses' text.
 
-        book, chapter, verse_start, verse_end, _ = parsed
-        cross_refs = get_cross_references(conn, book, chapter, verse_start, verse_end)
-        return {"reference": reference, "cross_references": cross_refs}
-    finally:
-        conn.close()
+    min_votes, top and sort=votes rank by OpenBible.info votes (each reference
+    then carries its `votes`). With group=verse the response has `verses`,
+    one {verse, cross_references} entry per source verse in order, instead
+    of a flat `cross_references` list.
+    """
+    parsed = parse_reference(reference)
+    if not parsed:
+        raise HTTPException(status_code=400, detail=f"Invalid reference: {reference}")
+
+    book, chapter, verse_start, verse_end, _ = parsed
+    cross_refs = await get_cross_references(book, chapter, verse_start, verse_end,
+                                            text_translation=translation if include_text else None,
+                                            min_votes=min_votes, top=top, sort=sort,
+                                            by_source=group is not None)
+    if group is None:
+        return FastJSONResponse({"reference": reference, "cross_references": cross_refs})
+
+    verses = []
+    for row in cross_refs:
+        verse = row.pop("source_verse")
+        if not verses or verses[-1]["verse"] != verse:
+            verses.append({"verse": verse, "cross_references": []})
+        verses[-1]["cross_references"].append(row)
+    return FastJSONResponse({"reference": reference, "verses": verses})
 
 
 @app.get("/api/verse/{reference}")
@@ -154,179 +294,106 @@ async def get_single_verse(
     translation: str = Query(default="WEB", description="Bible translation")
 ):
     """Get a single verse text for previews."""
-    conn = get_db_connection()
-    try:
-        parsed = parse_reference(reference)
-        if not parsed:
-            raise HTTPException(status_code=400, detail=f"Invalid reference: {reference}")
+    parsed = parse_reference(reference)
+    if not parsed:
+        raise HTTPException(status_code=400, detail=f"Invalid reference: {reference}")
 
-        book, chapter, verse_start, _, _ = parsed
+    book, chapter, verse_start, _, _ = parsed
 
-        cursor = conn.execute("""
-            SELECT text FROM verses
-            WHERE book = ? AND chapter = ? AND verse = ? AND translation_id = ?
-        """, (book, chapter, verse_start, translation))
+    row = await db.fetch_one("""
+        SELECT text FROM verses
+        WHERE translation_id = ? AND verse_key = ?
+    """, (translation, verse_key(BOOK_ORDER.get(book, 0), chapter, verse_start)))
 
-        row = cursor.fetchone()
-        if not row:
-            raise HTTPException(status_code=404, detail=f"Verse not found: {reference}")
+    if not row:
+        raise HTTPException(status_code=404, detail=f"Verse not found: {reference}")
 
-        return {"reference": reference, "text": row["text"]}
-    finally:
-        conn.close()
+    return {"reference": reference, "text": row["text"]}
+
+
+@app.get("/api/verses")
+async def get_verses(
+    refs: str = Query(..., description='References, e.g. "John 3:16; Rom 5:8, 10"'),
+    translation: str = Query(default="WEB", description="Bible translation")
+):
+    """
+    Verse text for many references at once, e.g. every cross-reference
+    target of a chapter for hover previews, from a single indexed query.
+    `verses` maps each reference (in canonical form, "Romans 5:8") to its
+    text; a range gives its first few verses. POST {"refs": [...]} instead
+    for lists too long for a URL.
+    """
+    return FastJSONResponse({"translation": translation, "verses": await get_verse_texts([refs], translation)})
+
+
+@app.post("/api/verses")
+async def post_verses(request: VersesRequest):
+    """Verse text for a list of references (see GET /api/verses)."""
+    return FastJSONResponse({
+        "translation": request.translation,
+        "verses": await get_verse_texts(request.refs, request.translation)
+    })
 
 
 @app.get("/api/search")
 async def search(
     q: str = Query(..., min_length=2, description="Search query"),
-    scope: str = Query(default="all", description="Search scope: bible, ot, nt, book:BookName, commentary, all")
+    scope: str = Query(default="all", description="Search scope: bible, ot, nt, book:BookName, commentary, all"),
+    translation: str = Query(default="BSB", description="Bible translation to search"),
+    mode: str = Query(default="text", pattern="^(text|fuzzy)$",
+                      description="fuzzy also matches misspelled and partial words"),
+    limit: int = Query(default=SEARCH_PAGE_SIZE, ge=1, le=SEARCH_PAGE_MAX),
+    cursor: Optional[str] = Query(default=None, description="A next_cursor value from the previous page")
 ):
-    """Full-text search across Bible text, notes, and commentaries."""
-    import re
+    """
+    Full-text search across Bible text, notes, and commentaries. Verses are
+    searched in one translation's index, so each verse appears once.
 
-    # OT/NT book lists for filtering
-    OT_BOOKS = [
-        "Genesis", "Exodus", "Leviticus", "Numbers", "Deuteronomy",
-        "Joshua", "Judges", "Ruth", "1 Samuel", "2 Samuel",
-        "1 Kings", "2 Kings", "1 Chronicles", "2 Chronicles",
-        "Ezra", "Nehemiah", "Esther", "Job", "Psalms", "Proverbs",
-        "Ecclesiastes", "Song of Solomon", "Isaiah", "Jeremiah",
-        "Lamentations", "Ezekiel", "Daniel", "Hosea", "Joel", "Amos",
-        "Obadiah", "Jonah", "Micah", "Nahum", "Habakkuk", "Zephaniah",
-        "Haggai", "Zechariah", "Malachi"
-    ]
-    NT_BOOKS = [
-        "Matthew", "Mark", "Luke", "John", "Acts", "Romans",
-        "1 Corinthians", "2 Corinthians", "Galatians", "Ephesians",
-        "Philippians", "Colossians", "1 Thessalonians", "2 Thessalonians",
-        "1 Timothy", "2 Timothy", "Titus", "Philemon", "Hebrews",
-        "James", "1 Peter", "2 Peter", "1 John", "2 John", "3 John",
-        "Jude", "Revelation"
-    ]
+    The first page has `totals` per result type and, for verses, `facets`
+    (hits per book and testament). Each result type is ordered by relevance
+    and paged separately: pass one of the returned `next_cursor` values as
+    `cursor` to get that type's next page.
 
-    conn = get_db_connection()
-    try:
-        results = []
-
-        # Check if this is a Strong's number search (G### or H###)
-        strongs_match = re.match(r'^([GH])(\d+)$', q.strip(), re.IGNORECASE)
-        if strongs_match:
-            prefix = strongs_match.group(1).upper()
-            number = strongs_match.group(2)
-            strongs_num = f"{prefix}{number}"
-
-            # Get the lexicon entry for this Strong's number
-            lex_cursor = conn.execute("""
-                SELECT original, transliteration, definition
-                FROM lexicon
-                WHERE strong_number = ?
-            """, (strongs_num,))
-            lex_row = lex_cursor.fetchone()
-            word_info = None
-            if lex_row:
-                word_info = {
-                    "strong_number": strongs_num,
-                    "original": lex_row["original"],
-                    "transliteration": lex_row["transliteration"],
-                    "definition": lex_row["definition"]
-                }
-
-            # Search for verses with this Strong's number, including the original word
-            cursor = conn.execute("""
-                SELECT 'verse' as type, v.book, v.chapter, v.verse,
-                       v.text as snippet, w.text as original_word,
-                       w.translation as gloss
-                FROM words w
-                JOIN verses v ON w.verse_id = v.id
-                WHERE w.strong_number = ?
-                ORDER BY v.book_order, v.chapter, v.verse
-                LIMIT 50
-            """, (strongs_num,))
-
-            for row in cursor.fetchall():
-                result = dict(row)
-                # Highlight the translated word in the snippet if we have a gloss
-                if result.get("gloss"):
-                    gloss = result["gloss"]
-                    snippet = result["snippet"]
-                    # Try to highlight the gloss word in the verse text
-                    import re as regex
-                    pattern = regex.compile(r'\b(' + regex.escape(gloss) + r')\b', regex.IGNORECASE)
-                    result["snippet"] = pattern.sub(r'<mark>\1</mark>', snippet, count=1)
-                results.append(result)
-
-            return {"query": q, "scope": scope, "results": results, "word_info": word_info}
-
-        # Check if searching within a specific book
-        book_filter = None
-        testament_filter = None
-        if scope.startswith("book:"):
-            book_filter = scope[5:]
-            scope = "bible"
-        elif scope == "ot":
-            testament_filter = OT_BOOKS
-            scope = "bible"
-        elif scope == "nt":
-            testament_filter = NT_BOOKS
-            scope = "bible"
-
-        # Build FTS query - handle phrase search with quotes
-        fts_query = q
-        if '"' in q:
-            # FTS5 handles quoted phrases natively
-            pass
-        else:
-            # Add wildcard for partial matching on last word
-            words = q.split()
-            if words:
-                words[-1] = words[-1] + '*'
-                fts_query = ' '.join(words)
-
-        if scope in ("all", "bible"):
-            if book_filter:
-                cursor = conn.execute("""
-                    SELECT 'verse' as type, book, chapter, verse,
-                           snippet(verses_fts, 0, '<mark>', '</mark>', '...', 32) as snippet
-                    FROM verses_fts
-                    WHERE verses_fts MATCH ? AND book = ?
-                    ORDER BY rank
-                    LIMIT 50
-                """, (fts_query, book_filter))
-            elif testament_filter:
-                placeholders = ','.join('?' * len(testament_filter))
-                cursor = conn.execute(f"""
-                    SELECT 'verse' as type, book, chapter, verse,
-                           snippet(verses_fts, 0, '<mark>', '</mark>', '...', 32) as snippet
-                    FROM verses_fts
-                    WHERE verses_fts MATCH ? AND book IN ({placeholders})
-                    ORDER BY rank
-                    LIMIT 50
-                """, (fts_query, *testament_filter))
-            else:
-                cursor = conn.execute("""
-                    SELECT 'verse' as type, book, chapter, verse,
-                           snippet(verses_fts, 0, '<mark>', '</mark>', '...', 32) as snippet
-                    FROM verses_fts
-                    WHERE verses_fts MATCH ?
-                    ORDER BY rank
-                    LIMIT 50
-                """, (fts_query,))
-            results.extend([dict(r) for r in cursor.fetchall()])
-
-        if scope in ("all", "commentary"):
-            cursor = conn.execute("""
-                SELECT 'commentary' as type, source, book, chapter,
-                       snippet(commentary_fts, 0, '<mark>', '</mark>', '...', 32) as snippet
-                FROM commentary_fts
-                WHERE commentary_fts MATCH ?
-                ORDER BY rank
-                LIMIT 50
-            """, (fts_query,))
-            results.extend([dict(r) for r in cursor.fetchall()])
+    mode=fuzzy searches each word's closest indexed terms instead (listed in
+    `expansions`) and suggests a corrected query as `did_you_mean`; a text
+    search with no hits also gets a `did_you_mean` when there is one.
 
-        return {"query": q, "scope": scope, "results": results}
-    finally:
-        conn.close()
+    The payload is cached per normalized query, so a debounced live search
+    re-sending the same words (in any case or spacing) is served from memory,
+    and concurrent identical searches run the queries once.
+    """
+    after = parse_search_cursor(cursor)
+    query = normalize_search_query(q)
+    key = (query, scope, translation, mode, limit, after)
+    version = await db.data_version()
+    payload = search_cache.get(key, version)
+    if payload is None:
+        async def build():
+            payload = await search_payload(query, scope, translation, mode, limit, after, cursor)
+            search_cache.put(key, payload, version, size=len(dumps(payload)))
+            return payload
+
+        payload = await search_flight.run((version, key), build)
+    return FastJSONResponse({"query": q, **payload})
+
+
+@app.get("/api/suggest")
+async def suggest(
+    q: str = Query(..., min_length=1, max_length=100, description="Partly typed reference or search"),
+    limit: int = Query(default=SUGGEST_LIMIT, ge=1, le=SUGGEST_MAX),
+    terms: bool = Query(default=True, description="Also complete the last word from the search vocabulary")
+):
+    """
+    Autocomplete a reference or search as it is typed: book names from any
+    known abbreviation ("1 jn", "Ps"), then chapters and verse numbers within
+    the book's real bounds ("John 3" -> "John 3:1" ... "John 3:36"), then the
+    most frequent indexed search terms starting with the last word.
+
+    Answered from an in-memory prefix index built on first use, so it never
+    queries the database.
+    """
+    index = await suggest_index()
+    return FastJSONResponse({"query": q, "suggestions": index.suggest(q, limit, terms)})
 
 
 @app.get("/api/word-alignment")
@@ -343,111 +410,181 @@ async def get_word_alignment(
     This enables deterministic word lookup when clicking English words.
     Returns the original word data including Strong's number and definition.
     """
-    conn = get_db_connection()
-    try:
-        # Look up the alignment
-        cursor = conn.execute("""
-            SELECT ea.english_word, ea.original_word_position, ea.confidence,
-                   wa.hebrew_text as original_text, wa.transliteration, wa.english_gloss,
-                   wa.grammar as parsing,
-                   CASE WHEN wa.strong_number LIKE 'H0%' THEN 'H' || CAST(CAST(SUBSTR(wa.strong_number, 2) AS INTEGER) AS TEXT)
-                        WHEN wa.strong_number LIKE 'G0%' THEN 'G' || CAST(CAST(SUBSTR(wa.strong_number, 2) AS INTEGER) AS TEXT)
-                        ELSE wa.strong_number END as strong_number
-            FROM english_word_alignments ea
-            JOIN word_alignments wa ON (
-                wa.book = ea.book AND wa.chapter = ea.chapter
-                AND wa.verse = ea.verse AND wa.word_position = ea.original_word_position
-            )
-            WHERE ea.translation_id = ?
-              AND ea.book = ? AND ea.chapter = ? AND ea.verse = ?
-              AND ea.english_word_position = ?
-        """, (translation, book, chapter, verse, word_position))
-
-        row = cursor.fetchone()
-        if not row:
-            return {"found": False, "message": "No alignment found for this word"}
-
-        result = dict(row)
-        strong_number = result.get('strong_number')
-
-        # Get lexicon definition if we have a Strong's number
-        if strong_number:
-            cursor = conn.execute("""
-                SELECT original, transliteration, pronunciation, definition,
-                       extended_definition, derivation, language
-                FROM lexicon
-                WHERE strong_number = ?
-            """, (strong_number,))
-
-            lex_row = cursor.fetchone()
-            if lex_row:
-                lex_data = dict(lex_row)
-                # Use lexicon transliteration if alignment doesn't have one
-                if not result.get('transliteration'):
-                    result['transliteration'] = lex_data.get('transliteration')
-                result['pronunciation'] = lex_data.get('pronunciation')
-                result['definition'] = lex_data.get('definition')
-                result['extended_definition'] = lex_data.get('extended_definition')
-                result['language'] = lex_data.get('language')
-
-        return {"found": True, "alignment": result}
-    finally:
-        conn.close()
-
-
-@app.get("/api/word/{strong_number}")
-async def get_word(strong_number: str):
-    """Get lexicon entry and all occurrences for a Strong's number."""
-    conn = get_db_connection()
-    try:
-        # Get word details from lexicon
-        cursor = conn.execute("""
-            SELECT strong_number, original, transliteration,
-                   pronunciation, definition, extended_definition, derivation, language
+    # Look up the alignment
+    row = await db.fetch_one("""
+        SELECT ea.english_word, ea.original_word_position, ea.confidence,
+               wa.hebrew_text as original_text, wa.transliteration, wa.english_gloss,
+               wa.grammar as parsing,
+               wa.strong_canonical as strong_number
+        FROM english_word_alignments ea
+        JOIN word_alignments wa ON (
+            wa.verse_key = ea.verse_key AND wa.word_position = ea.original_word_position
+        )
+        WHERE ea.translation_id = ?
+          AND ea.verse_key = ?
+          AND ea.english_word_position = ?
+    """, (translation, verse_key(BOOK_ORDER.get(book, 0), chapter, verse), word_position))
+
+    if not row:
+        return {"found": False, "message": "No alignment found for this word"}
+
+    result = dict(row)
+    strong_number = result.get('strong_number')
+
+    # Get lexicon definition if we have a Strong's number
+    if strong_number:
+        lex_row = await db.fetch_one("""
+            SELECT original, transliteration, pronunciation, definition,
+                   extended_definition, derivation, language
             FROM lexicon
             WHERE strong_number = ?
         """, (strong_number,))
 
-        word = cursor.fetchone()
-        if not word:
-            raise HTTPException(status_code=404, detail=f"Word not found: {strong_number}")
-
-        word_dict = dict(word)
-
-        # If lexicon doesn't have transliteration, try to get from alignment data
-        if not word_dict.get('transliteration'):
-            # Normalize Strong's number format - alignment uses H0430, lexicon uses H430
-            prefix = strong_number[0]  # H or G
-            num = strong_number[1:]
-            padded_strong = f"{prefix}{num.zfill(4)}"  # H430 -> H0430
-
-            cursor = conn.execute("""
-                SELECT transliteration FROM word_alignments
-                WHERE strong_number = ? AND transliteration IS NOT NULL AND transliteration != ''
-                LIMIT 1
-            """, (padded_strong,))
-            align_row = cursor.fetchone()
-            if align_row and align_row['transliteration']:
-                word_dict['transliteration'] = align_row['transliteration']
-
-        # Get all occurrences
-        cursor = conn.execute("""
-            SELECT v.book, v.chapter, v.verse, w.position, w.translation
-            FROM words w
-            JOIN verses v ON w.verse_id = v.id
-            WHERE w.strong_number = ?
-            ORDER BY v.book_order, v.chapter, v.verse, w.position
-        """, (strong_number,))
+        if lex_row:
+            lex_data = dict(lex_row)
+            # Use lexicon transliteration if alignment doesn't have one
+            if not result.get('transliteration'):
+                result['transliteration'] = lex_data.get('transliteration')
+            result['pronunciation'] = lex_data.get('pronunciation')
+            result['definition'] = lex_data.get('definition')
+            result['extended_definition'] = lex_data.get('extended_definition')
+            result['language'] = lex_data.get('language')
 
-        occurrences = cursor.fetchall()
+    return {"found": True, "alignment": result}
 
-        return {
-            "word": word_dict,
-            "occurrences": [dict(o) for o in occurrences],
-            "count": len(occurrences)
-        }
-    finally:
-        conn.close()
+
+@app.get("/api/word/{strong_number}")
+async def get_word(
+    strong_number: str,
+    limit: int = Query(default=WORD_PAGE_SIZE, ge=1, le=WORD_PAGE_MAX),
+    cursor: Optional[str] = None,
+    format: str = Query(default="json", pattern="^(json|ndjson)$")
+):
+    """
+    Get lexicon entry and occurrences for a Strong's number.
+
+    Occurrences come in canonical order, `limit` at a time; pass the returned
+    `next_cursor` as `cursor` for the next page. `count` and the per-book
+    `books` facet always cover every occurrence. format=ndjson streams all
+    occurrences after `cursor` (a header line, then one line per occurrence).
+    """
+    after = parse_occurrence_cursor(cursor)
+
+    # Get word details from lexicon
+    word = await db.fetch_one("""
+        SELECT strong_number, original, transliteration,
+               pronunciation, definition, extended_definition, derivation, language
+        FROM lexicon
+        WHERE strong_number = ?
+    """, (strong_number,))
+
+    if not word:
+        raise HTTPException(status_code=404, detail=f"Word not found: {strong_number}")
+
+    word_dict = dict(word)
+
+    # If lexicon doesn't have transliteration, try to get from alignment data
+    if not word_dict.get('transliteration'):
+        # Alignment rows carry the lexicon's canonical form (H430) alongside H0430
+        align_row = await db.fetch_one("""
+            SELECT transliteration FROM word_alignments
+            WHERE strong_canonical = ? AND transliteration IS NOT NULL AND transliteration != ''
+            LIMIT 1
+        """, (word_dict['strong_number'],))
+        if align_row and align_row['transliteration']:
+            word_dict['transliteration'] = align_row['transliteration']
+
+    # Per-book counts are precomputed, so the totals cost the same for any word
+    books = await get_word_books(strong_number)
+    header = {"word": word_dict, "count": sum(b["count"] for b in books), "books": books}
+
+    if format == "ndjson":
+        chunks = db.stream(write_word_occurrences, header, strong_number, after, bulk=True)
+        return StreamingResponse(chunks, media_type="application/x-ndjson")
+
+    # One extra row tells whether there is a next page
+    occurrences = await db.fetch_dicts(f"{WORD_OCCURRENCES_SQL} LIMIT ?",
+                                       (strong_number, *after, limit + 1))
+    next_cursor = None
+    if len(occurrences) > limit:
+        del occurrences[limit:]
+        next_cursor = occurrence_cursor(occurrences[-1])
+
+    return FastJSONResponse({
+        **header,
+        "occurrences": occurrences,
+        "next_cursor": next_cursor
+    })
+
+
+@app.get("/api/word/{strong_number}/stats")
+async def get_word_stats(strong_number: str):
+    """Frequency statistics for a Strong's number, from the precomputed concordance."""
+    row = await db.fetch_one("""
+        SELECT l.strong_number, l.language, s.occurrences, s.verses, s.books, s.frequency_rank
+        FROM lexicon l
+        LEFT JOIN word_stats s ON s.strong_number = l.strong_number
+        WHERE l.strong_number = ?
+    """, (strong_number,))
+
+    if not row:
+        raise HTTPException(status_code=404, detail=f"Word not found: {strong_number}")
+
+    books = await get_word_books(strong_number)
+
+    return FastJSONResponse({
+        "strong_number": row["strong_number"],
+        "language": row["language"],
+        "occurrences": row["occurrences"] or 0,
+        "verses": row["verses"] or 0,
+        "book_count": row["books"] or 0,
+        "frequency_rank": row["frequency_rank"],
+        **book_facets(books)
+    })
+
+
+@app.get("/api/word/{strong_number}/translations")
+async def get_word_translations(
+    strong_number: str,
+    translation: str = Query(default="BSB"),
+    limit: int = Query(default=20, ge=1, le=WORD_PAGE_MAX)
+):
+    """
+    How a Strong's number is rendered in an aligned translation, most frequent
+    first. A known translation that doesn't render the word gives zero counts;
+    an unknown one is a 404.
+    """
+    row = await db.fetch_one("""
+        SELECT l.strong_number, t.aligned, t.renderings,
+               EXISTS (SELECT 1 FROM translations WHERE id = ?) as translation_known
+        FROM lexicon l
+        LEFT JOIN word_rendering_totals t
+             ON t.strong_number = l.strong_number AND t.translation_id = ?
+        WHERE l.strong_number = ?
+    """, (translation, translation, strong_number))
+
+    if not row:
+        raise HTTPException(status_code=404, detail=f"Word not found: {strong_number}")
+    if not row["translation_known"]:
+        raise HTTPException(status_code=404, detail=f"Translation not found: {translation}")
+
+    renderings = []
+    if row["aligned"]:
+        renderings = await db.fetch_dicts("""
+            SELECT rendering, count
+            FROM word_renderings
+            WHERE strong_number = ? AND translation_id = ?
+            ORDER BY rank
+            LIMIT ?
+        """, (strong_number, translation, limit))
+
+    return FastJSONResponse({
+        "strong_number": strong_number,
+        "translation": translation,
+        "aligned": row["aligned"] or 0,
+        "distinct_renderings": row["renderings"] or 0,
+        "renderings": renderings
+    })
 
 
 @app.get("/api/passage/{reference}/interlinear")
@@ -462,79 +599,82 @@ async def get_passage_interlinear(
     the original language text is the same regardless of which English translation
     is being viewed.
     """
-    conn = get_db_connection()
-    try:
-        parsed = parse_reference(reference)
-        if not parsed:
-            raise HTTPException(status_code=400, detail=f"Invalid reference: {reference}")
-
-        book, chapter, _, _, _ = parsed
-
-        # Query alignment data directly - this works for any translation since
-        # the Hebrew/Greek text is the same. Normalize Strong's numbers for lexicon lookup.
-        # Include word_id for deterministic English word alignment.
-        cursor = conn.execute("""
-            SELECT a.verse, a.word_position as position, a.hebrew_text as original_text,
-                   a.book || '.' || a.chapter || '.' || a.verse || '.' || a.word_position as word_id,
-                   CASE WHEN a.strong_number LIKE 'H0%' THEN 'H' || CAST(CAST(SUBSTR(a.strong_number, 2) AS INTEGER) AS TEXT)
-                        WHEN a.strong_number LIKE 'G0%' THEN 'G' || CAST(CAST(SUBSTR(a.strong_number, 2) AS INTEGER) AS TEXT)
-                        ELSE a.strong_number END as strong_number,
-                   a.grammar as parsing,
-                   a.english_gloss as translation,
-                   l.original as lexeme,
-                   COALESCE(NULLIF(a.transliteration, ''), l.transliteration) as transliteration,
-                   l.pronunciation,
-                   l.definition,
-                   l.extended_definition,
-                   l.language
-            FROM word_alignments a
-            LEFT JOIN lexicon l ON l.strong_number = CASE
-                WHEN a.strong_number LIKE 'H0%' THEN 'H' || CAST(CAST(SUBSTR(a.strong_number, 2) AS INTEGER) AS TEXT)
-                WHEN a.strong_number LIKE 'G0%' THEN 'G' || CAST(CAST(SUBSTR(a.strong_number, 2) AS INTEGER) AS TEXT)
-                ELSE a.strong_number END
-            WHERE a.book = ? AND a.chapter = ?
-            ORDER BY a.verse, a.word_position
-        """, (book, chapter))
-
-        rows = cursor.fetchall()
-
-        # Group words by verse
-        verses_data = {}
-        language = None
-        for row in rows:
-            verse_num = row['verse']
-            if verse_num not in verses_data:
-                verses_data[verse_num] = []
-            word_data = dict(row)
-            del word_data['verse']  # Remove verse from individual word
-            verses_data[verse_num].append(word_data)
-            if not language and word_data.get('language'):
-                language = word_data['language']
-
-        # Fallback language detection based on testament
-        OT_BOOKS = [
-            "Genesis", "Exodus", "Leviticus", "Numbers", "Deuteronomy",
-            "Joshua", "Judges", "Ruth", "1 Samuel", "2 Samuel",
-            "1 Kings", "2 Kings", "1 Chronicles", "2 Chronicles",
-            "Ezra", "Nehemiah", "Esther", "Job", "Psalms", "Proverbs",
-            "Ecclesiastes", "Song of Solomon", "Isaiah", "Jeremiah",
-            "Lamentations", "Ezekiel", "Daniel", "Hosea", "Joel", "Amos",
-            "Obadiah", "Jonah", "Micah", "Nahum", "Habakkuk", "Zephaniah",
-            "Haggai", "Zechariah", "Malachi"
+    parsed = parse_reference(reference)
+    if not parsed:
+        raise HTTPException(status_code=400, detail=f"Invalid reference: {reference}")
+
+    book, chapter, _, _, _ = parsed
+
+    # Query alignment data directly - this works for any translation since
+    # the Hebrew/Greek text is the same. strong_canonical matches the lexicon keys.
+    # Include word_id for deterministic English word alignment.
+    rows = await db.fetch_dicts(f"""
+        SELECT {INTERLINEAR_COLUMNS}
+        FROM word_alignments a
+        LEFT JOIN lexicon l ON l.strong_number = a.strong_canonical
+        WHERE a.verse_key BETWEEN ? AND ?
+        ORDER BY a.verse_key, a.word_position
+    """, chapter_key_range(book, chapter))
+    language, verses_data = group_interlinear(book, rows)
+
+    return FastJSONResponse({
+        "reference": reference,
+        "book": book,
+        "chapter": chapter,
+        "language": language,
+        "verses": verses_data,
+        "has_interlinear": len(verses_data) > 0
+    })
+
+
+@app.get("/api/passages")
+async def get_passages(
+    refs: Optional[str] = Query(default=None, description='References, e.g. "Genesis 1-3; Psalm 1:1-6"'),
+    plan: Optional[str] = Query(default=None, description="Reading plan id; returns that plan's readings for day"),
+    day: Optional[int] = Query(default=None, ge=1),
+    translation: str = Query(default="WEB", description="Bible translation"),
+    include: str = Query(default="", pattern="^((commentary|interlinear),?)*$",
+                         description="Side data for every chapter: commentary, interlinear")
+):
+    """
+    Several passages in one response, e.g. a whole reading-plan day: the
+    verses, cross-references and red-letter verses of every chapter they
+    cover, plus commentary and interlinear words when included.
+
+    Passages are grouped in `sections` (one per reading-plan track, or one
+    per reference) of `chapters`, and only the requested verses are returned.
+    Each data type is one query over all the passages' verse ranges,
+    however many chapters they span.
+    """
+    if plan:
+        if day is None:
+            raise HTTPException(status_code=400, detail="day is required with plan")
+        reading_plan = load_reading_plan(plan)
+        readings = reading_plan_day(reading_plan, day)
+        # A reading that does not parse comes back as a section without chapters
+        sections = [
+            {"type": track["id"], "reference": readings[track["id"]],
+             "passages": parse_references(readings[track["id"]]) or ()}
+            for track in reading_plan.get("tracks", []) if readings.get(track["id"])
         ]
-        if not language and verses_data:
-            language = 'hebrew' if book in OT_BOOKS else 'greek' if book == 'Matthew' else None
-
-        return {
-            "reference": reference,
-            "book": book,
-            "chapter": chapter,
-            "language": language,
-            "verses": verses_data,
-            "has_interlinear": len(verses_data) > 0
-        }
-    finally:
-        conn.close()
+    elif refs:
+        passages = parse_references(refs)
+        if not passages:
+            raise HTTPException(status_code=400, detail=f"Invalid reference: {refs}")
+        sections = [{"type": None, "reference": str(passage), "passages": (passage,)} for passage in passages]
+    else:
+        raise HTTPException(status_code=400, detail="Pass refs, or plan and day")
+
+    passages = [passage for section in sections for passage in section["passages"]]
+    chapters = iter(await get_passage_chapters(passages, translation, set(filter(None, include.split(",")))))
+    for section in sections:
+        section["chapters"] = [chapter for _ in section.pop("passages") for chapter in next(chapters)]
+
+    payload = {"translation": translation, "sections": sections}
+    if plan:
+        payload = {"plan_id": plan, "plan_name": reading_plan["name"], "day": day,
+                   "total_days": reading_plan["duration_days"], **payload}
+    return FastJSONResponse(payload)
 
 
 @app.get("/api/devotional")
@@ -562,52 +702,42 @@ async def get_devotional(
         month = int(parts[0])
         day = int(parts[1])
 
-    conn = get_db_connection()
-    try:
-        if time_of_day:
-            cursor = conn.execute("""
-                SELECT source, month, day, time_of_day, title, verse_ref, content
-                FROM devotionals
-                WHERE month = ? AND day = ? AND time_of_day = ?
-                ORDER BY source
-            """, (month, day, time_of_day))
-        else:
-            cursor = conn.execute("""
-                SELECT source, month, day, time_of_day, title, verse_ref, content
-                FROM devotionals
-                WHERE month = ? AND day = ?
-                ORDER BY time_of_day DESC, source
-            """, (month, day))
-
-        entries = cursor.fetchall()
-        if not entries:
-            raise HTTPException(status_code=404, detail=f"No devotional for: {month:02d}-{day:02d}")
-
-        return {
-            "date": f"{month:02d}-{day:02d}",
-            "month": month,
-            "day": day,
-            "entries": [dict(e) for e in entries]
-        }
-    finally:
-        conn.close()
+    if time_of_day:
+        entries = await db.fetch_dicts("""
+            SELECT source, month, day, time_of_day, title, verse_ref, content
+            FROM devotionals
+            WHERE month = ? AND day = ? AND time_of_day = ?
+            ORDER BY source
+        """, (month, day, time_of_day))
+    else:
+        entries = await db.fetch_dicts("""
+            SELECT source, month, day, time_of_day, title, verse_ref, content
+            FROM devotionals
+            WHERE month = ? AND day = ?
+            ORDER BY time_of_day DESC, source
+        """, (month, day))
+
+    if not entries:
+        raise HTTPException(status_code=404, detail=f"No devotional for: {month:02d}-{day:02d}")
+
+    return FastJSONResponse({
+        "date": f"{month:02d}-{day:02d}",
+        "month": month,
+        "day": day,
+        "entries": entries
+    })
 
 
 @app.get("/api/devotional/sources")
 async def get_devotional_sources():
     """Get available devotional sources and their entry counts."""
-    conn = get_db_connection()
-    try:
-        cursor = conn.execute("""
-            SELECT source, COUNT(*) as entry_count
-            FROM devotionals
-            GROUP BY source
-            ORDER BY source
-        """)
-        sources = [dict(row) for row in cursor.fetchall()]
-        return {"sources": sources}
-    finally:
-        conn.close()
+    sources = await db.fetch_dicts("""
+        SELECT source, COUNT(*) as entry_count
+        FROM devotionals
+        GROUP BY source
+        ORDER BY source
+    """)
+    return FastJSONResponse({"sources": sources})
 
 
 # ========== READING PLAN ENDPOINTS ==========
@@ -636,20 +766,363 @@ async def get_reading_plans():
 @app.get("/api/reading-plans/{plan_id}")
 async def get_reading_plan(plan_id: str):
     """Get full reading plan with all days."""
-    import json
-    data_path = Path(__file__).parent.parent / "data"
-    plan_file = data_path / f"reading-plan-{plan_id.replace('chronological-year', 'chronological')}.json"
-
-    if not plan_file.exists():
-        raise HTTPException(status_code=404, detail=f"Reading plan not found: {plan_id}")
-
-    with open(plan_file) as f:
-        return json.load(f)
+    return load_reading_plan(plan_id)
 
 
 @app.get("/api/reading-plans/{plan_id}/day/{day}")
 async def get_reading_plan_day(plan_id: str, day: int):
     """Get a specific day's reading from a plan."""
+    plan = load_reading_plan(plan_id)
+    return {
+        "plan_id": plan_id,
+        "plan_name": plan["name"],
+        "day": day,
+        "total_days": plan["duration_days"],
+        "readings": reading_plan_day(plan, day)
+    }
+
+
+# Helper functions
+
+def parse_reference(reference: str) -> Optional[tuple]:
+    """
+    Parse a Bible reference into (book, chapter, verse_start, verse_end, has_verse)
+    for the single-chapter routes. Returns None if invalid.
+    has_verse indicates whether a specific verse was requested (for highlighting).
+    A bare book name means its first chapter; a list or a passage spanning
+    chapters is a 400 pointing at /api/passages rather than a partial answer.
+    """
+    passages = parse_references(reference)
+    if not passages:
+        return None
+    passage = passages[0]
+    whole_book = not passage.has_verse and passage.end_chapter == MAX_CHAPTER
+    if len(passages) > 1 or (passage.end // 1000 != passage.start // 1000
+                             and not (whole_book and passage.book == passage.end_book)):
+        raise HTTPException(
+            status_code=400,
+            detail=f"{reference} covers more than one chapter; use /api/passages?refs= for lists and ranges"
+        )
+    if not passage.has_verse:
+        return (passage.book, passage.chapter, 1, 999, False)
+    return (passage.book, passage.chapter, passage.verse_start, passage.verse_end, True)
+
+
+def chapter_key_range(book: str, chapter: int) -> tuple:
+    """First and last verse keys of a chapter (unknown books give an empty range)."""
+    order = BOOK_ORDER.get(book, 0)
+    return verse_key(order, chapter, 0), verse_key(order, chapter, 999)
+
+
+def book_key_range(book: str) -> tuple:
+    """First and last verse keys of a book."""
+    order = BOOK_ORDER.get(book, 0)
+    return verse_key(order, 0, 0), verse_key(order, 999, 999)
+
+
+# Interlinear word columns (word_alignments a, lexicon l): the original text
+# with its gloss; strong_canonical matches the lexicon keys, and word_id gives
+# a deterministic English word alignment
+INTERLINEAR_COLUMNS = """a.verse, a.word_position as position, a.hebrew_text as original_text,
+               a.book || '.' || a.chapter || '.' || a.verse || '.' || a.word_position as word_id,
+               a.strong_canonical as strong_number,
+               a.grammar as parsing,
+               a.english_gloss as translation,
+               l.original as lexeme,
+               COALESCE(NULLIF(a.transliteration, ''), l.transliteration) as transliteration,
+               l.pronunciation,
+               l.definition,
+               l.extended_definition,
+               l.language"""
+
+
+def group_interlinear(book: str, rows: list) -> tuple:
+    """(language, {verse: [words]}) from a chapter's INTERLINEAR_COLUMNS rows."""
+    verses_data = {}
+    language = None
+    for word_data in rows:
+        verse_num = word_data.pop('verse')  # Remove verse from individual word
+        if verse_num not in verses_data:
+            verses_data[verse_num] = []
+        verses_data[verse_num].append(word_data)
+        if not language and word_data.get('language'):
+            language = word_data['language']
+
+    # Fallback language detection based on testament
+    if not language and verses_data:
+        language = 'hebrew' if book in OT_BOOKS else 'greek' if book == 'Matthew' else None
+    return language, verses_data
+
+
+# Cross-reference columns decoded from the (source_key, target_key) index
+CROSSREF_COLUMNS = """x.source_key % 1000 as source_verse, tb.name as target_book,
+               x.target_key / 1000 % 1000 as target_chapter,
+               x.target_key % 1000 as target_verse"""
+
+
+# Occurrences of a Strong's number after a (verse_key, position) cursor, in
+# canonical order: a single range of idx_words_strong_key
+WORD_OCCURRENCES_SQL = """
+        SELECT b.name as book, w.verse_key / 1000 % 1000 as chapter,
+               w.verse_key % 1000 as verse, w.position, w.translation
+        FROM words w
+        JOIN books b ON b.book_order = w.verse_key / 1000000
+        WHERE w.strong_number = ? AND (w.verse_key, w.position) > (?, ?)
+        ORDER BY w.verse_key, w.position"""
+
+async def get_word_books(strong_number: str) -> list:
+    """Occurrences of a Strong's number per book, in canonical order (precomputed)."""
+    return await db.fetch_dicts("""
+        SELECT b.name as book, c.count
+        FROM word_book_counts c
+        JOIN books b ON b.book_order = c.book_order
+        WHERE c.strong_number = ?
+        ORDER BY c.book_order
+    """, (strong_number,))
+
+
+SEARCH_OPERATORS = ("AND", "OR", "NOT")
+
+
+def normalize_search_query(q: str) -> str:
+    """
+    Canonical form of a search query for the result cache: single spaces and
+    lower case (FTS5 matching is case-insensitive), keeping the upper-case
+    AND/OR/NOT/NEAR operators, which are case-sensitive.
+    """
+    return " ".join(
+        word if word in SEARCH_OPERATORS or word.startswith("NEAR(") else word.lower()
+        for word in q.split()
+    )
+
+
+async def suggest_index():
+    """
+    The /api/suggest prefix index for the current data version, built on first
+    use and rebuilt when the version changes; concurrent requests share one build.
+    """
+    version = await db.data_version()
+    return cached_suggest_index(version) or await suggest_flight.run(
+        version, lambda: db.run(load_suggest_index, version, BOOK_ALIASES)
+    )
+
+
+async def search_payload(q: str, scope: str, translation: str, mode: str, limit: int,
+                         after: Optional[tuple], cursor: Optional[str]) -> dict:
+    """
+    One page of /api/search results for a normalized query, without the
+    echoed query: verse and commentary hits, next_cursor and, on the first
+    page, totals and facets.
+    """
+    import re
+
+    results = []
+    first_page = after is None
+
+    # Check if this is a Strong's number search (G### or H###)
+    strongs_match = re.match(r'^([GH])(\d+)$', q, re.IGNORECASE)
+    if strongs_match:
+        prefix = strongs_match.group(1).upper()
+        number = strongs_match.group(2)
+        strongs_num = f"{prefix}{number}"
+        if after is not None and after[0] != "verse":
+            raise HTTPException(status_code=400, detail=f"Cursor does not match scope: {cursor}")
+
+        # Get the lexicon entry for this Strong's number
+        lex_row = await db.fetch_one("""
+            SELECT original, transliteration, definition
+            FROM lexicon
+            WHERE strong_number = ?
+        """, (strongs_num,))
+        word_info = None
+        if lex_row:
+            word_info = {
+                "strong_number": strongs_num,
+                "original": lex_row["original"],
+                "transliteration": lex_row["transliteration"],
+                "definition": lex_row["definition"]
+            }
+
+        # Verses with this Strong's number in canonical order, including the
+        # original word; a page is one range of idx_words_strong_key
+        rows = await db.fetch_dicts("""
+            SELECT 'verse' as type, v.book, v.chapter, v.verse,
+                   v.text as snippet, w.text as original_word,
+                   w.translation as gloss,
+                   w.verse_key as sort_key, w.position as sort_id
+            FROM words w
+            JOIN verses v ON w.verse_id = v.id
+            WHERE w.strong_number = ? AND (w.verse_key, w.position) > (?, ?)
+            ORDER BY w.verse_key, w.position
+            LIMIT ?
+        """, (strongs_num, *(after[1:] if after else (0, 0)), limit + 1))
+        page_cursor = page_search_rows(rows, limit)
+        next_cursor = {"verse": page_cursor} if page_cursor else {}
+
+        for result in rows:
+            # Highlight the translated word in the snippet if we have a gloss
+            if result.get("gloss"):
+                gloss = result["gloss"]
+                snippet = result["snippet"]
+                # Try to highlight the gloss word in the verse text
+                import re as regex
+                pattern = regex.compile(r'\b(' + regex.escape(gloss) + r')\b', regex.IGNORECASE)
+                result["snippet"] = pattern.sub(r'<mark>\1</mark>', snippet, count=1)
+            results.append(result)
+
+        response = {"scope": scope, "results": results, "word_info": word_info, "next_cursor": next_cursor}
+        if first_page:
+            # Precomputed by the concordance build, so free for any word
+            books = await get_word_books(strongs_num)
+            response["totals"] = {"verse": sum(b["count"] for b in books)}
+            response["facets"] = book_facets(books)
+        return response
+
+    # Check if searching within a specific book
+    book_filter = None
+    testament_filter = None
+    if scope.startswith("book:"):
+        book_filter = scope[5:]
+        scope = "bible"
+    elif scope == "ot":
+        testament_filter = OT_BOOKS
+        scope = "bible"
+    elif scope == "nt":
+        testament_filter = NT_BOOKS
+        scope = "bible"
+
+    # Build FTS query - handle phrase search with quotes
+    fts_query = q
+    if '"' in q:
+        # FTS5 handles quoted phrases natively
+        pass
+    else:
+        # Add wildcard for partial matching on last word
+        words = q.split()
+        if words:
+            words[-1] = words[-1] + '*'
+            fts_query = ' '.join(words)
+
+    fuzzy = None
+    if mode == "fuzzy":
+        if not await table_exists("search_vocabulary"):
+            raise HTTPException(status_code=400,
+                                detail="Fuzzy search is not available: run scripts/build_search_index.py")
+        # Each word becomes its closest indexed terms, so the regular indexes answer it
+        expansions = await db.run(expand_query, q)
+        if not expansions:
+            raise HTTPException(status_code=400, detail=f"Nothing to search for: {q}")
+        fts_query = fuzzy_fts_query(expansions)
+        fuzzy = {"mode": mode, "expansions": expansions, "did_you_mean": did_you_mean(expansions)}
+
+    # Result types on this page: both on the first page of scope=all, only
+    # the cursor's type on later pages
+    types = {"all": ("verse", "commentary"), "bible": ("verse",), "commentary": ("commentary",)}.get(scope, ())
+    if after is not None:
+        if after[0] not in types:
+            raise HTTPException(status_code=400, detail=f"Cursor does not match scope: {cursor}")
+        types = (after[0],)
+
+    # Relevance order, with rowid as the tie-breaker that makes it a total order
+    keyset = ""
+    keyset_params = ()
+    if after is not None:
+        keyset = "AND (rank, rowid) > (?, ?)"
+        keyset_params = after[1:]
+
+    queries = {}
+    if "verse" in types:
+        fts = verses_fts_table(translation)
+        if fts is None or not await table_exists(fts):
+            raise HTTPException(status_code=404, detail=f"No search index for translation: {translation}")
+        # Index rowids are verse keys, so a book or testament is one rowid
+        # range that FTS5 applies while reading the postings
+        match = f"{fts} MATCH ?"
+        match_params = (fts_query,)
+        if book_filter:
+            match += " AND rowid BETWEEN ? AND ?"
+            match_params += book_key_range(book_filter)
+        elif testament_filter:
+            match += " AND rowid BETWEEN ? AND ?"
+            match_params += (book_key_range(testament_filter[0])[0],
+                             book_key_range(testament_filter[-1])[1])
+
+        queries["verse"] = db.fetch_dicts(f"""
+            SELECT 'verse' as type, book, chapter, verse,
+                   snippet({fts}, 0, '<mark>', '</mark>', '...', 32) as snippet,
+                   rank as sort_key, rowid as sort_id
+            FROM {fts}
+            WHERE {match} {keyset}
+            ORDER BY rank, rowid
+            LIMIT ?
+        """, (*match_params, *keyset_params, limit + 1))
+        if first_page:
+            # Every hit's book in one pass over the index alone; the total is their sum
+            queries["facets"] = db.fetch_dicts(f"""
+                SELECT rowid / 1000000 as book_order, COUNT(*) as count
+                FROM {fts}
+                WHERE {match}
+                GROUP BY 1
+                ORDER BY 1
+            """, match_params)
+
+    if "commentary" in types:
+        queries["commentary"] = db.fetch_dicts(f"""
+            SELECT 'commentary' as type, source, book, chapter,
+                   snippet(commentary_fts, 0, '<mark>', '</mark>', '...', 32) as snippet,
+                   rank as sort_key, rowid as sort_id
+            FROM commentary_fts
+            WHERE commentary_fts MATCH ? {keyset}
+            ORDER BY rank, rowid
+            LIMIT ?
+        """, (fts_query, *keyset_params, limit + 1))
+        if first_page:
+            queries["commentary_total"] = db.fetch_one("""
+                SELECT COUNT(*) FROM commentary_fts WHERE commentary_fts MATCH ?
+            """, (fts_query,))
+
+    if fuzzy is not None and first_page and len(fuzzy["expansions"]) == 1:
+        # A single word may also be a misspelled transliteration ("agapee")
+        queries["words"] = db.run(similar_lexicon_words, next(iter(fuzzy["expansions"])))
+
+    # Pages and counts run concurrently on the DB workers
+    done = dict(zip(queries, await asyncio.gather(*queries.values())))
+
+    next_cursor = {}
+    for result_type in ("verse", "commentary"):
+        if result_type in done:
+            rows = done[result_type]
+            page_cursor = page_search_rows(rows, limit)
+            if page_cursor:
+                next_cursor[result_type] = page_cursor
+            results.extend(rows)
+
+    response = {"scope": scope, "translation": translation, "results": results,
+                "next_cursor": next_cursor}
+    if first_page:
+        all_books = OT_BOOKS + NT_BOOKS
+        books = [{"book": all_books[row["book_order"] - 1], "count": row["count"]}
+                 for row in done.get("facets", [])]
+        totals = {}
+        if "verse" in done:
+            totals["verse"] = sum(b["count"] for b in books)
+            response["facets"] = book_facets(books)
+        if "commentary" in done:
+            totals["commentary"] = done["commentary_total"][0]
+        response["totals"] = totals
+    if fuzzy is not None:
+        response.update(fuzzy)
+        if "words" in done:
+            response["words"] = done["words"]
+    elif first_page and not any(response["totals"].values()) and await table_exists("search_vocabulary"):
+        suggestion = await db.run(suggest_query, q)
+        if suggestion:
+            response["did_you_mean"] = suggestion
+    return response
+
+
+def load_reading_plan(plan_id: str) -> dict:
+    """A reading plan from data/reading-plan-*.json; 404 if there is none."""
     import json
     data_path = Path(__file__).parent.parent / "data"
     plan_file = data_path / f"reading-plan-{plan_id.replace('chronological-year', 'chronological')}.json"
@@ -658,104 +1131,370 @@ async def get_reading_plan_day(plan_id: str, day: int):
         raise HTTPException(status_code=404, detail=f"Reading plan not found: {plan_id}")
 
     with open(plan_file) as f:
-        plan = json.load(f)
+        return json.load(f)
+
 
-    # Find the day
+def reading_plan_day(plan: dict, day: int) -> dict:
+    """One day's readings from a plan; 404 if the plan has no such day."""
     for d in plan["days"]:
         if d["day"] == day:
-            return {
-                "plan_id": plan_id,
-                "plan_name": plan["name"],
-                "day": day,
-                "total_days": plan["duration_days"],
-                "readings": d
-            }
-
+            return d
     raise HTTPException(status_code=404, detail=f"Day {day} not found in plan")
 
 
-# Helper functions
+async def table_exists(name: str) -> bool:
+    """Whether the database has a table (or virtual table) called `name`."""
+    return await db.fetch_one(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (name,)
+    ) is not None
 
-def parse_reference(reference: str) -> Optional[tuple]:
+
+def parse_search_cursor(cursor: Optional[str]) -> Optional[tuple]:
+    """(result type, sort key, row id) from a search `next_cursor` value, or None."""
+    if cursor is None:
+        return None
+    try:
+        result_type, sort_key, row_id = cursor.split(":")
+        if result_type not in ("verse", "commentary"):
+            raise ValueError(result_type)
+        return result_type, float(sort_key), int(row_id)
+    except ValueError:
+        raise HTTPException(status_code=400, detail=f"Invalid cursor: {cursor}")
+
+
+def page_search_rows(rows: list, limit: int) -> Optional[str]:
     """
-    Parse a Bible reference into (book, chapter, verse_start, verse_end, has_verse).
-    Returns None if invalid.
-    has_verse indicates whether a specific verse was requested (for highlighting).
+    Trim a page fetched with `limit + 1` rows, strip the sort columns and
+    return the cursor for the next page (None on the last page).
     """
-    import re
-
-    # Book name abbreviations
-    abbrevs = {
-        "gen": "Genesis", "ex": "Exodus", "lev": "Leviticus", "num": "Numbers",
-        "deut": "Deuteronomy", "josh": "Joshua", "judg": "Judges", "ruth": "Ruth",
-        "1sam": "1 Samuel", "2sam": "2 Samuel", "1kgs": "1 Kings", "2kgs": "2 Kings",
-        "1chr": "1 Chronicles", "2chr": "2 Chronicles", "ezra": "Ezra", "neh": "Nehemiah",
-        "esth": "Esther", "job": "Job", "ps": "Psalms", "prov": "Proverbs",
-        "eccl": "Ecclesiastes", "song": "Song of Solomon", "isa": "Isaiah",
-        "jer": "Jeremiah", "lam": "Lamentations", "ezek": "Ezekiel", "dan": "Daniel",
-        "hos": "Hosea", "joel": "Joel", "amos": "Amos", "obad": "Obadiah",
-        "jonah": "Jonah", "mic": "Micah", "nah": "Nahum", "hab": "Habakkuk",
-        "zeph": "Zephaniah", "hag": "Haggai", "zech": "Zechariah", "mal": "Malachi",
-        "matt": "Matthew", "mk": "Mark", "lk": "Luke", "jn": "John",
-        "acts": "Acts", "rom": "Romans", "1cor": "1 Corinthians", "2cor": "2 Corinthians",
-        "gal": "Galatians", "eph": "Ephesians", "phil": "Philippians", "col": "Colossians",
-        "1thess": "1 Thessalonians", "2thess": "2 Thessalonians",
-        "1tim": "1 Timothy", "2tim": "2 Timothy", "titus": "Titus", "phlm": "Philemon",
-        "heb": "Hebrews", "jas": "James", "1pet": "1 Peter", "2pet": "2 Peter",
-        "1jn": "1 John", "2jn": "2 John", "3jn": "3 John", "jude": "Jude", "rev": "Revelation"
+    cursor = None
+    if len(rows) > limit:
+        del rows[limit:]
+        last = rows[-1]
+        cursor = f"{last['type']}:{last['sort_key']!r}:{last['sort_id']}"
+    for row in rows:
+        del row["sort_key"], row["sort_id"]
+    return cursor
+
+
+def book_facets(books: list) -> dict:
+    """Facets from per-book counts ({"book", "count"} in canonical order): books and testaments."""
+    ot_count = sum(b["count"] for b in books if BOOK_ORDER.get(b["book"], 0) <= len(OT_BOOKS))
+    return {
+        "books": books,
+        "testaments": {"OT": ot_count, "NT": sum(b["count"] for b in books) - ot_count},
     }
 
-    # Pattern: Book Chapter:Verse(-Verse)? or just Book (defaults to ch 1)
-    pattern = r'^(\d?\s*\w+)(?:\s+(\d+))?(?::(\d+)(?:-(\d+))?)?$'
-    match = re.match(pattern, reference.strip(), re.IGNORECASE)
 
-    if not match:
-        return None
+def parse_occurrence_cursor(cursor: Optional[str]) -> tuple:
+    """(verse_key, position) to continue after, from a `next_cursor` value."""
+    if cursor is None:
+        return (0, 0)
+    try:
+        key, position = cursor.split(".")
+        return int(key), int(position)
+    except ValueError:
+        raise HTTPException(status_code=400, detail=f"Invalid cursor: {cursor}")
 
-    # If no chapter specified, default to chapter 1
-    if match.group(2) is None:
-        book_raw = match.group(1)
-        book_key = book_raw.lower().replace(" ", "")
-        book = abbrevs.get(book_key, book_raw.title())
-        return (book, 1, 1, 999, False)
 
-    book_raw, chapter, verse_start, verse_end = match.groups()
+def occurrence_cursor(occurrence: dict) -> str:
+    """Cursor pointing just past `occurrence`: "<verse_key>.<position>"."""
+    key = verse_key(BOOK_ORDER[occurrence["book"]], occurrence["chapter"], occurrence["verse"])
+    return f"{key}.{occurrence['position']}"
 
-    # Normalize book name
-    book_key = book_raw.lower().replace(" ", "")
-    book = abbrevs.get(book_key, book_raw.title())
 
-    chapter = int(chapter)
-    has_verse = verse_start is not None
-    verse_start = int(verse_start) if verse_start else 1
-    verse_end = int(verse_end) if verse_end else (verse_start if has_verse else 999)
+def write_word_occurrences(conn, emit, header: dict, strong_number: str, after: tuple,
+                           batch: int = 1000):
+    """Emit a header line, then every occurrence after `after` as NDJSON, `batch` lines per chunk."""
+    emit(dumps(header) + b"\n")
+    cursor = conn.execute(WORD_OCCURRENCES_SQL, (strong_number, *after))
+    cursor.row_factory = None
+    names = [column[0] for column in cursor.description]
+    while rows := cursor.fetchmany(batch):
+        emit(b"".join(dumps(dict(zip(names, row))) + b"\n" for row in rows))
 
-    return (book, chapter, verse_start, verse_end, has_verse)
 
+async def get_chapter(book: str, chapter: int, translation: str) -> Optional[dict]:
+    """
+    Get the assembled chapter payload (verses, all cross-references and
+    red-letter verses), served from the in-process chapter cache when possible.
+    Returns None if the chapter doesn't exist. Callers must not mutate the result.
+    """
+    key = (book, chapter, translation)
+    version = await db.data_version()
+    cached = chapter_cache.get(key, version)
+    if cached is not None:
+        return cached
+
+    verses = await db.fetch_dicts("""
+        SELECT v.id, v.book, v.chapter, v.verse, v.text,
+               GROUP_CONCAT(w.id) as word_ids
+        FROM verses v
+        LEFT JOIN words w ON w.verse_id = v.id
+        WHERE v.translation_id = ? AND v.verse_key BETWEEN ? AND ?
+        GROUP BY v.id
+        ORDER BY v.verse_key
+    """, (translation, *chapter_key_range(book, chapter)))
+    if not verses:
+        return None
 
-def get_cross_references(conn, book: str, chapter: int, verse_start: int, verse_end: int) -> list:
-    """Get cross-references for a passage."""
-    cursor = conn.execute("""
-        SELECT source_verse, target_book, target_chapter, target_verse, relationship_type
-        FROM cross_references
-        WHERE source_book = ? AND source_chapter = ?
-              AND source_verse BETWEEN ? AND ?
-        ORDER BY target_book_order, target_chapter, target_verse
-    """, (book, chapter, verse_start, verse_end))
+    chapter_data = {
+        "verses": verses,
+        "cross_references": await get_cross_references(book, chapter, 1, 999),
+        "speaker_verses": await get_speaker_verses(book, chapter)
+    }
+    chapter_cache.put(key, chapter_data, version)
+    return chapter_data
+
+
+def passage_ranges_sql(count: int) -> str:
+    """WITH clause binding `count` (part, lo, hi) verse-key ranges as the table parts."""
+    return f"WITH parts(part, lo, hi) AS (VALUES {', '.join('(?, ?, ?)' for _ in range(count))})"
 
-    return [dict(r) for r in cursor.fetchall()]
 
+async def get_verse_texts(refs: list, translation: str) -> dict:
+    """
+    {canonical reference: text} for every passage in `refs`, from one query
+    over all their verse-key ranges. A passage gives at most the first
+    VERSE_PREVIEW_MAX verses of its first chapter; one with no verses in
+    the translation is left out.
+    """
+    passages = []
+    for ref in refs:
+        parsed = parse_references(ref)
+        if not parsed:
+            raise HTTPException(status_code=400, detail=f"Invalid reference: {ref}")
+        passages.extend(parsed)
+    passages = list(dict.fromkeys(passages))
+    if not passages:
+        return {}
+    if len(passages) > VERSES_MAX_REFS:
+        raise HTTPException(status_code=400,
+                            detail=f"Too many references (at most {VERSES_MAX_REFS})")
+
+    # Cut each range to its first chapter so no reference scans a whole book
+    bounds = [n for part, passage in enumerate(passages)
+              for n in (part, passage.start, min(passage.end, passage.start // 1000 * 1000 + 999))]
+    rows = await db.fetch_all(f"""
+        {passage_ranges_sql(len(passages))}
+        SELECT p.part, v.text
+        FROM parts p
+        JOIN verses v ON v.translation_id = ? AND v.verse_key BETWEEN p.lo AND p.hi
+        ORDER BY p.part, v.verse_key
+    """, (*bounds, translation))
+
+    texts = {}
+    for part, text in rows:
+        verses = texts.setdefault(part, [])
+        if len(verses) < VERSE_PREVIEW_MAX:
+            verses.append(text)
+    return {str(passages[part]): " ".join(verses) for part, verses in texts.items()}
+
+
+async def get_passage_chapters(passages: list, translation: str, include: set) -> list:
+    """
+    The chapters each passage covers, as a list per passage. A chapter holds
+    the passage's verses in it, their cross-references and red-letter verses,
+    and "commentary" and "interlinear" if included. Each data type is one
+    query joining every passage's verse-key range (indexed range scans).
+    """
+    if not passages:
+        return []
+    # A whole chapter also picks up commentary keyed to its verse 0
+    bounds = [n for part, passage in enumerate(passages)
+              for n in (part, passage.start if passage.has_verse else passage.start - 1, passage.end)]
+    parts = passage_ranges_sql(len(passages))
+
+    async def speaker_rows():
+        try:
+            return await db.fetch_all(f"""
+                {parts}
+                SELECT p.part, s.verse_key
+                FROM parts p
+                JOIN speaker_verses s ON s.verse_key BETWEEN p.lo AND p.hi AND s.is_divine = 1
+                ORDER BY p.part, s.verse_key
+            """, bounds)
+        except sqlite3.OperationalError:
+            # Table doesn't exist yet
+            return []
+
+    async def nothing():
+        return []
+
+    # The capped verse query runs first, so an oversized request ("Gen 1-Rev 22")
+    # is rejected before the side queries scan its whole key span
+    verses = await db.fetch_dicts(f"""
+        {parts}
+        SELECT p.part, v.verse_key, v.id, v.book, v.chapter, v.verse, v.text,
+               GROUP_CONCAT(w.id) as word_ids
+        FROM parts p
+        JOIN verses v ON v.translation_id = ? AND v.verse_key BETWEEN p.lo AND p.hi
+        LEFT JOIN words w ON w.verse_id = v.id
+        GROUP BY p.part, v.id
+        ORDER BY p.part, v.verse_key
+        LIMIT ?
+    """, (*bounds, translation, PASSAGES_MAX_VERSES + 1))
+    if len(verses) > PASSAGES_MAX_VERSES:
+        raise HTTPException(status_code=400,
+                            detail=f"Too many verses requested (at most {PASSAGES_MAX_VERSES:,})")
+
+    cross_refs, speakers, commentary, interlinear = await asyncio.gather(
+        db.fetch_dicts(f"""
+            {parts}
+            SELECT p.part, x.source_key / 1000 as chapter_key, {CROSSREF_COLUMNS}, x.relationship_type
+            FROM parts p
+            JOIN cross_references x ON x.source_key BETWEEN p.lo AND p.hi
+            JOIN books tb ON tb.book_order = x.target_key / 1000000
+            ORDER BY p.part, x.source_key / 1000, x.target_key
+        """, bounds),
+        speaker_rows(),
+        db.fetch_dicts(f"""
+            {parts}
+            SELECT p.part, c.start_key / 1000 as chapter_key,
+                   c.source, c.content, c.reference_start, c.reference_end
+            FROM parts p
+            JOIN commentary_entries c ON c.start_key BETWEEN p.lo / 1000 * 1000 AND p.hi
+                                     AND c.end_key >= p.lo
+            ORDER BY p.part, c.start_key, c.source
+        """, bounds) if "commentary" in include else nothing(),
+        db.fetch_dicts(f"""
+            {parts}
+            SELECT p.part, a.verse_key / 1000 as chapter_key, {INTERLINEAR_COLUMNS}
+            FROM parts p
+            JOIN word_alignments a ON a.verse_key BETWEEN p.lo AND p.hi
+            LEFT JOIN lexicon l ON l.strong_number = a.strong_canonical
+            ORDER BY p.part, a.verse_key, a.word_position
+        """, bounds) if "interlinear" in include else nothing(),
+    )
+
+    # {(part, chapter key): chapter}, in passage then canonical order
+    chapters = {}
+    for verse in verses:
+        key = (verse.pop("part"), verse.pop("verse_key") // 1000)
+        chapter = chapters.get(key)
+        if chapter is None:
+            chapter = chapters[key] = {
+                "book": verse["book"], "chapter": verse["chapter"],
+                "verses": [], "cross_references": [], "speaker_verses": [],
+            }
+            if "commentary" in include:
+                chapter["commentary"] = []
+        chapter["verses"].append(verse)
+    for row in cross_refs:
+        chapter = chapters.get((row.pop("part"), row.pop("chapter_key")))
+        if chapter is not None:
+            chapter["cross_references"].append(row)
+    for part, key in speakers:
+        chapter = chapters.get((part, key // 1000))
+        if chapter is not None:
+            chapter["speaker_verses"].append(key % 1000)
+    for row in commentary:
+        chapter = chapters.get((row.pop("part"), row.pop("chapter_key")))
+        if chapter is not None:
+            chapter["commentary"].append(row)
+    if "interlinear" in include:
+        words = {}
+        for row in interlinear:
+            words.setdefault((row.pop("part"), row.pop("chapter_key")), []).append(row)
+        for key, chapter in chapters.items():
+            language, verses_data = group_interlinear(chapter["book"], words.get(key, []))
+            chapter["interlinear"] = {"language": language, "verses": verses_data}
+
+    result = [[] for _ in passages]
+    for (part, _), chapter in chapters.items():
+        verses = chapter["verses"]
+        reference = f"{chapter['book']} {chapter['chapter']}"
+        if passages[part].has_verse:
+            first, last = verses[0]["verse"], verses[-1]["verse"]
+            reference += f":{first}" if first == last else f":{first}-{last}"
+        result[part].append({"reference": reference, **chapter})
+    return result
+
+
+async def get_cross_references(book: str, chapter: int, verse_start: int, verse_end: int,
+                               text_translation: Optional[str] = None,
+                               min_votes: Optional[int] = None, top: Optional[int] = None,
+                               sort: str = "canonical", by_source: bool = False) -> list:
+    """
+    Get cross-references for a passage. With `text_translation`, each also
+    carries its target verse's text (target_text) from the same query.
 
-def get_speaker_verses(conn, book: str, chapter: int) -> list:
+    Ranking by votes (min_votes, each source verse's `top` best-voted, or
+    sort="votes") reads idx_crossref_votes and adds each reference's votes.
+    `by_source` orders by source verse first.
+    """
+    first_key, _ = chapter_key_range(book, chapter)
+    first, last = first_key + verse_start, first_key + verse_end
+    text_column, text_join, text_params = "", "", ()
+    if text_translation:
+        text_column = ", tv.text as target_text"
+        text_join = "LEFT JOIN verses tv ON tv.translation_id = ? AND tv.verse_key = x.target_key"
+        text_params = (text_translation,)
+    order = "x.votes DESC, x.target_key" if sort == "votes" else "x.target_key"
+    if by_source:
+        order = f"x.source_key, {order}"
+
+    if min_votes is None and top is None and sort != "votes":
+        # Every cross_references column is derived from idx_crossref_key, so
+        # the scan never touches the table rows
+        return await db.fetch_dicts(f"""
+            SELECT {CROSSREF_COLUMNS}, x.relationship_type{text_column}
+            FROM cross_references x
+            JOIN books tb ON tb.book_order = x.target_key / 1000000
+            {text_join}
+            WHERE x.source_key BETWEEN ? AND ?
+            ORDER BY {order}
+        """, (*text_params, first, last))
+
+    votes_filter, votes_params = "", ()
+    if min_votes is not None:
+        # Unqualified: only cross_references has a votes column
+        votes_filter, votes_params = "AND votes >= ?", (min_votes,)
+    if top is None:
+        return await db.fetch_dicts(f"""
+            SELECT {CROSSREF_COLUMNS}, x.relationship_type, x.votes{text_column}
+            FROM cross_references x
+            JOIN books tb ON tb.book_order = x.target_key / 1000000
+            {text_join}
+            WHERE x.source_key BETWEEN ? AND ? {votes_filter}
+            ORDER BY {order}
+        """, (*text_params, first, last, *votes_params))
+
+    # Top-K per source verse as bounded index scans: step from one source
+    # verse to the next with a MIN() seek, then read the first `top` entries
+    # of that verse's range of idx_crossref_votes (votes descending)
+    return await db.fetch_dicts(f"""
+        WITH RECURSIVE sources(key) AS (
+            SELECT MIN(source_key) FROM cross_references WHERE source_key BETWEEN ? AND ?
+            UNION ALL
+            SELECT (SELECT MIN(source_key) FROM cross_references
+                    WHERE source_key > sources.key AND source_key <= ?)
+            FROM sources WHERE sources.key IS NOT NULL
+        )
+        SELECT {CROSSREF_COLUMNS}, x.relationship_type, x.votes{text_column}
+        FROM sources s
+        JOIN cross_references x ON x.rowid IN (
+            SELECT rowid FROM cross_references
+            WHERE source_key = s.key {votes_filter}
+            ORDER BY votes DESC, target_key
+            LIMIT ?
+        )
+        JOIN books tb ON tb.book_order = x.target_key / 1000000
+        {text_join}
+        ORDER BY {order}
+    """, (first, last, last, *votes_params, top, *text_params))
+
+
+async def get_speaker_verses(book: str, chapter: int) -> list:
     """Get verses with divine speech (God in OT, Jesus in NT) for red-letter display."""
     try:
-        cursor = conn.execute("""
-            SELECT verse, speaker
+        rows = await db.fetch_all("""
+            SELECT verse_key % 1000 as verse
             FROM speaker_verses
-            WHERE book = ? AND chapter = ? AND is_divine = 1
-            ORDER BY verse
-        """, (book, chapter))
-        return [row[0] for row in cursor.fetchall()]
+            WHERE verse_key BETWEEN ? AND ? AND is_divine = 1
+            ORDER BY verse_key
+        """, chapter_key_range(book, chapter))
+        return [row[0] for row in rows]
     except sqlite3.OperationalError:
         # Table doesn't exist yet
         return []
@@ -773,92 +1512,77 @@ async def get_chapter_offline_data(
     Get all data needed for offline access to a chapter.
     Includes verses, alignments, interlinear, cross-refs, and commentary.
     """
-    conn = get_db_connection()
-    try:
-        # Get verses
-        cursor = conn.execute("""
-            SELECT verse, text FROM verses
-            WHERE book = ? AND chapter = ? AND translation_id = ?
-            ORDER BY verse
-        """, (book, chapter, translation))
-        verses = [dict(v) for v in cursor.fetchall()]
-
-        # Get word alignments for this chapter (BSB only has deterministic alignments)
-        cursor = conn.execute("""
-            SELECT e.verse, e.english_word_position as position,
-                   e.english_word as word, e.original_word_position,
-                   w.hebrew_text as original_text, w.transliteration,
-                   w.english_gloss as gloss, w.strong_number, w.grammar,
-                   l.definition, l.extended_definition, l.language
-            FROM english_word_alignments e
-            JOIN word_alignments w ON w.book = e.book AND w.chapter = e.chapter
-                 AND w.verse = e.verse AND w.word_position = e.original_word_position
-            LEFT JOIN lexicon l ON l.strong_number = CASE
-                WHEN w.strong_number LIKE 'H0%' THEN 'H' || CAST(CAST(SUBSTR(w.strong_number, 2) AS INTEGER) AS TEXT)
-                WHEN w.strong_number LIKE 'G0%' THEN 'G' || CAST(CAST(SUBSTR(w.strong_number, 2) AS INTEGER) AS TEXT)
-                ELSE w.strong_number END
-            WHERE e.translation_id = ? AND e.book = ? AND e.chapter = ?
-            ORDER BY e.verse, e.english_word_position
-        """, (translation, book, chapter))
-        alignments = [dict(a) for a in cursor.fetchall()]
-
-        # Get interlinear data
-        cursor = conn.execute("""
-            SELECT verse, word_position as position, hebrew_text as original_text,
-                   transliteration, english_gloss as gloss, strong_number, grammar
-            FROM word_alignments
-            WHERE book = ? AND chapter = ?
-            ORDER BY verse, word_position
-        """, (book, chapter))
-        interlinear = [dict(i) for i in cursor.fetchall()]
-
-        # Get cross-references
-        cursor = conn.execute("""
-            SELECT source_verse, target_book, target_chapter, target_verse
-            FROM cross_references
-            WHERE source_book = ? AND source_chapter = ?
-            ORDER BY source_verse, target_book_order, target_chapter, target_verse
-        """, (book, chapter))
-        cross_refs = [dict(c) for c in cursor.fetchall()]
-
-        # Get commentary
-        cursor = conn.execute("""
-            SELECT source, reference_start, reference_end, content
-            FROM commentary_entries
-            WHERE book = ? AND chapter = ?
-            ORDER BY reference_start
-        """, (book, chapter))
-        commentary = [dict(c) for c in cursor.fetchall()]
-
-        return {
-            "book": book,
-            "chapter": chapter,
-            "translation": translation,
-            "verses": verses,
-            "alignments": alignments,
-            "interlinear": interlinear,
-            "crossRefs": cross_refs,
-            "commentary": commentary
-        }
-    finally:
-        conn.close()
+    # Get verses
+    first_key, last_key = chapter_key_range(book, chapter)
+    verses = await db.fetch_dicts("""
+        SELECT verse, text FROM verses
+        WHERE translation_id = ? AND verse_key BETWEEN ? AND ?
+        ORDER BY verse_key
+    """, (translation, first_key, last_key))
+
+    # Get word alignments for this chapter (BSB only has deterministic alignments)
+    alignments = await db.fetch_dicts("""
+        SELECT e.verse, e.english_word_position as position,
+               e.english_word as word, e.original_word_position,
+               w.hebrew_text as original_text, w.transliteration,
+               w.english_gloss as gloss, w.strong_number, w.grammar,
+               l.definition, l.extended_definition, l.language
+        FROM english_word_alignments e
+        JOIN word_alignments w ON w.verse_key = e.verse_key
+             AND w.word_position = e.original_word_position
+        LEFT JOIN lexicon l ON l.strong_number = w.strong_canonical
+        WHERE e.translation_id = ? AND e.verse_key BETWEEN ? AND ?
+        ORDER BY e.verse_key, e.english_word_position
+    """, (translation, first_key, last_key))
+
+    # Get interlinear data
+    interlinear = await db.fetch_dicts("""
+        SELECT verse, word_position as position, hebrew_text as original_text,
+               transliteration, english_gloss as gloss, strong_number, grammar
+        FROM word_alignments
+        WHERE verse_key BETWEEN ? AND ?
+        ORDER BY verse_key, word_position
+    """, (first_key, last_key))
+
+    # Get cross-references
+    cross_refs = await db.fetch_dicts(f"""
+        SELECT {CROSSREF_COLUMNS}
+        FROM cross_references x
+        JOIN books tb ON tb.book_order = x.target_key / 1000000
+        WHERE x.source_key BETWEEN ? AND ?
+        ORDER BY x.source_key, x.target_key
+    """, (first_key, last_key))
+
+    # Get commentary
+    commentary = await db.fetch_dicts("""
+        SELECT source, reference_start, reference_end, content
+        FROM commentary_entries
+        WHERE start_key BETWEEN ? AND ?
+        ORDER BY start_key
+    """, (first_key, last_key))
+
+    return FastJSONResponse({
+        "book": book,
+        "chapter": chapter,
+        "translation": translation,
+        "verses": verses,
+        "alignments": alignments,
+        "interlinear": interlinear,
+        "crossRefs": cross_refs,
+        "commentary": commentary
+    })
 
 
 @app.get("/api/offline/lexicon")
 async def get_lexicon_offline():
     """Get the complete lexicon for offline use."""
-    conn = get_db_connection()
-    try:
-        cursor = conn.execute("""
-            SELECT strong_number, language, original, transliteration,
-                   pronunciation, definition, extended_definition
-            FROM lexicon
-            ORDER BY strong_number
-        """)
-        entries = [dict(e) for e in cursor.fetchall()]
-        return {"entries": entries, "count": len(entries)}
-    finally:
-        conn.close()
+    entries = await db.fetch_dicts("""
+        SELECT strong_number, language, original, transliteration,
+               pronunciation, definition, extended_definition
+        FROM lexicon
+        ORDER BY strong_number
+    """, bulk=True)
+    return FastJSONResponse({"entries": entries, "count": len(entries)})
 
 
 @app.get("/api/offline/book")
@@ -868,221 +1592,170 @@ async def get_book_offline_data(
     include_alignments: bool = Query(default=True),
     include_interlinear: bool = Query(default=True),
     include_crossrefs: bool = Query(default=True),
-    include_commentary: bool = Query(default=True)
+    include_commentary: bool = Query(default=True),
+    format: str = Query(default="json", pattern="^(json|ndjson)$")
 ):
     """
     Get all data for an entire book for offline use.
     Can selectively include/exclude data types to manage download size.
+
+    The export is streamed chapter by chapter (one query per data type for
+    the whole book), so the first bytes arrive immediately and memory stays
+    flat. format=ndjson sends a header line and then one line per chapter.
     """
-    conn = get_db_connection()
-    try:
-        result = {
-            "book": book,
-            "translation": translation,
-            "chapters": {}
-        }
+    included = {
+        "alignments": include_alignments,
+        "interlinear": include_interlinear,
+        "crossRefs": include_crossrefs,
+        "commentary": include_commentary,
+    }
+    sections = tuple(name for name, wanted in included.items() if wanted)
+    writer, media_type = (
+        (write_book_ndjson, "application/x-ndjson") if format == "ndjson"
+        else (write_book_json, "application/json")
+    )
+    chunks = db.stream(writer, book, translation, sections, bulk=True)
+    return StreamingResponse(chunks, media_type=media_type)
 
-        # Get all chapters for this book
-        cursor = conn.execute("""
-            SELECT DISTINCT chapter FROM verses
-            WHERE book = ? AND translation_id = ?
-            ORDER BY chapter
-        """, (book, translation))
-        chapters = [row['chapter'] for row in cursor.fetchall()]
-
-        for chapter in chapters:
-            chapter_data = {"verses": []}
-
-            # Verses (always included)
-            cursor = conn.execute("""
-                SELECT verse, text FROM verses
-                WHERE book = ? AND chapter = ? AND translation_id = ?
-                ORDER BY verse
-            """, (book, chapter, translation))
-            chapter_data["verses"] = [dict(v) for v in cursor.fetchall()]
-
-            if include_alignments:
-                cursor = conn.execute("""
-                    SELECT e.verse, e.english_word_position as position,
-                           e.english_word as word, e.original_word_position,
-                           w.hebrew_text as original_text, w.strong_number,
-                           l.definition, l.language
-                    FROM english_word_alignments e
-                    JOIN word_alignments w ON w.book = e.book AND w.chapter = e.chapter
-                         AND w.verse = e.verse AND w.word_position = e.original_word_position
-                    LEFT JOIN lexicon l ON l.strong_number = CASE
-                        WHEN w.strong_number LIKE 'H0%' THEN 'H' || CAST(CAST(SUBSTR(w.strong_number, 2) AS INTEGER) AS TEXT)
-                        WHEN w.strong_number LIKE 'G0%' THEN 'G' || CAST(CAST(SUBSTR(w.strong_number, 2) AS INTEGER) AS TEXT)
-                        ELSE w.strong_number END
-                    WHERE e.translation_id = ? AND e.book = ? AND e.chapter = ?
-                    ORDER BY e.verse, e.english_word_position
-                """, (translation, book, chapter))
-                chapter_data["alignments"] = [dict(a) for a in cursor.fetchall()]
-
-            if include_interlinear:
-                cursor = conn.execute("""
-                    SELECT verse, word_position as position, hebrew_text as original_text,
-                           transliteration, english_gloss as gloss, strong_number
-                    FROM word_alignments
-                    WHERE book = ? AND chapter = ?
-                    ORDER BY verse, word_position
-                """, (book, chapter))
-                chapter_data["interlinear"] = [dict(i) for i in cursor.fetchall()]
-
-            if include_crossrefs:
-                cursor = conn.execute("""
-                    SELECT source_verse, target_book, target_chapter, target_verse
-                    FROM cross_references
-                    WHERE source_book = ? AND source_chapter = ?
-                """, (book, chapter))
-                chapter_data["crossRefs"] = [dict(c) for c in cursor.fetchall()]
-
-            if include_commentary:
-                cursor = conn.execute("""
-                    SELECT source, reference_start, reference_end, content
-                    FROM commentary_entries
-                    WHERE book = ? AND chapter = ?
-                """, (book, chapter))
-                chapter_data["commentary"] = [dict(c) for c in cursor.fetchall()]
-
-            result["chapters"][chapter] = chapter_data
-
-        return result
-    finally:
-        conn.close()
+
+@app.get("/api/offline/manifest")
+async def get_offline_manifest():
+    """
+    List the prebuilt offline bundles (URL, size, SHA-256, sections) written
+    by scripts/build_offline_bundles.py. `current` is false once the database
+    has changed since the bundles were built.
+    """
+    manifest = load_bundle_manifest()
+    if manifest is None:
+        raise HTTPException(status_code=404, detail="No offline bundles have been built")
+    current = manifest["data_version"] == await db.data_version()
+    return JSONResponse({**manifest, "current": current}, headers={"Cache-Control": "no-cache"})
+
+
+@app.get("/bundles/{name:path}")
+async def get_offline_bundle(name: str):
+    """Serve a bundle listed in the manifest; names are content-hashed, so cache forever."""
+    path = bundle_path(name)
+    if path is None:
+        raise HTTPException(status_code=404, detail=f"Bundle not found: {name}")
+    return FileResponse(path, media_type="application/gzip",
+                        headers={"Cache-Control": "public, max-age=31536000, immutable"})
 
 
 @app.get("/api/offline/commentary")
 async def get_commentary_offline_data(book: str):
     """Get all commentary entries for a book for offline use."""
-    conn = get_db_connection()
-    try:
-        cursor = conn.execute("""
-            SELECT book, chapter, source, reference_start, reference_end, content
-            FROM commentary_entries
-            WHERE book = ?
-            ORDER BY chapter, reference_start
-        """, (book,))
-        entries = [dict(row) for row in cursor.fetchall()]
-        return {"book": book, "entries": entries}
-    finally:
-        conn.close()
+    entries = await db.fetch_dicts("""
+        SELECT book, chapter, source, reference_start, reference_end, content
+        FROM commentary_entries
+        WHERE start_key BETWEEN ? AND ?
+        ORDER BY start_key
+    """, book_key_range(book), bulk=True)
+    return FastJSONResponse({"book": book, "entries": entries})
 
 
 @app.get("/api/offline/crossrefs")
 async def get_crossrefs_offline_data(book: str):
     """Get all cross-references for a book for offline use."""
-    conn = get_db_connection()
-    try:
-        cursor = conn.execute("""
-            SELECT source_chapter as chapter, source_verse as verse,
-                   target_book, target_chapter, target_verse
-            FROM cross_references
-            WHERE source_book = ?
-            ORDER BY source_chapter, source_verse
-        """, (book,))
-        entries = [dict(row) for row in cursor.fetchall()]
-        return {"book": book, "entries": entries}
-    finally:
-        conn.close()
+    entries = await db.fetch_dicts("""
+        SELECT x.source_key / 1000 % 1000 as chapter, x.source_key % 1000 as verse,
+               tb.name as target_book, x.target_key / 1000 % 1000 as target_chapter,
+               x.target_key % 1000 as target_verse
+        FROM cross_references x
+        JOIN books tb ON tb.book_order = x.target_key / 1000000
+        WHERE x.source_key BETWEEN ? AND ?
+        ORDER BY x.source_key, x.target_key
+    """, book_key_range(book), bulk=True)
+    return FastJSONResponse({"book": book, "entries": entries})
 
 
 @app.get("/api/offline/stats")
 async def get_offline_stats():
     """Get statistics about available data for offline download planning."""
-    conn = get_db_connection()
-    try:
-        stats = {}
-
-        # Verses by translation
-        cursor = conn.execute("""
-            SELECT translation_id, COUNT(*) as count,
-                   SUM(LENGTH(text)) as size_bytes
-            FROM verses GROUP BY translation_id
-        """)
-        stats["verses"] = {row['translation_id']: {
+    stats = {}
+
+    # Verses by translation
+    rows = await db.fetch_all("""
+        SELECT translation_id, COUNT(*) as count,
+               SUM(LENGTH(text)) as size_bytes
+        FROM verses GROUP BY translation_id
+    """, bulk=True)
+    stats["verses"] = {row['translation_id']: {
+        "count": row['count'],
+        "size_mb": round(row['size_bytes'] / 1024 / 1024, 2)
+    } for row in rows}
+
+    # Alignments by translation
+    rows = await db.fetch_all("""
+        SELECT translation_id, COUNT(*) as count
+        FROM english_word_alignments GROUP BY translation_id
+    """, bulk=True)
+    stats["alignments"] = {row['translation_id']: {
+        "count": row['count'],
+        "size_mb": round(row['count'] * 100 / 1024 / 1024, 2)  # Estimate ~100 bytes per alignment
+    } for row in rows}
+
+    # Interlinear
+    row = await db.fetch_one("SELECT COUNT(*) as count FROM word_alignments", bulk=True)
+    count = row['count']
+    stats["interlinear"] = {"count": count, "size_mb": round(count * 80 / 1024 / 1024, 2)}
+
+    # Lexicon
+    row = await db.fetch_one("SELECT COUNT(*) as count FROM lexicon", bulk=True)
+    count = row['count']
+    stats["lexicon"] = {"count": count, "size_mb": 1}
+
+    # Cross-references
+    row = await db.fetch_one("SELECT COUNT(*) as count FROM cross_references", bulk=True)
+    count = row['count']
+    stats["crossRefs"] = {"count": count, "size_mb": round(count * 60 / 1024 / 1024, 2)}
+
+    # Commentary by source
+    rows = await db.fetch_all("""
+        SELECT source, COUNT(*) as count, SUM(LENGTH(content)) as size_bytes
+        FROM commentary_entries
+        GROUP BY source
+    """, bulk=True)
+    stats["commentary"] = {}
+    for row in rows:
+        stats["commentary"][row['source']] = {
             "count": row['count'],
-            "size_mb": round(row['size_bytes'] / 1024 / 1024, 2)
-        } for row in cursor.fetchall()}
-
-        # Alignments by translation
-        cursor = conn.execute("""
-            SELECT translation_id, COUNT(*) as count
-            FROM english_word_alignments GROUP BY translation_id
-        """)
-        stats["alignments"] = {row['translation_id']: {
-            "count": row['count'],
-            "size_mb": round(row['count'] * 100 / 1024 / 1024, 2)  # Estimate ~100 bytes per alignment
-        } for row in cursor.fetchall()}
-
-        # Interlinear
-        cursor = conn.execute("SELECT COUNT(*) as count FROM word_alignments")
-        count = cursor.fetchone()['count']
-        stats["interlinear"] = {"count": count, "size_mb": round(count * 80 / 1024 / 1024, 2)}
-
-        # Lexicon
-        cursor = conn.execute("SELECT COUNT(*) as count FROM lexicon")
-        count = cursor.fetchone()['count']
-        stats["lexicon"] = {"count": count, "size_mb": 1}
-
-        # Cross-references
-        cursor = conn.execute("SELECT COUNT(*) as count FROM cross_references")
-        count = cursor.fetchone()['count']
-        stats["crossRefs"] = {"count": count, "size_mb": round(count * 60 / 1024 / 1024, 2)}
-
-        # Commentary by source
-        cursor = conn.execute("""
-            SELECT source, COUNT(*) as count, SUM(LENGTH(content)) as size_bytes
-            FROM commentary_entries
-            GROUP BY source
-        """)
-        stats["commentary"] = {}
-        for row in cursor.fetchall():
-            stats["commentary"][row['source']] = {
-                "count": row['count'],
-                "size_mb": round((row['size_bytes'] or 0) / 1024 / 1024, 2)
-            }
+            "size_mb": round((row['size_bytes'] or 0) / 1024 / 1024, 2)
+        }
 
-        # Devotionals
-        cursor = conn.execute("""
-            SELECT source, COUNT(*) as count, SUM(LENGTH(content)) as size_bytes
-            FROM devotionals
-            GROUP BY source
-        """)
-        stats["devotionals"] = {}
-        for row in cursor.fetchall():
-            stats["devotionals"][row['source']] = {
-                "count": row['count'],
-                "size_mb": round((row['size_bytes'] or 0) / 1024 / 1024, 2)
-            }
+    # Devotionals
+    rows = await db.fetch_all("""
+        SELECT source, COUNT(*) as count, SUM(LENGTH(content)) as size_bytes
+        FROM devotionals
+        GROUP BY source
+    """, bulk=True)
+    stats["devotionals"] = {}
+    for row in rows:
+        stats["devotionals"][row['source']] = {
+            "count": row['count'],
+            "size_mb": round((row['size_bytes'] or 0) / 1024 / 1024, 2)
+        }
 
-        return stats
-    finally:
-        conn.close()
+    return stats
 
 
 @app.get("/api/offline/devotionals")
 async def get_devotionals_offline(source: Optional[str] = None):
     """Get all devotionals for offline use."""
-    conn = get_db_connection()
-    try:
-        if source:
-            cursor = conn.execute("""
-                SELECT source, month, day, time_of_day, title, verse_ref, content
-                FROM devotionals
-                WHERE source = ?
-                ORDER BY month, day, time_of_day
-            """, (source,))
-        else:
-            cursor = conn.execute("""
-                SELECT source, month, day, time_of_day, title, verse_ref, content
-                FROM devotionals
-                ORDER BY source, month, day, time_of_day
-            """)
-        entries = [dict(row) for row in cursor.fetchall()]
-        return {"entries": entries, "count": len(entries)}
-    finally:
-        conn.close()
+    if source:
+        entries = await db.fetch_dicts("""
+            SELECT source, month, day, time_of_day, title, verse_ref, content
+            FROM devotionals
+            WHERE source = ?
+            ORDER BY month, day, time_of_day
+        """, (source,), bulk=True)
+    else:
+        entries = await db.fetch_dicts("""
+            SELECT source, month, day, time_of_day, title, verse_ref, content
+            FROM devotionals
+            ORDER BY source, month, day, time_of_day
+        """, bulk=True)
+    return FastJSONResponse({"entries": entries, "count": len(entries)})
 
 
 # Route for reading plan URLs (e.g., /plan/chronological-year/45)
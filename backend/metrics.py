@@ -0,0 +1,354 @@
+"""
+Request timing and SQL profiling for BibleMVP.
+
+Disabled by default. With METRICS_ENABLED=1 the app records per-route latency
+histograms (ASGI middleware) and per-statement SQLite timings, row counts and
+call counts (a thin wrapper around pooled connections), exposed at
+/api/_metrics (JSON) and /api/_metrics/prometheus (Prometheus text format).
+Statements slower than SLOW_QUERY_MS are logged. When disabled, neither the
+middleware nor the connection wrapper is installed.
+"""
+from contextvars import ContextVar
+import bisect
+import logging
+import os
+import re
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+METRICS_ENABLED = os.environ.get("METRICS_ENABLED", "").lower() in ("1", "true", "yes")
+SLOW_QUERY_MS = float(os.environ.get("SLOW_QUERY_MS", "200"))
+
+# Latency histogram bucket upper bounds, in seconds
+BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Route of the request being served, so SQL stats can be attributed to it
+current_request = ContextVar("current_request", default=None)
+
+
+class Histogram:
+    """Cumulative-bucket latency histogram (Prometheus semantics)."""
+
+    __slots__ = ("counts", "count", "sum")
+
+    def __init__(self):
+        self.counts = [0] * (len(BUCKETS) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, seconds: float):
+        self.counts[bisect.bisect_left(BUCKETS, seconds)] += 1
+        self.count += 1
+        self.sum += seconds
+
+    def quantile(self, q: float) -> float:
+        """Bucket upper bound containing the q-th observation (an upper estimate)."""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for bound, count in zip(BUCKETS, self.counts):
+            seen += count
+            if seen >= rank:
+                return bound
+        return BUCKETS[-1]
+
+    def cumulative(self) -> list:
+        """(le, cumulative count) pairs including +Inf."""
+        total = 0
+        pairs = []
+        for bound, count in zip(BUCKETS + (float("inf"),), self.counts):
+            total += count
+            pairs.append((bound, total))
+        return pairs
+
+
+class RequestStats:
+    """Per-request counters filled in by the SQL wrapper (from several DB worker threads)."""
+
+    __slots__ = ("route", "queries", "sql_seconds", "_lock")
+
+    def __init__(self, route: str):
+        self.route = route
+        self.queries = 0
+        self.sql_seconds = 0.0
+        self._lock = threading.Lock()
+
+    def add_query(self, seconds: float):
+        with self._lock:
+            self.queries += 1
+            self.sql_seconds += seconds
+
+
+class Metrics:
+    """Process-wide request and SQL statistics."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.started = time.time()
+            self.routes = {}      # (method, route) -> {"latency", "statuses", "queries", "sql_seconds"}
+            self.statements = {}  # normalized SQL -> {"calls", "seconds", "max_seconds", "rows"}
+            self.slow_queries = 0
+
+    def observe_request(self, method: str, route: str, status: int, seconds: float,
+                        stats: RequestStats):
+        with self._lock:
+            entry = self.routes.get((method, route))
+            if entry is None:
+                entry = self.routes[(method, route)] = {
+                    "latency": Histogram(), "statuses": {}, "queries": 0, "sql_seconds": 0.0,
+                }
+            entry["latency"].observe(seconds)
+            entry["statuses"][status] = entry["statuses"].get(status, 0) + 1
+            entry["queries"] += stats.queries
+            entry["sql_seconds"] += stats.sql_seconds
+
+    def observe_statement(self, sql: str, seconds: float, rows: int):
+        request = current_request.get()
+        if request is not None:
+            request.add_query(seconds)
+        statement = normalize_sql(sql)
+        with self._lock:
+            entry = self.statements.get(statement)
+            if entry is None:
+                entry = self.statements[statement] = {
+                    "calls": 0, "seconds": 0.0, "max_seconds": 0.0, "rows": 0,
+                }
+            entry["calls"] += 1
+            entry["seconds"] += seconds
+            entry["rows"] += rows
+            if seconds > entry["max_seconds"]:
+                entry["max_seconds"] = seconds
+            slow = SLOW_QUERY_MS and seconds * 1000 >= SLOW_QUERY_MS
+            if slow:
+                self.slow_queries += 1
+        if slow:
+            route = request.route if request is not None else "-"
+            logger.warning(f"Slow query ({seconds * 1000:.1f} ms, {rows} rows, {route}): {statement}")
+
+    def snapshot(self) -> dict:
+        """JSON-able view of every counter."""
+        with self._lock:
+            routes = []
+            for (method, route), entry in sorted(self.routes.items(), key=lambda item: item[0][1]):
+                latency = entry["latency"]
+                routes.append({
+                    "method": method,
+                    "route": route,
+                    "requests": latency.count,
+                    "statuses": {str(code): n for code, n in sorted(entry["statuses"].items())},
+                    "avg_ms": round(latency.sum / latency.count * 1000, 3) if latency.count else 0.0,
+                    "p50_ms": latency.quantile(0.50) * 1000,
+                    "p95_ms": latency.quantile(0.95) * 1000,
+                    "p99_ms": latency.quantile(0.99) * 1000,
+                    "queries_per_request": round(entry["queries"] / latency.count, 2) if latency.count else 0.0,
+                    "sql_ms_per_request": round(entry["sql_seconds"] / latency.count * 1000, 3) if latency.count else 0.0,
+                })
+            statements = [
+                {
+                    "sql": sql,
+                    "calls": entry["calls"],
+                    "total_ms": round(entry["seconds"] * 1000, 3),
+                    "avg_ms": round(entry["seconds"] / entry["calls"] * 1000, 3),
+                    "max_ms": round(entry["max_seconds"] * 1000, 3),
+                    "rows": entry["rows"],
+                }
+                for sql, entry in sorted(self.statements.items(),
+                                         key=lambda item: item[1]["seconds"], reverse=True)
+            ]
+            return {
+                "enabled": METRICS_ENABLED,
+                "uptime_seconds": round(time.time() - self.started, 1),
+                "slow_query_ms": SLOW_QUERY_MS,
+                "slow_queries": self.slow_queries,
+                "routes": routes,
+                "statements": statements,
+            }
+
+    def prometheus(self, gauges: dict = None) -> str:
+        """Prometheus text exposition (format 0.0.4)."""
+        lines = [
+            "# HELP bible_http_request_duration_seconds Request latency by route.",
+            "# TYPE bible_http_request_duration_seconds histogram",
+        ]
+        with self._lock:
+            routes = sorted(self.routes.items(), key=lambda item: item[0][1])
+            for (method, route), entry in routes:
+                labels = f'method="{method}",route="{_escape(route)}"'
+                latency = entry["latency"]
+                for bound, total in latency.cumulative():
+                    le = "+Inf" if bound == float("inf") else repr(bound)
+                    lines.append(f'bible_http_request_duration_seconds_bucket{{{labels},le="{le}"}} {total}')
+                lines.append(f"bible_http_request_duration_seconds_sum{{{labels}}} {latency.sum}")
+                lines.append(f"bible_http_request_duration_seconds_count{{{labels}}} {latency.count}")
+
+            lines += ["# HELP bible_http_responses_total Responses by route and status.",
+                      "# TYPE bible_http_responses_total counter"]
+            for (method, route), entry in routes:
+                for status, count in sorted(entry["statuses"].items()):
+                    lines.append(f'bible_http_responses_total{{method="{method}",'
+                                 f'route="{_escape(route)}",status="{status}"}} {count}')
+
+            lines += ["# HELP bible_http_request_queries_total SQL statements issued by route.",
+                      "# TYPE bible_http_request_queries_total counter"]
+            for (method, route), entry in routes:
+                lines.append(f'bible_http_request_queries_total{{method="{method}",'
+                             f'route="{_escape(route)}"}} {entry["queries"]}')
+
+            metrics = (
+                ("bible_sql_statement_calls_total", "calls", "Executions per SQL statement."),
+                ("bible_sql_statement_seconds_total", "seconds", "Execution time per SQL statement."),
+                ("bible_sql_statement_rows_total", "rows", "Rows returned per SQL statement."),
+            )
+            for name, key, help_text in metrics:
+                lines += [f"# HELP {name} {help_text}", f"# TYPE {name} counter"]
+                for sql, entry in self.statements.items():
+                    lines.append(f'{name}{{statement="{_escape(sql[:200])}"}} {entry[key]}')
+
+            lines += ["# HELP bible_sql_slow_queries_total Statements slower than SLOW_QUERY_MS.",
+                      "# TYPE bible_sql_slow_queries_total counter",
+                      f"bible_sql_slow_queries_total {self.slow_queries}"]
+
+        for name, value in (gauges or {}).items():
+            lines += [f"# TYPE {name} gauge", f"{name} {value}"]
+        return "\n".join(lines) + "\n"
+
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_sql(sql: str) -> str:
+    """Collapse whitespace so the same statement groups together."""
+    return _WHITESPACE.sub(" ", sql).strip()
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", " ")
+
+
+class ProfiledCursor:
+    """
+    Cursor wrapper that records timing and row count once results are fetched.
+
+    fetchmany() batches (streamed exports) are recorded as one execution once
+    the cursor is exhausted, timing only the execute and fetch calls, not the
+    consumer's work between batches; a stream abandoned part way records the
+    rows it read when the cursor is released.
+    """
+
+    __slots__ = ("_cursor", "_sql", "_started", "_seconds", "_rows", "_recorded")
+
+    def __init__(self, cursor, sql: str, started: float):
+        self._cursor = cursor
+        self._sql = sql
+        self._started = started
+        self._seconds = time.perf_counter() - started
+        self._rows = 0
+        self._recorded = False
+
+    def fetchmany(self, size: int = None):
+        if size is None:
+            size = self._cursor.arraysize
+        started = time.perf_counter()
+        rows = self._cursor.fetchmany(size)
+        self._seconds += time.perf_counter() - started
+        self._rows += len(rows)
+        if len(rows) < size and not self._recorded:
+            self._recorded = True
+            metrics.observe_statement(self._sql, self._seconds, self._rows)
+        return rows
+
+    def __del__(self):
+        if self._rows and not self._recorded:
+            metrics.observe_statement(self._sql, self._seconds, self._rows)
+
+    def fetchall(self):
+        rows = self._cursor.fetchall()
+        metrics.observe_statement(self._sql, time.perf_counter() - self._started, len(rows))
+        return rows
+
+    def fetchone(self):
+        row = self._cursor.fetchone()
+        metrics.observe_statement(self._sql, time.perf_counter() - self._started,
+                                  0 if row is None else 1)
+        return row
+
+    def __iter__(self):
+        rows = 0
+        for row in self._cursor:
+            rows += 1
+            yield row
+        metrics.observe_statement(self._sql, time.perf_counter() - self._started, rows)
+
+    @property
+    def row_factory(self):
+        return self._cursor.row_factory
+
+    @row_factory.setter
+    def row_factory(self, factory):
+        self._cursor.row_factory = factory
+
+    def __getattr__(self, name):
+        return getattr(self._cursor, name)
+
+
+class ProfiledConnection:
+    """Thin sqlite3.Connection wrapper whose execute() returns a ProfiledCursor."""
+
+    __slots__ = ("_conn",)
+
+    def __init__(self, conn):
+        self._conn = conn
+
+    def execute(self, sql: str, params=()):
+        started = time.perf_counter()
+        return ProfiledCursor(self._conn.execute(sql, params), sql, started)
+
+    def __getattr__(self, name):
+        return getattr(self._conn, name)
+
+
+class MetricsMiddleware:
+    """ASGI middleware recording latency, status and SQL counts per route."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = RequestStats(scope["path"])
+        token = current_request.set(stats)
+        status = 500
+
+        async def send_wrapper(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - started
+            current_request.reset(token)
+            # The router records the matched route on the scope; label by its
+            # template so /api/passage/{reference} is one series, not thousands
+            # (mounts such as /static only set root_path; 304s answered by the
+            # HTTP cache middleware never reach the router)
+            route = scope.get("route")
+            stats.route = (getattr(route, "path", None) or scope.get("root_path")
+                           or ("<not modified>" if status == 304 else "<unmatched>"))
+            metrics.observe_request(scope["method"], stats.route, status, elapsed, stats)
+
+
+metrics = Metrics()
@@ -0,0 +1,724 @@
+"""
+Versioned data migrations for BibleMVP.
+
+The number of applied migrations is kept in `PRAGMA user_version`, so the
+server only reads one integer at startup. Migrations never run on boot; apply
+them explicitly with:
+
+    python scripts/migrate.py
+
+Every migration works in batches and commits as it goes, and only touches rows
+that still need it, so an interrupted run picks up where it stopped.
+"""
+import logging
+import re
+import sqlite3
+import time
+
+from .references import BOOK_ALIASES, BOOKS
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_SIZE = 5000
+
+
+def schema_version(conn: sqlite3.Connection) -> int:
+    """Number of migrations applied to this database."""
+    return conn.execute("PRAGMA user_version").fetchone()[0]
+
+
+def set_schema_version(conn: sqlite3.Connection, version: int):
+    conn.execute(f"PRAGMA user_version = {int(version)}")
+    conn.commit()
+
+
+def table_columns(conn: sqlite3.Connection, table: str) -> set:
+    return {row[1] for row in conn.execute(f"PRAGMA table_info({table})")}
+
+
+def fill_column(conn, table: str, column: str, expression: str, batch_size: int,
+                where: str = "") -> int:
+    """
+    Set NULL `column` values to `expression` in committed batches, walking the
+    table in rowid order; returns rows filled. Rows where `expression` is NULL
+    (e.g. a book name the books table doesn't know) are left NULL and reported.
+    """
+    filled = unfilled = 0
+    last_rowid = 0
+    while True:
+        rowids = conn.execute(f"""
+            SELECT rowid FROM {table}
+            WHERE rowid > ? AND {column} IS NULL {where}
+            ORDER BY rowid LIMIT ?
+        """, (last_rowid, batch_size)).fetchall()
+        if not rowids:
+            break
+        first_rowid, last_rowid = rowids[0][0], rowids[-1][0]
+        updated = conn.execute(f"""
+            UPDATE {table} SET {column} = {expression}
+            WHERE rowid BETWEEN ? AND ? AND {column} IS NULL {where}
+              AND ({expression}) IS NOT NULL
+        """, (first_rowid, last_rowid)).rowcount
+        conn.commit()
+        filled += updated
+        unfilled += len(rowids) - updated
+    if unfilled:
+        logger.warning(f"  {table}.{column}: {unfilled:,} rows left NULL (no value to fill them with)")
+    return filled
+
+
+# ---------------------------------------------------------------------------
+# 1. Clickable Bible references in commentary
+# ---------------------------------------------------------------------------
+
+# Matthew Henry writes numbered books with the number last (Sa1, Co2, Jo3)
+# and a bare "Peter" for 1 Peter; every other form is a references alias
+_COMMENTARY_NUMBERED = "sa1 sa2 kg1 kg2 ch1 ch2 co1 co2 th1 th2 ti1 ti2 pe1 pe2 jo1 jo2 jo3"
+COMMENTARY_ALIASES = {
+    **BOOK_ALIASES,
+    **{alias: BOOK_ALIASES[alias[-1] + alias[:-1]] for alias in _COMMENTARY_NUMBERED.split()},
+    "peter": "1 Peter",
+}
+
+_abbrev_pattern = '|'.join(
+    re.escape(k) for k in sorted([*COMMENTARY_ALIASES, *BOOKS], key=len, reverse=True)
+)
+REF_PATTERN = re.compile(rf'\b({_abbrev_pattern})\s+(\d+):(\d+)(?:-(\d+))?\b', re.IGNORECASE)
+
+
+def normalize_book(abbrev: str):
+    return COMMENTARY_ALIASES.get(abbrev.lower().replace(" ", ""))
+
+
+def add_commentary_links(content: str) -> str:
+    """Wrap Bible references in commentary text with commentary-ref links."""
+    def replace_ref(match):
+        abbrev, chapter, verse_start, verse_end = match.groups()
+        book = normalize_book(abbrev)
+        if not book:
+            return match.group(0)
+        if verse_end:
+            ref = f"{book} {chapter}:{verse_start}-{verse_end}"
+            display = f"{abbrev} {chapter}:{verse_start}-{verse_end}"
+        else:
+            ref = f"{book} {chapter}:{verse_start}"
+            display = f"{abbrev} {chapter}:{verse_start}"
+        return f'<a href="#" class="commentary-ref" data-ref="{ref}">{display}</a>'
+    return REF_PATTERN.sub(replace_ref, content)
+
+
+def migrate_commentary_links(conn, batch_size: int):
+    """Add clickable Bible reference links to commentary entries."""
+    if not table_columns(conn, "commentary_entries"):
+        return
+    # Entries that already contain links were processed by an earlier run
+    # (including the old boot-time migration), so the pass is safe to repeat
+    last_id = 0
+    updated = 0
+    while True:
+        rows = conn.execute("""
+            SELECT id, content FROM commentary_entries
+            WHERE id > ? ORDER BY id LIMIT ?
+        """, (last_id, batch_size)).fetchall()
+        if not rows:
+            break
+        for entry_id, content in rows:
+            if not content or 'commentary-ref' in content:
+                continue
+            new_content = add_commentary_links(content)
+            if new_content != content:
+                conn.execute("UPDATE commentary_entries SET content = ? WHERE id = ?",
+                             (new_content, entry_id))
+                updated += 1
+        conn.commit()
+        last_id = rows[-1][0]
+    logger.info(f"  commentary_entries: linked references in {updated:,} entries")
+
+
+# ---------------------------------------------------------------------------
+# 2. Integer verse keys (BBCCCVVV)
+# ---------------------------------------------------------------------------
+
+def _key_sql(book: str, chapter: str, verse: str) -> str:
+    return f"(SELECT book_order FROM books WHERE name = {book}) * 1000000 + {chapter} * 1000 + {verse}"
+
+
+# table -> {key column: expression over the row's own columns}
+VERSE_KEY_COLUMNS = {
+    "verses": {
+        "verse_key": "book_order * 1000000 + chapter * 1000 + verse",
+    },
+    "word_alignments": {
+        "verse_key": _key_sql("book", "chapter", "verse"),
+    },
+    "english_word_alignments": {
+        "verse_key": _key_sql("book", "chapter", "verse"),
+    },
+    "speaker_verses": {
+        "verse_key": _key_sql("book", "chapter", "verse"),
+    },
+    "cross_references": {
+        "source_key": _key_sql("source_book", "source_chapter", "source_verse"),
+        "target_key": _key_sql("target_book", "target_chapter", "target_verse"),
+    },
+    "commentary_entries": {
+        "start_key": _key_sql("book", "chapter", "reference_start"),
+        "end_key": _key_sql("book", "chapter", "reference_end"),
+    },
+}
+
+VERSE_KEY_INDEXES = {
+    "verses": "CREATE INDEX IF NOT EXISTS idx_verses_key ON verses(translation_id, verse_key)",
+    "word_alignments":
+        "CREATE INDEX IF NOT EXISTS idx_alignment_key ON word_alignments(verse_key, word_position)",
+    "english_word_alignments":
+        "CREATE INDEX IF NOT EXISTS idx_eng_align_key "
+        "ON english_word_alignments(translation_id, verse_key, english_word_position)",
+    "speaker_verses":
+        "CREATE INDEX IF NOT EXISTS idx_speaker_verses_key ON speaker_verses(verse_key, is_divine)",
+    "cross_references":
+        "CREATE INDEX IF NOT EXISTS idx_crossref_key "
+        "ON cross_references(source_key, target_key, relationship_type)",
+    "commentary_entries":
+        "CREATE INDEX IF NOT EXISTS idx_commentary_key ON commentary_entries(start_key, end_key)",
+}
+
+# Book-name indexes superseded by the key indexes (UNIQUE constraints are kept)
+BOOK_NAME_INDEXES = [
+    "idx_verses_lookup",
+    "idx_alignment_ref",
+    "idx_eng_align_ref",
+    "idx_eng_align_lookup",
+    "idx_speaker_verses_ref",
+    "idx_crossref_source",
+    "idx_commentary_lookup",
+]
+
+
+def migrate_verse_keys(conn, batch_size: int):
+    """Add, fill and index integer verse keys on every verse-addressed table."""
+    # Only re-index FTS when searchable columns change, not when keys are filled
+    # (the per-translation indexes that replace verses_fts already do)
+    if table_columns(conn, "verses_fts"):
+        conn.executescript("""
+            DROP TRIGGER IF EXISTS verses_au;
+            CREATE TRIGGER verses_au AFTER UPDATE OF text, book, chapter, verse ON verses BEGIN
+                INSERT INTO verses_fts(verses_fts, rowid, text, book, chapter, verse)
+                VALUES ('delete', old.id, old.text, old.book, old.chapter, old.verse);
+                INSERT INTO verses_fts(rowid, text, book, chapter, verse)
+                VALUES (new.id, new.text, new.book, new.chapter, new.verse);
+            END;
+        """)
+
+    for table, keys in VERSE_KEY_COLUMNS.items():
+        columns = table_columns(conn, table)
+        if not columns:
+            continue
+
+        for column, expression in keys.items():
+            if column not in columns:
+                conn.execute(f"ALTER TABLE {table} ADD COLUMN {column} INTEGER")
+            filled = fill_column(conn, table, column, expression, batch_size)
+            logger.info(f"  {table}.{column}: filled {filled:,} rows")
+
+        # Keep keys filled for rows inserted by later imports
+        assignments = ", ".join(f"{column} = {expression}" for column, expression in keys.items())
+        first_key = next(iter(keys))
+        conn.execute(f"DROP TRIGGER IF EXISTS {table}_key_ai")
+        conn.execute(f"""
+            CREATE TRIGGER {table}_key_ai AFTER INSERT ON {table}
+            WHEN new.{first_key} IS NULL
+            BEGIN
+                UPDATE {table} SET {assignments} WHERE rowid = new.rowid;
+            END
+        """)
+        conn.execute(VERSE_KEY_INDEXES[table])
+        conn.commit()
+
+    for index in BOOK_NAME_INDEXES:
+        conn.execute(f"DROP INDEX IF EXISTS {index}")
+    conn.commit()
+
+
+# ---------------------------------------------------------------------------
+# 3. Canonical Strong's numbers on word alignments
+# ---------------------------------------------------------------------------
+
+STRONG_NUMBER = re.compile(r"^([GHgh])0*(\d+)[A-Za-z]?$")
+
+
+def canonical_strong(strong_number):
+    """
+    The form the lexicon is keyed by: zero padding and a letter suffix dropped,
+    'H0430' -> 'H430', 'H0430a' -> 'H430', 'G00001' -> 'G1'. Anything that is
+    not a Strong's number is returned unchanged. The importers and the
+    migration below both use this one rule.
+    """
+    match = STRONG_NUMBER.match(strong_number) if strong_number else None
+    if match is None:
+        return strong_number
+    return f"{match.group(1).upper()}{match.group(2)}"
+
+
+# canonical_strong as a SQL function, registered on the migrating connection
+CANONICAL_STRONG_SQL = "canonical_strong(strong_number)"
+
+
+def migrate_strong_canonical(conn, batch_size: int):
+    """Store canonical Strong's numbers next to the padded ones and index them."""
+    columns = table_columns(conn, "word_alignments")
+    if not columns:
+        return
+    if "strong_canonical" not in columns:
+        conn.execute("ALTER TABLE word_alignments ADD COLUMN strong_canonical TEXT")
+    conn.create_function("canonical_strong", 1, canonical_strong, deterministic=True)
+    filled = fill_column(conn, "word_alignments", "strong_canonical", CANONICAL_STRONG_SQL,
+                         batch_size, where="AND strong_number IS NOT NULL")
+    logger.info(f"  word_alignments.strong_canonical: filled {filled:,} rows")
+
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_alignment_strong_canonical "
+                 "ON word_alignments(strong_canonical)")
+    # Nothing looks alignments up by the padded form any more
+    conn.execute("DROP INDEX IF EXISTS idx_alignment_strongs")
+    conn.commit()
+
+
+# ---------------------------------------------------------------------------
+# 4. Word occurrence keys and per-book counts
+# ---------------------------------------------------------------------------
+
+WORD_BOOK_COUNTS_SQL = """
+    CREATE TABLE IF NOT EXISTS word_book_counts (
+        strong_number TEXT NOT NULL,
+        book_order INTEGER NOT NULL,
+        count INTEGER NOT NULL,
+        PRIMARY KEY (strong_number, book_order)
+    ) WITHOUT ROWID
+"""
+
+
+def refresh_word_book_counts(conn):
+    """Recompute the per-book occurrence counts of every Strong's number."""
+    conn.execute(WORD_BOOK_COUNTS_SQL)
+    conn.execute("DELETE FROM word_book_counts")
+    conn.execute("""
+        INSERT INTO word_book_counts (strong_number, book_order, count)
+        SELECT strong_number, verse_key / 1000000, COUNT(*)
+        FROM words
+        WHERE strong_number IS NOT NULL AND verse_key IS NOT NULL
+        GROUP BY strong_number, verse_key / 1000000
+    """)
+    conn.commit()
+
+
+def migrate_word_occurrences(conn, batch_size: int):
+    """Key interlinear words by verse for keyset paging, and precompute per-book counts."""
+    columns = table_columns(conn, "words")
+    if not columns:
+        return
+    if "verse_key" not in columns:
+        conn.execute("ALTER TABLE words ADD COLUMN verse_key INTEGER")
+    # Words whose verse is missing keep a NULL key (and would never fill)
+    filled = fill_column(conn, "words", "verse_key",
+                         "(SELECT v.verse_key FROM verses v WHERE v.id = words.verse_id)",
+                         batch_size, where="AND verse_id IN (SELECT id FROM verses)")
+    logger.info(f"  words.verse_key: filled {filled:,} rows")
+
+    conn.execute("DROP TRIGGER IF EXISTS words_key_ai")
+    conn.execute("""
+        CREATE TRIGGER words_key_ai AFTER INSERT ON words
+        WHEN new.verse_key IS NULL
+        BEGIN
+            UPDATE words SET verse_key = (SELECT verse_key FROM verses WHERE id = new.verse_id)
+            WHERE rowid = new.rowid;
+        END
+    """)
+    # Occurrences of a word in canonical order are one range of this index
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_words_strong_key "
+                 "ON words(strong_number, verse_key, position)")
+    conn.execute("DROP INDEX IF EXISTS idx_words_strong")
+    conn.commit()
+
+    refresh_word_book_counts(conn)
+    logger.info("  word_book_counts: rebuilt")
+
+
+# ---------------------------------------------------------------------------
+# 5. Concordance: word frequencies and English renderings
+# ---------------------------------------------------------------------------
+
+CONCORDANCE_SCHEMA = """
+    -- Totals per Strong's number over the interlinear words (what /api/word pages through)
+    CREATE TABLE IF NOT EXISTS word_stats (
+        strong_number TEXT PRIMARY KEY,
+        occurrences INTEGER NOT NULL,
+        verses INTEGER NOT NULL,
+        books INTEGER NOT NULL,
+        frequency_rank INTEGER NOT NULL  -- 1 = most frequent word of its language
+    ) WITHOUT ROWID;
+
+    -- How each word is rendered in each aligned translation, most frequent first
+    CREATE TABLE IF NOT EXISTS word_renderings (
+        strong_number TEXT NOT NULL,
+        translation_id TEXT NOT NULL,
+        rank INTEGER NOT NULL,
+        rendering TEXT NOT NULL,
+        count INTEGER NOT NULL,
+        PRIMARY KEY (strong_number, translation_id, rank)
+    ) WITHOUT ROWID;
+
+    CREATE TABLE IF NOT EXISTS word_rendering_totals (
+        strong_number TEXT NOT NULL,
+        translation_id TEXT NOT NULL,
+        aligned INTEGER NOT NULL,     -- aligned occurrences
+        renderings INTEGER NOT NULL,  -- distinct renderings
+        PRIMARY KEY (strong_number, translation_id)
+    ) WITHOUT ROWID;
+"""
+
+
+def refresh_concordance(conn):
+    """
+    Rebuild the concordance tables (per-book counts, word_stats and the
+    rendering tables) from the interlinear words and English alignments.
+    Run after importing either (scripts/build_concordance.py).
+    """
+    conn.executescript(CONCORDANCE_SCHEMA)
+    refresh_word_book_counts(conn)
+
+    conn.execute("DELETE FROM word_stats")
+    conn.execute("""
+        INSERT INTO word_stats (strong_number, occurrences, verses, books, frequency_rank)
+        SELECT strong_number, occurrences, verses, books,
+               RANK() OVER (PARTITION BY SUBSTR(strong_number, 1, 1) ORDER BY occurrences DESC)
+        FROM (
+            SELECT strong_number, COUNT(*) as occurrences,
+                   COUNT(DISTINCT verse_key) as verses,
+                   COUNT(DISTINCT verse_key / 1000000) as books
+            FROM words
+            WHERE strong_number IS NOT NULL AND verse_key IS NOT NULL
+            GROUP BY strong_number
+        )
+    """)
+
+    conn.execute("DELETE FROM word_renderings")
+    if table_columns(conn, "english_word_alignments") and table_columns(conn, "word_alignments"):
+        # An original word aligned to several English words ("in the beginning")
+        # is one rendering: its English words joined in text order
+        conn.execute("""
+            INSERT INTO word_renderings (strong_number, translation_id, rank, rendering, count)
+            SELECT strong_canonical, translation_id,
+                   ROW_NUMBER() OVER (PARTITION BY strong_canonical, translation_id
+                                      ORDER BY COUNT(*) DESC, rendering),
+                   rendering, COUNT(*)
+            FROM (
+                SELECT w.strong_canonical, e.translation_id,
+                       GROUP_CONCAT(LOWER(e.english_word), ' ') as rendering
+                FROM (
+                    SELECT translation_id, verse_key, original_word_position, english_word
+                    FROM english_word_alignments
+                    ORDER BY translation_id, verse_key, original_word_position, english_word_position
+                ) e
+                JOIN word_alignments w ON w.verse_key = e.verse_key
+                     AND w.word_position = e.original_word_position
+                WHERE w.strong_canonical IS NOT NULL
+                GROUP BY e.translation_id, e.verse_key, e.original_word_position
+            )
+            GROUP BY strong_canonical, translation_id, rendering
+        """)
+    conn.execute("DELETE FROM word_rendering_totals")
+    conn.execute("""
+        INSERT INTO word_rendering_totals (strong_number, translation_id, aligned, renderings)
+        SELECT strong_number, translation_id, SUM(count), COUNT(*)
+        FROM word_renderings
+        GROUP BY strong_number, translation_id
+    """)
+    conn.commit()
+
+
+def migrate_concordance(conn, batch_size: int):
+    """Precompute word frequency statistics and English rendering counts."""
+    if not table_columns(conn, "words"):
+        return
+    refresh_concordance(conn)
+    stats, renderings = (conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+                         for table in ("word_stats", "word_renderings"))
+    logger.info(f"  word_stats: {stats:,} words, word_renderings: {renderings:,} rows")
+
+
+# ---------------------------------------------------------------------------
+# 6. Per-translation verse search indexes
+# ---------------------------------------------------------------------------
+
+# One external-content FTS5 index per translation over a view of that
+# translation's verses, kept in sync by triggers that only fire for its rows.
+# The index rowid is the verse key, so a book or testament is a rowid range
+# that FTS5 applies while walking the postings (see 7.)
+VERSES_FTS_SCHEMA = """
+    CREATE VIEW IF NOT EXISTS {view} AS
+    SELECT verse_key, text, book, chapter, verse
+    FROM verses
+    WHERE translation_id = '{translation}';
+
+    CREATE VIRTUAL TABLE IF NOT EXISTS {table} USING fts5(
+        text,
+        book,
+        chapter,
+        verse,
+        content='{view}',
+        content_rowid='verse_key'
+    );
+
+    CREATE TRIGGER IF NOT EXISTS {table}_ai AFTER INSERT ON verses
+    WHEN new.translation_id = '{translation}' BEGIN
+        INSERT INTO {table}(rowid, text, book, chapter, verse)
+        VALUES (COALESCE(new.verse_key, new.book_order * 1000000 + new.chapter * 1000 + new.verse),
+                new.text, new.book, new.chapter, new.verse);
+    END;
+
+    CREATE TRIGGER IF NOT EXISTS {table}_ad AFTER DELETE ON verses
+    WHEN old.translation_id = '{translation}' BEGIN
+        INSERT INTO {table}({table}, rowid, text, book, chapter, verse)
+        VALUES ('delete', old.verse_key, old.text, old.book, old.chapter, old.verse);
+    END;
+
+    CREATE TRIGGER IF NOT EXISTS {table}_au
+    AFTER UPDATE OF text, book, chapter, verse, translation_id ON verses
+    WHEN old.translation_id = '{translation}' OR new.translation_id = '{translation}' BEGIN
+        INSERT INTO {table}({table}, rowid, text, book, chapter, verse)
+        SELECT 'delete', old.verse_key, old.text, old.book, old.chapter, old.verse
+        WHERE old.translation_id = '{translation}';
+        INSERT INTO {table}(rowid, text, book, chapter, verse)
+        SELECT new.verse_key, new.text, new.book, new.chapter, new.verse
+        WHERE new.translation_id = '{translation}';
+    END;
+"""
+
+
+def verses_fts_table(translation: str):
+    """Name of a translation's verse search index, or None for an unusable id."""
+    if not translation.isascii() or not translation.isalnum():
+        return None
+    return f"verses_fts_{translation.lower()}"
+
+
+def refresh_verse_search(conn, translations=None) -> dict:
+    """
+    Rebuild the per-translation verse search indexes (every translation in
+    the translations table or with verses, unless `translations` is given).
+    Run after importing a new translation (scripts/build_search_index.py).
+    Returns {translation: indexed verses}.
+    """
+    if translations is None:
+        translations = [row[0] for row in conn.execute("""
+            SELECT id FROM translations UNION SELECT DISTINCT translation_id FROM verses
+        """)]
+    indexed = {}
+    for translation in translations:
+        table = verses_fts_table(translation)
+        if table is None:
+            logger.warning(f"  skipping translation id {translation!r}: not alphanumeric")
+            continue
+        view = f"verses_text_{translation.lower()}"
+        # Dropping the table drops its shadow tables; an external-content
+        # 'rebuild' would index every translation's rows
+        conn.execute(f"DROP TABLE IF EXISTS {table}")
+        conn.execute(f"DROP VIEW IF EXISTS {view}")
+        for suffix in ("ai", "ad", "au"):
+            conn.execute(f"DROP TRIGGER IF EXISTS {table}_{suffix}")
+        conn.executescript(VERSES_FTS_SCHEMA.format(table=table, view=view, translation=translation))
+        conn.execute(f"""
+            INSERT INTO {table}(rowid, text, book, chapter, verse)
+            SELECT verse_key, text, book, chapter, verse FROM verses
+            WHERE translation_id = ?
+            ORDER BY verse_key
+        """, (translation,))
+        conn.execute(f"INSERT INTO {table}({table}) VALUES ('optimize')")
+        conn.commit()
+        indexed[translation] = conn.execute(f"SELECT COUNT(*) FROM {table}_docsize").fetchone()[0]
+    return indexed
+
+
+def migrate_translation_search(conn, batch_size: int):
+    """Split the all-translations verses_fts index into one index per translation."""
+    if not table_columns(conn, "verses"):
+        return
+    for translation, count in refresh_verse_search(conn).items():
+        logger.info(f"  {verses_fts_table(translation)}: {count:,} verses")
+    conn.executescript("""
+        DROP TRIGGER IF EXISTS verses_ai;
+        DROP TRIGGER IF EXISTS verses_ad;
+        DROP TRIGGER IF EXISTS verses_au;
+        DROP TABLE IF EXISTS verses_fts;
+    """)
+
+
+# ---------------------------------------------------------------------------
+# 7. Verse search indexes keyed by verse key
+# ---------------------------------------------------------------------------
+
+def migrate_search_verse_keys(conn, batch_size: int):
+    """Re-key verse search indexes built on verses.id by the verse key."""
+    stale = [
+        row[0] for row in conn.execute("""
+            SELECT name FROM sqlite_master
+            WHERE type = 'table' AND name LIKE 'verses_fts_%'
+              AND sql LIKE '%USING fts5%' AND sql NOT LIKE '%content_rowid=''verse_key''%'
+        """)
+    ]
+    if not stale:
+        return
+    translations = [row[0] for row in conn.execute("""
+        SELECT id FROM translations UNION SELECT DISTINCT translation_id FROM verses
+    """) if verses_fts_table(row[0]) in stale]
+    for translation, count in refresh_verse_search(conn, translations).items():
+        logger.info(f"  {verses_fts_table(translation)}: {count:,} verses")
+
+
+# ---------------------------------------------------------------------------
+# 8. Fuzzy search vocabulary
+# ---------------------------------------------------------------------------
+
+# Every indexed word with the number of verses and commentary entries it
+# appears in, and every lexicon transliteration, under FTS5 trigram indexes
+# (see backend/fuzzy.py). Terms, not texts: a fraction of a full-text index.
+SEARCH_VOCABULARY_SCHEMA = """
+    CREATE VIRTUAL TABLE IF NOT EXISTS search_vocabulary USING fts5(
+        term,
+        documents UNINDEXED,
+        tokenize='trigram'
+    );
+
+    CREATE VIRTUAL TABLE IF NOT EXISTS lexicon_trigram USING fts5(
+        transliteration,       -- lower case, without diacritics
+        strong_number UNINDEXED,
+        tokenize='trigram'
+    );
+"""
+
+
+def refresh_search_vocabulary(conn) -> bool:
+    """
+    Rebuild the fuzzy search vocabulary from the verse and commentary search
+    indexes and the lexicon (scripts/build_search_index.py). Returns False if
+    this SQLite build has no trigram tokenizer (3.34+), leaving fuzzy search off.
+    """
+    from .fuzzy import fold
+
+    try:
+        conn.executescript("""
+            DROP TABLE IF EXISTS search_vocabulary;
+            DROP TABLE IF EXISTS lexicon_trigram;
+        """ + SEARCH_VOCABULARY_SCHEMA)
+    except sqlite3.OperationalError as e:
+        logger.warning(f"  fuzzy search unavailable: {e}")
+        return False
+
+    sources = [
+        (row[0], "text") for row in conn.execute("""
+            SELECT name FROM sqlite_master
+            WHERE type = 'table' AND name LIKE 'verses_fts_%' AND sql LIKE '%USING fts5%'
+        """)
+    ]
+    if table_columns(conn, "commentary_fts"):
+        sources.append(("commentary_fts", "searchable_text"))
+    counts = []
+    for table, column in sources:
+        conn.execute(f"CREATE VIRTUAL TABLE temp.{table}_terms USING fts5vocab(main, {table}, col)")
+        counts.append(f"""
+            SELECT term, doc FROM temp.{table}_terms
+            WHERE col = '{column}' AND term GLOB '*[a-z]*'
+        """)
+    if counts:
+        conn.execute(f"""
+            INSERT INTO search_vocabulary (term, documents)
+            SELECT term, SUM(doc) FROM ({' UNION ALL '.join(counts)})
+            GROUP BY term
+            ORDER BY term
+        """)
+    for table, _ in sources:
+        conn.execute(f"DROP TABLE temp.{table}_terms")
+
+    if table_columns(conn, "lexicon"):
+        conn.executemany(
+            "INSERT INTO lexicon_trigram (transliteration, strong_number) VALUES (?, ?)",
+            ((fold(transliteration), strong_number) for strong_number, transliteration in conn.execute(
+                "SELECT strong_number, transliteration FROM lexicon WHERE transliteration IS NOT NULL"
+            ).fetchall())
+        )
+    for table in ("search_vocabulary", "lexicon_trigram"):
+        conn.execute(f"INSERT INTO {table}({table}) VALUES ('optimize')")
+    conn.commit()
+    return True
+
+
+def migrate_fuzzy_search(conn, batch_size: int):
+    """Build the trigram-indexed vocabulary behind /api/search?mode=fuzzy."""
+    if refresh_search_vocabulary(conn):
+        terms = conn.execute("SELECT COUNT(*) FROM search_vocabulary").fetchone()[0]
+        logger.info(f"  search_vocabulary: {terms:,} terms")
+
+
+# ---------------------------------------------------------------------------
+# 9. Cross-references ranked by votes
+# ---------------------------------------------------------------------------
+
+def migrate_crossref_votes(conn, batch_size: int):
+    """
+    Index cross-references by source verse and votes, so a verse's
+    best-voted references are the first entries of one index range.
+    """
+    columns = table_columns(conn, "cross_references")
+    if not columns:
+        return
+    if "votes" not in columns:
+        # Rows imported without votes stay NULL and rank last
+        conn.execute("ALTER TABLE cross_references ADD COLUMN votes INTEGER")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_crossref_votes "
+                 "ON cross_references(source_key, votes DESC, target_key, relationship_type)")
+    conn.commit()
+
+
+# Applied in order; a database at user_version N has had the first N applied.
+# Append only - never reorder or remove entries.
+MIGRATIONS = [
+    ("commentary_links", migrate_commentary_links),
+    ("verse_keys", migrate_verse_keys),
+    ("strong_canonical", migrate_strong_canonical),
+    ("word_occurrences", migrate_word_occurrences),
+    ("concordance", migrate_concordance),
+    ("translation_search", migrate_translation_search),
+    ("search_verse_keys", migrate_search_verse_keys),
+    ("fuzzy_search", migrate_fuzzy_search),
+    ("crossref_votes", migrate_crossref_votes),
+]
+
+SCHEMA_VERSION = len(MIGRATIONS)
+
+
+def pending_migrations(conn) -> list:
+    """Names of migrations not yet applied to this database."""
+    return [name for name, _ in MIGRATIONS[schema_version(conn):]]
+
+
+def run_migrations(conn, batch_size: int = DEFAULT_BATCH_SIZE, rerun: bool = False) -> list:
+    """
+    Apply pending migrations in order, bumping user_version after each.
+
+    With `rerun`, every migration runs again (they are idempotent) - use this
+    after an import script recreates a table without the derived columns.
+    Returns the names of the migrations that ran.
+    """
+    start = 0 if rerun else schema_version(conn)
+    ran = []
+    for version, (name, migration) in enumerate(MIGRATIONS[start:], start + 1):
+        logger.info(f"Running migration {version}: {name}")
+        started = time.perf_counter()
+        migration(conn, batch_size)
+        set_schema_version(conn, max(version, schema_version(conn)))
+        logger.info(f"Migration {version} ({name}) done in {time.perf_counter() - started:.1f}s")
+        ran.append(name)
+    if ran:
+        conn.execute("ANALYZE")
+        conn.commit()
+    return ran
@@ -1,7 +1,7 @@
 """
 Pydantic models for BibleMVP API.
 """
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from typing import Optional, List
 
 
@@ -34,6 +34,7 @@ class CrossReference(BaseModel):
     target_chapter: int
     target_verse: int
     relationship_type: Optional[str]
+    votes: Optional[int] = None
 
 
 class Passage(BaseModel):
@@ -97,3 +98,9 @@ class Devotional(BaseModel):
     title: Optional[str]
     content: str
     scripture_refs: Optional[List[str]]
+
+
+class VersesRequest(BaseModel):
+    """References to look up in one /api/verses request."""
+    refs: List[str] = Field(min_length=1)
+    translation: str = "WEB"
@@ -0,0 +1,271 @@
+"""
+Offline export builders for BibleMVP.
+
+A whole book is exported with one ordered query per data type; the result
+sets are merged chapter by chapter, so only one chapter is held in memory and
+each chapter can be sent (or written to a bundle) as soon as it is complete.
+
+Offline bundles are the same export written ahead of time (see
+scripts/build_offline_bundles.py) as gzip-compressed NDJSON files named by
+their content hash, listed in a manifest and served as immutable static files.
+"""
+from pathlib import Path
+import gzip
+import hashlib
+import json
+import os
+import tempfile
+
+from .responses import dumps
+
+# Per-chapter sections in output order. Each query selects the chapter first
+# and is ordered by verse key, so rows arrive grouped by chapter.
+BOOK_EXPORT_QUERIES = {
+    "verses": """
+        SELECT verse_key / 1000 % 1000 as chapter, verse, text
+        FROM verses
+        WHERE translation_id = :translation AND verse_key BETWEEN :first_key AND :last_key
+        ORDER BY verse_key
+    """,
+    "alignments": """
+        SELECT e.verse_key / 1000 % 1000 as chapter,
+               e.verse, e.english_word_position as position,
+               e.english_word as word, e.original_word_position,
+               w.hebrew_text as original_text, w.strong_number,
+               l.definition, l.language
+        FROM english_word_alignments e
+        JOIN word_alignments w ON w.verse_key = e.verse_key
+             AND w.word_position = e.original_word_position
+        LEFT JOIN lexicon l ON l.strong_number = w.strong_canonical
+        WHERE e.translation_id = :translation AND e.verse_key BETWEEN :first_key AND :last_key
+        ORDER BY e.verse_key, e.english_word_position
+    """,
+    "interlinear": """
+        SELECT verse_key / 1000 % 1000 as chapter,
+               verse, word_position as position, hebrew_text as original_text,
+               transliteration, english_gloss as gloss, strong_number
+        FROM word_alignments
+        WHERE verse_key BETWEEN :first_key AND :last_key
+        ORDER BY verse_key, word_position
+    """,
+    "crossRefs": """
+        SELECT x.source_key / 1000 % 1000 as chapter,
+               x.source_key % 1000 as source_verse, tb.name as target_book,
+               x.target_key / 1000 % 1000 as target_chapter,
+               x.target_key % 1000 as target_verse
+        FROM cross_references x
+        JOIN books tb ON tb.book_order = x.target_key / 1000000
+        WHERE x.source_key BETWEEN :first_key AND :last_key
+        ORDER BY x.source_key, x.target_key
+    """,
+    "commentary": """
+        SELECT chapter, source, reference_start, reference_end, content
+        FROM commentary_entries
+        WHERE start_key BETWEEN :first_key AND :last_key
+        ORDER BY start_key
+    """,
+}
+
+OPTIONAL_SECTIONS = ("alignments", "interlinear", "crossRefs", "commentary")
+
+# Bundles replace /api/offline/chapter, so they carry its full column set
+BUNDLE_QUERIES = {
+    **BOOK_EXPORT_QUERIES,
+    "alignments": """
+        SELECT e.verse_key / 1000 % 1000 as chapter,
+               e.verse, e.english_word_position as position,
+               e.english_word as word, e.original_word_position,
+               w.hebrew_text as original_text, w.transliteration,
+               w.english_gloss as gloss, w.strong_number, w.grammar,
+               l.definition, l.extended_definition, l.language
+        FROM english_word_alignments e
+        JOIN word_alignments w ON w.verse_key = e.verse_key
+             AND w.word_position = e.original_word_position
+        LEFT JOIN lexicon l ON l.strong_number = w.strong_canonical
+        WHERE e.translation_id = :translation AND e.verse_key BETWEEN :first_key AND :last_key
+        ORDER BY e.verse_key, e.english_word_position
+    """,
+    "interlinear": """
+        SELECT verse_key / 1000 % 1000 as chapter,
+               verse, word_position as position, hebrew_text as original_text,
+               transliteration, english_gloss as gloss, strong_number, grammar
+        FROM word_alignments
+        WHERE verse_key BETWEEN :first_key AND :last_key
+        ORDER BY verse_key, word_position
+    """,
+}
+
+# Per-book bundles stand in for "download this book" (every section); the
+# whole-Bible bundle for "download this translation" (text and word data)
+BOOK_BUNDLE_SECTIONS = OPTIONAL_SECTIONS
+BIBLE_BUNDLE_SECTIONS = ("alignments", "interlinear")
+
+BUNDLE_DIR = Path(os.environ.get(
+    "OFFLINE_BUNDLE_DIR", Path(__file__).parent.parent / "data" / "bundles"
+))
+BUNDLE_URL_PREFIX = "/bundles/"
+MANIFEST_NAME = "manifest.json"
+
+
+def encode_json(value) -> str:
+    """Compact JSON, byte-for-byte what JSONResponse would send."""
+    return dumps(value).decode("utf-8")
+
+
+def _chapter_rows(cursor):
+    """Yield (chapter, row dict) from a cursor whose first column is the chapter."""
+    names = [column[0] for column in cursor.description][1:]
+    for row in cursor:
+        values = tuple(row)
+        yield values[0], dict(zip(names, values[1:]))
+
+
+def iter_book_chapters(conn, book: str, translation: str, sections=OPTIONAL_SECTIONS,
+                       queries=BOOK_EXPORT_QUERIES):
+    """
+    Yield (chapter, chapter_data) for every chapter of `book` that has verses
+    in `translation`, with the requested optional sections.
+    """
+    row = conn.execute("SELECT book_order FROM books WHERE name = ?", (book,)).fetchone()
+    if row is None:
+        return
+    params = {
+        "translation": translation,
+        "first_key": row[0] * 1_000_000,
+        "last_key": row[0] * 1_000_000 + 999_999,
+    }
+
+    streams = {}
+    for name in ("verses",) + tuple(s for s in OPTIONAL_SECTIONS if s in sections):
+        streams[name] = _chapter_rows(conn.execute(queries[name], params))
+    pending = {name: next(stream, None) for name, stream in streams.items()}
+
+    current = None
+    chapter_data = None
+    while pending["verses"] is not None:
+        chapter, verse = pending["verses"]
+        if chapter != current:
+            if chapter_data is not None:
+                yield current, chapter_data
+            current = chapter
+            chapter_data = {name: [] for name in streams}
+            # Pull every other section's rows for this chapter (rows for
+            # chapters without verses in this translation are skipped)
+            for name, stream in streams.items():
+                if name == "verses":
+                    continue
+                while pending[name] is not None and pending[name][0] <= chapter:
+                    if pending[name][0] == chapter:
+                        chapter_data[name].append(pending[name][1])
+                    pending[name] = next(stream, None)
+        chapter_data["verses"].append(verse)
+        pending["verses"] = next(streams["verses"], None)
+
+    if chapter_data is not None:
+        yield current, chapter_data
+
+
+def write_book_json(conn, emit, book: str, translation: str, sections=OPTIONAL_SECTIONS):
+    """
+    Emit the offline book export as JSON text chunks, one per chapter:
+    {"book": ..., "translation": ..., "chapters": {"1": {...}, ...}}
+    """
+    emit(f'{{"book":{encode_json(book)},"translation":{encode_json(translation)},"chapters":{{')
+    separator = ""
+    for chapter, chapter_data in iter_book_chapters(conn, book, translation, sections):
+        emit(f'{separator}"{chapter}":{encode_json(chapter_data)}')
+        separator = ","
+    emit("}}")
+
+
+def write_book_ndjson(conn, emit, book: str, translation: str, sections=OPTIONAL_SECTIONS):
+    """Emit the offline book export as NDJSON: a header line, then one line per chapter."""
+    emit(encode_json({"book": book, "translation": translation}) + "\n")
+    for chapter, chapter_data in iter_book_chapters(conn, book, translation, sections):
+        emit(encode_json({"chapter": chapter, **chapter_data}) + "\n")
+
+
+def write_bundle(conn, emit, books, translation: str, sections):
+    """
+    Emit an offline bundle as NDJSON: a header line, then one line per
+    chapter of every book in `books`, with the bundle column set.
+    """
+    emit(encode_json({"translation": translation, "sections": ["verses", *sections]}) + "\n")
+    for book in books:
+        for chapter, chapter_data in iter_book_chapters(conn, book, translation, sections,
+                                                        queries=BUNDLE_QUERIES):
+            emit(encode_json({"book": book, "chapter": chapter, **chapter_data}) + "\n")
+
+
+def save_bundle(conn, root: Path, name: str, books, translation: str, sections,
+                level: int = 9) -> dict:
+    """
+    Write a gzip-compressed bundle to `root`/`name`.<hash>.ndjson.gz and
+    return its manifest entry. The gzip header carries no file name or
+    timestamp, so unchanged data produces the same file (and URL) every build.
+    """
+    target = root / name
+    target.parent.mkdir(parents=True, exist_ok=True)
+    counts = {"lines": 0, "bytes": 0}
+
+    fd, tmp_name = tempfile.mkstemp(dir=target.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as raw, \
+                gzip.GzipFile(filename="", mode="wb", compresslevel=level, fileobj=raw, mtime=0) as out:
+            def emit(text):
+                data = text.encode("utf-8")
+                counts["lines"] += 1
+                counts["bytes"] += len(data)
+                out.write(data)
+
+            write_bundle(conn, emit, books, translation, sections)
+
+        digest = hashlib.sha256()
+        with open(tmp_name, "rb") as f:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                digest.update(block)
+        sha256 = digest.hexdigest()
+        path = target.with_name(f"{target.name}.{sha256[:16]}.ndjson.gz")
+        os.replace(tmp_name, path)
+    except BaseException:
+        os.unlink(tmp_name)
+        raise
+
+    return {
+        "url": BUNDLE_URL_PREFIX + path.relative_to(root).as_posix(),
+        "size": path.stat().st_size,
+        "sha256": sha256,
+        "uncompressed_size": counts["bytes"],
+        "chapters": counts["lines"] - 1,
+        "sections": ["verses", *sections],
+    }
+
+
+_manifest_cache = {"mtime": None, "manifest": None, "files": frozenset()}
+
+
+def load_bundle_manifest():
+    """
+    The bundle manifest written by scripts/build_offline_bundles.py, or None
+    if no bundles have been built. Re-read only when the file changes.
+    """
+    path = BUNDLE_DIR / MANIFEST_NAME
+    try:
+        mtime = path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
+    if _manifest_cache["mtime"] != mtime:
+        manifest = json.loads(path.read_text())
+        _manifest_cache.update(
+            mtime=mtime,
+            manifest=manifest,
+            files=frozenset(b["url"][len(BUNDLE_URL_PREFIX):] for b in manifest["bundles"]),
+        )
+    return _manifest_cache["manifest"]
+
+
+def bundle_path(name: str):
+    """Filesystem path for a bundle listed in the current manifest, else None."""
+    if load_bundle_manifest() is None or name not in _manifest_cache["files"]:
+        return None
+    return BUNDLE_DIR / name
@@ -0,0 +1,232 @@
+"""
+Bible reference parsing for BibleMVP, shared by the API and the import scripts.
+
+Book names, abbreviations (English, OSIS and USFM) and the grammar are
+compiled once at import time, and parsed strings are kept in an LRU cache,
+so reparsing the same reference costs a dict lookup. A reference string is
+a list of passages separated by ";" or ",":
+
+    John 3:16; Rom 5:8, 10        verses, with the book and chapter carried over
+    Gen 1:26-2:3                  a range across chapters
+    Genesis 1-3, Jude             whole chapters and whole books
+    Ps.148.4-Ps.148.5             OSIS (cross_references.txt), GEN 1:3 (USFM)
+
+Each passage is a VerseRange of inclusive BBCCCVVV verse keys; a whole
+chapter ends at verse 999 and a whole book at chapter 999.
+"""
+from functools import lru_cache
+import re
+from typing import NamedTuple, Optional
+
+# Canonical book order (matches the books table); used for BBCCCVVV verse keys
+OT_BOOKS = [
+    "Genesis", "Exodus", "Leviticus", "Numbers", "Deuteronomy",
+    "Joshua", "Judges", "Ruth", "1 Samuel", "2 Samuel",
+    "1 Kings", "2 Kings", "1 Chronicles", "2 Chronicles",
+    "Ezra", "Nehemiah", "Esther", "Job", "Psalms", "Proverbs",
+    "Ecclesiastes", "Song of Solomon", "Isaiah", "Jeremiah",
+    "Lamentations", "Ezekiel", "Daniel", "Hosea", "Joel", "Amos",
+    "Obadiah", "Jonah", "Micah", "Nahum", "Habakkuk", "Zephaniah",
+    "Haggai", "Zechariah", "Malachi"
+]
+NT_BOOKS = [
+    "Matthew", "Mark", "Luke", "John", "Acts", "Romans",
+    "1 Corinthians", "2 Corinthians", "Galatians", "Ephesians",
+    "Philippians", "Colossians", "1 Thessalonians", "2 Thessalonians",
+    "1 Timothy", "2 Timothy", "Titus", "Philemon", "Hebrews",
+    "James", "1 Peter", "2 Peter", "1 John", "2 John", "3 John",
+    "Jude", "Revelation"
+]
+BOOKS = OT_BOOKS + NT_BOOKS
+BOOK_ORDER = {name: i for i, name in enumerate(BOOKS, 1)}
+
+# Abbreviations per book, in canonical order: common English forms, then
+# OSIS (Gen, 1Sam, Phlm) and USFM (GEN, 1SA, JHN) codes
+_ABBREVIATIONS = [
+    "gen ge gn", "ex exo exod", "lev le lv", "num nu nm nb", "deut deu de dt",
+    "josh jos jsh", "judg jdg jg jdgs", "ruth rth ru rut", "1sam 1sa 1s", "2sam 2sa 2s",
+    "1kgs 1ki 1kg 1k", "2kgs 2ki 2kg 2k", "1chr 1ch 1chron", "2chr 2ch 2chron",
+    "ezr", "neh ne", "esth est es", "jb", "ps psa psalm pss psm", "prov pro pr prv",
+    "eccl ecc ec qoh", "song sng sos so sol ca canticles songofsongs", "isa is",
+    "jer je jr", "lam la", "ezek eze ezk", "dan da dn", "hos ho", "joe jl jol",
+    "am amo", "obad oba ob", "jon jnh", "mic mi", "nah na nam", "hab hb",
+    "zeph zep zp", "hag hg", "zech zec zc zac", "mal ml",
+    "matt mat mt", "mk mar mrk mr", "lk luk lu", "jn jhn joh",
+    "act ac", "rom ro rm", "1cor 1co", "2cor 2co", "gal ga", "eph ephes",
+    "phil php pp", "col co", "1thess 1th 1thes", "2thess 2th 2thes",
+    "1tim 1ti", "2tim 2ti", "tit ti", "phlm phm philem", "heb",
+    "jas jm jam", "1pet 1pe 1pt", "2pet 2pe 2pt", "1jn 1jo 1joh 1jhn", "2jn 2jo 2joh 2jhn",
+    "3jn 3jo 3joh 3jhn", "jud jude", "rev re rv",
+]
+
+# Lookup key (lower case, no spaces or dots) -> canonical book name
+BOOK_ALIASES = {
+    **{name.lower().replace(" ", ""): name for name in BOOKS},
+    **{alias: book for book, aliases in zip(BOOKS, _ABBREVIATIONS) for alias in aliases.split()},
+}
+
+REFERENCE_CACHE_SIZE = 8192
+MAX_CHAPTER = 999
+MAX_VERSE = 999
+
+# One passage: [book] chapter[:verse] [- [book] chapter[:verse]]. "." also
+# separates chapter and verse (OSIS), and a letter after a verse (25:7b) is
+# a part of that verse
+_BOOK = r"(?:[1-3]\s*)?[a-z][a-z .]*?"
+_POINT = r"(\d+)[ab]?(?:\s*[:.]\s*(\d+)[a-z]?)?"
+PASSAGE_PATTERN = re.compile(
+    rf"^(?:({_BOOK})\s*\.?\s*(?=\d|$))?(?:{_POINT}(?:\s*-\s*(?:({_BOOK})\s*\.?\s*)?{_POINT})?)?$",
+    re.ASCII,
+)
+LIST_SEPARATOR = re.compile(r"\s*([;,])\s*")
+DASHES = re.compile(r"\s*(?:--|[‒-―])\s*")
+
+
+def verse_key(book_order: int, chapter: int, verse: int) -> int:
+    """Canonical integer verse id (BBCCCVVV), e.g. John 3:16 -> 43003016."""
+    return book_order * 1_000_000 + chapter * 1000 + verse
+
+
+def book_name(text: str) -> Optional[str]:
+    """Canonical book name for a name or abbreviation ("1 jn", "Ps.", "JHN"), or None."""
+    return BOOK_ALIASES.get(text.lower().replace(" ", "").replace(".", ""))
+
+
+@lru_cache(maxsize=1024)
+def _book_order(text: str) -> int:
+    """book_order for a (lower case) name or abbreviation as written, 0 if unknown."""
+    return BOOK_ORDER.get(book_name(text), 0)
+
+
+class VerseRange(NamedTuple):
+    """An inclusive range of verse keys; has_verse if a verse number was given."""
+    start: int
+    end: int
+    has_verse: bool
+
+    @property
+    def book(self) -> str:
+        return BOOKS[self.start // 1_000_000 - 1]
+
+    @property
+    def chapter(self) -> int:
+        return self.start // 1000 % 1000
+
+    @property
+    def verse_start(self) -> int:
+        return self.start % 1000
+
+    @property
+    def end_book(self) -> str:
+        return BOOKS[self.end // 1_000_000 - 1]
+
+    @property
+    def end_chapter(self) -> int:
+        return self.end // 1000 % 1000
+
+    @property
+    def verse_end(self) -> int:
+        return self.end % 1000
+
+    def __str__(self) -> str:
+        """Canonical form: "John 3:16-18", "Genesis 1:26-2:3", "Genesis 1-3", "Jude"."""
+        book, chapter, verse = self.book, self.chapter, self.verse_start
+        end_book, end_chapter, end_verse = self.end_book, self.end_chapter, self.verse_end
+        if not self.has_verse:
+            if end_chapter == MAX_CHAPTER:
+                return book
+            start = f"{book} {chapter}"
+            if (book, chapter) == (end_book, end_chapter):
+                return start
+            return f"{start}-{end_chapter}" if book == end_book else f"{start}-{end_book} {end_chapter}"
+        start = f"{book} {chapter}:{verse}"
+        if book != end_book:
+            return f"{start}-{end_book} {end_chapter}:{end_verse}"
+        if chapter != end_chapter:
+            return f"{start}-{end_chapter}:{end_verse}"
+        return start if verse == end_verse else f"{start}-{end_verse}"
+
+
+def _passage(text: str, context: list) -> Optional[VerseRange]:
+    """
+    Parse one passage. `context` is [book order, chapter, verse given] from
+    the previous passage in the list; a passage without a book continues it.
+    """
+    match = PASSAGE_PATTERN.match(text)
+    if not match:
+        return None
+    book, chapter, verse, end_book, end_chapter, end_verse = (
+        group if group is None or not group.isdigit() else int(group) for group in match.groups()
+    )
+
+    if book:
+        order = _book_order(book)
+        if not order:
+            return None
+    elif context[0] and chapter:
+        order = context[0]
+        if verse is None and context[2]:
+            # "Rom 5:8, 10": a bare number after a verse is another verse
+            chapter, verse = context[1], chapter
+            if end_chapter and end_verse is None:
+                end_chapter, end_verse = context[1], end_chapter
+    else:
+        return None
+
+    end_order = order
+    if end_chapter is not None:
+        if end_book:
+            end_order = _book_order(end_book)
+            if not end_order:
+                return None
+        elif verse is not None and end_verse is None:
+            # "John 3:16-18": the end is a verse in the same chapter
+            end_chapter, end_verse = chapter, end_chapter
+    else:
+        end_chapter, end_verse = chapter, verse
+
+    has_verse = verse is not None or end_verse is not None
+    if chapter is None:
+        # A whole book
+        start, end = verse_key(order, 1, 1), verse_key(end_order, MAX_CHAPTER, MAX_VERSE)
+    else:
+        numbers = [n for n in (chapter, verse, end_chapter, end_verse) if n is not None]
+        if min(numbers) < 1 or max(numbers) > MAX_VERSE:
+            return None
+        start = verse_key(order, chapter, 1 if verse is None else verse)
+        end = verse_key(end_order, end_chapter, MAX_VERSE if end_verse is None else end_verse)
+    if end < start:
+        return None
+
+    context[:] = [end_order, end_chapter, has_verse]
+    return VerseRange(start, end, has_verse)
+
+
+@lru_cache(maxsize=REFERENCE_CACHE_SIZE)
+def parse_references(text: str) -> Optional[tuple]:
+    """
+    Parse a reference or a ";"/"," separated list of them into a tuple of
+    VerseRanges, in the order given. None if any part is invalid or names
+    an unknown book.
+    """
+    text = " ".join(text.lower().split())
+    if "--" in text or not text.isascii():
+        text = DASHES.sub("-", text)
+    parts = LIST_SEPARATOR.split(text) if "," in text or ";" in text else [text]
+    context = [None, None, False]
+    ranges = []
+    for i in range(0, len(parts), 2):
+        if i and parts[i - 1] == ";":
+            # A new chapter or book: "John 3:16; 4" is chapter 4
+            context[2] = False
+        passage = _passage(parts[i], context)
+        if passage is None:
+            return None
+        ranges.append(passage)
+    return tuple(ranges) or None
+
+
+def parse_reference(text: str) -> Optional[VerseRange]:
+    """Parse a single passage ("John 3:16-18", "Gen 1:26-2:3", "Jude"); None if invalid or a list."""
+    ranges = parse_references(text)
+    return ranges[0] if ranges and len(ranges) == 1 else None
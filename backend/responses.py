@@ -0,0 +1,35 @@
+"""
+Fast JSON responses for BibleMVP.
+
+FastAPI runs every returned dict through `jsonable_encoder` before encoding
+it, which walks each value of each row and dominated CPU for large payloads.
+Handlers instead build plain dicts straight from cursor tuples
+(`db.fetch_dicts`) and return a FastJSONResponse, which FastAPI sends as is.
+It encodes with orjson when installed, and the output is byte-for-byte what
+JSONResponse would produce.
+"""
+import json
+
+from fastapi.responses import JSONResponse
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def dumps(value) -> bytes:
+    """Compact UTF-8 JSON, identical to JSONResponse's encoding."""
+    if orjson is not None:
+        # Non-string keys (e.g. verse numbers) become strings, as with json.dumps
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(
+        value, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")
+    ).encode("utf-8")
+
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse encoded with `dumps`; return it to bypass jsonable_encoder."""
+
+    def render(self, content) -> bytes:
+        return dumps(content)
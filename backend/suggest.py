@@ -0,0 +1,183 @@
+"""
+Reference and term autocomplete for BibleMVP (/api/suggest).
+
+Everything needed to complete a keystroke is held in memory: book names and
+every known abbreviation as a sorted key array searched with bisect, the real
+chapter and verse counts of every book, and the fuzzy search vocabulary with
+the most frequent completions of every short prefix precomputed. The index is
+built from the database on first use and rebuilt when its data version changes.
+"""
+from bisect import bisect_left
+import heapq
+import logging
+import re
+import sqlite3
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+TERM_PREFIX_CACHE_LENGTH = 3   # top completions precomputed for prefixes up to this long
+TERM_PREFIX_CACHE_SIZE = 20
+
+# The last verse key of every chapter of one translation, by skipping through
+# idx_verses_key: two index seeks per chapter instead of a scan of every verse
+LAST_VERSES_SQL = """
+    WITH RECURSIVE chapters(last_key) AS (
+        SELECT MAX(verse_key) FROM verses
+        WHERE translation_id = ?1 AND verse_key < (
+            SELECT MIN(verse_key) FROM verses WHERE translation_id = ?1
+        ) / 1000 * 1000 + 1000
+        UNION ALL
+        SELECT (
+            SELECT MAX(verse_key) FROM verses
+            WHERE translation_id = ?1 AND verse_key < (
+                SELECT MIN(verse_key) FROM verses
+                WHERE translation_id = ?1 AND verse_key > chapters.last_key
+            ) / 1000 * 1000 + 1000
+        )
+        FROM chapters WHERE chapters.last_key IS NOT NULL
+    )
+    SELECT last_key / 1000000, last_key / 1000 % 1000, last_key % 1000
+    FROM chapters WHERE last_key IS NOT NULL
+"""
+
+# "1 jo", "john 3", "john 3:1", "song of sol 2:" (lower case)
+REFERENCE_INPUT = re.compile(r"^(\d?\s*[a-z][a-z .]*?|\d)\s*(?:(\d+)\s*(?::\s*(\d*))?)?$")
+
+
+def book_key(text: str) -> str:
+    """Lookup key for a book name or abbreviation: lower case, no spaces or dots."""
+    return text.lower().replace(" ", "").replace(".", "")
+
+
+class SuggestIndex:
+    """Prefix index over books, abbreviations, chapter/verse counts and search terms."""
+
+    def __init__(self, books: list, aliases: dict, verse_counts: Optional[dict], terms: list):
+        self.book_order = {book: order for order, book in enumerate(books, 1)}
+        # Sorted (key, book) pairs: names and abbreviations, one entry per spelling
+        self.book_keys = sorted(
+            {(book_key(book), book) for book in books}
+            | {(book_key(alias), book) for alias, book in aliases.items()
+               if book in self.book_order and not alias[-1].isdigit()}
+        )
+        self._book_key_list = [key for key, _ in self.book_keys]
+        # book -> [verses in chapter 1, 2, ...]; None completes book names only
+        self.verse_counts = verse_counts
+        # Sorted (term, documents) and precomputed top completions of short prefixes
+        self.terms = sorted(terms)
+        self._term_list = [term for term, _ in self.terms]
+        self._top_terms = {}
+        for term, documents in self.terms:
+            for length in range(1, min(len(term), TERM_PREFIX_CACHE_LENGTH) + 1):
+                self._top_terms.setdefault(term[:length], []).append((documents, term))
+        for prefix, entries in self._top_terms.items():
+            self._top_terms[prefix] = [
+                (term, documents) for documents, term in heapq.nlargest(TERM_PREFIX_CACHE_SIZE, entries)
+            ]
+
+    @classmethod
+    def build(cls, conn, aliases: dict) -> "SuggestIndex":
+        """Load books, abbreviations, chapter/verse counts and the search vocabulary."""
+        rows = conn.execute("SELECT name, abbreviation FROM books ORDER BY book_order").fetchall()
+        books = [row[0] for row in rows]
+        aliases = {**aliases, **{row[1]: row[0] for row in rows if row[1]}}
+
+        verse_counts = {}
+        try:
+            for translation, in conn.execute("SELECT id FROM translations").fetchall():
+                for order, chapter, verses in conn.execute(LAST_VERSES_SQL, (translation,)):
+                    if 1 <= order <= len(books):
+                        counts = verse_counts.setdefault(books[order - 1], [])
+                        counts.extend([0] * (chapter - len(counts)))
+                        counts[chapter - 1] = max(counts[chapter - 1], verses)
+        except sqlite3.OperationalError as e:
+            # No verse keys yet (migrations pending): complete book names only
+            logger.warning(f"Suggest index without chapters and verses: {e}")
+            verse_counts = None
+
+        terms = []
+        if conn.execute("SELECT 1 FROM sqlite_master WHERE name = 'search_vocabulary'").fetchone():
+            terms = [tuple(row) for row in conn.execute("SELECT term, documents FROM search_vocabulary")]
+        return cls(books, aliases, verse_counts, terms)
+
+    def match_books(self, prefix: str) -> list:
+        """Books with a name or abbreviation starting with `prefix`: exact spellings first, then canonical order."""
+        key = book_key(prefix)
+        exact, partial = [], set()
+        i = bisect_left(self._book_key_list, key)
+        while i < len(self.book_keys) and self.book_keys[i][0].startswith(key):
+            candidate, book = self.book_keys[i]
+            if candidate == key:
+                exact.append(book)
+            else:
+                partial.add(book)
+            i += 1
+        exact.sort(key=self.book_order.get)
+        return exact + sorted(partial - set(exact), key=self.book_order.get)
+
+    def complete_terms(self, prefix: str, limit: int) -> list:
+        """The most frequent search terms starting with `prefix`, as (term, documents)."""
+        if len(prefix) <= TERM_PREFIX_CACHE_LENGTH:
+            return self._top_terms.get(prefix, [])[:limit]
+        start = bisect_left(self._term_list, prefix)
+        end = bisect_left(self._term_list, prefix + "\uffff", start)
+        return heapq.nlargest(limit, self.terms[start:end], key=lambda entry: entry[1])
+
+    def suggest(self, q: str, limit: int, terms: bool = True) -> list:
+        """
+        Completions of a partly typed reference or search: books, then chapters
+        (bounded by the book's real chapter count), then verse numbers; and,
+        for free text, the most frequent search terms for its last word.
+        """
+        text = " ".join(q.lower().split())
+        suggestions = []
+
+        match = REFERENCE_INPUT.match(text)
+        books = self.match_books(match.group(1)) if match else []
+        if self.verse_counts is not None:
+            books = [book for book in books if book in self.verse_counts]
+        if books:
+            chapter, verse = match.group(2), match.group(3)
+            book = books[0]
+            chapters = (self.verse_counts or {}).get(book, [])
+            if chapter is None:
+                suggestions = [{"type": "book", "text": book} for book in books[:limit]]
+            elif verse is None:
+                suggestions = [
+                    {"type": "chapter", "text": f"{book} {n}"}
+                    for n in range(1, len(chapters) + 1)
+                    if chapters[n - 1] and str(n).startswith(chapter)
+                ][:limit]
+            elif 1 <= int(chapter) <= len(chapters):
+                suggestions = [
+                    {"type": "verse", "text": f"{book} {int(chapter)}:{n}"}
+                    for n in range(1, chapters[int(chapter) - 1] + 1)
+                    if str(n).startswith(verse)
+                ][:limit]
+
+        # Free text only: "1 j" and "john 3" are references, not searches
+        words = text.split()
+        if terms and len(suggestions) < limit and words and not q[-1].isspace() \
+                and all(word.isalpha() for word in words):
+            head = " ".join(words[:-1])
+            suggestions += [
+                {"type": "term", "text": f"{head} {term}".lstrip(), "documents": documents}
+                for term, documents in self.complete_terms(words[-1], limit - len(suggestions))
+            ]
+        return suggestions
+
+
+_current = {"version": None, "index": None}
+
+
+def cached_suggest_index(version):
+    """The suggest index built for `version`, or None if it must be (re)built."""
+    return _current["index"] if _current["version"] == version else None
+
+
+def load_suggest_index(conn, version, aliases: dict) -> SuggestIndex:
+    """Build the suggest index from the database and keep it for `version`."""
+    index = SuggestIndex.build(conn, aliases)
+    _current.update(version=version, index=index)
+    return index
@@ -238,8 +238,13 @@ function bibleApp() {
         showSearch: false,
         searchQuery: '',
         searchScope: 'all',
+        searchFuzzy: false,    // also match misspelled and partial words
         searchResults: [],
         searchWordInfo: null,  // Strong's word info for Strong's searches
+        searchTotals: {},      // total hits per result type
+        searchFacets: null,    // verse hits per book and testament
+        searchNextCursor: {},  // cursor for the next page of each result type
+        searchDidYouMean: null,  // suggested spelling of the query
         searchLoading: false,
         searchPerformed: false,
         searchDebounceTimer: null,
@@ -249,6 +254,7 @@ function bibleApp() {
         bookSuggestions: [],
         showSuggestions: false,
         selectedSuggestionIndex: -1,
+        suggestRequest: 0,
 
         // Book picker state
         showBookPicker: false,
@@ -264,6 +270,8 @@ function bibleApp() {
             y: 0
         },
         previewTimeout: null,
+        previewTexts: {},       // `${translation}|${reference}` -> verse text
+        previewPrefetch: null,  // in-flight /api/verses request for crossRefs
 
         // Copy feedback
         copyFeedback: null,
@@ -677,34 +685,56 @@ function bibleApp() {
             return null;
         },
 
-        // Autocomplete: filter books based on input
-        updateSuggestions() {
-            const input = this.referenceInput.trim().toLowerCase();
+        // Autocomplete: books, chapters and verses from /api/suggest
+        async updateSuggestions() {
+            const input = this.referenceInput.trim();
+            const request = ++this.suggestRequest;
 
-            // Only show suggestions if typing a book name (no chapter yet)
-            if (!input || /\d/.test(input)) {
+            if (!input) {
                 this.bookSuggestions = [];
                 this.showSuggestions = false;
                 return;
             }
 
-            this.bookSuggestions = BIBLE_BOOKS.filter(book =>
-                book.toLowerCase().startsWith(input)
-            ).slice(0, 6);
-
+            let suggestions;
+            try {
+                const response = await fetch(
+                    `/api/suggest?q=${encodeURIComponent(input)}&limit=6&terms=false`
+                );
+                if (!response.ok) throw new Error('Suggest failed');
+                const data = await response.json();
+                suggestions = data.suggestions.map(suggestion => suggestion.text);
+            } catch (error) {
+                // Offline: filter book names locally
+                const lower = input.toLowerCase();
+                suggestions = /\d/.test(lower) ? [] : BIBLE_BOOKS.filter(book =>
+                    book.toLowerCase().startsWith(lower)
+                ).slice(0, 6);
+            }
+
+            // A slower response for an earlier keystroke must not win
+            if (request !== this.suggestRequest) return;
+            this.bookSuggestions = suggestions;
             this.showSuggestions = this.bookSuggestions.length > 0;
             this.selectedSuggestionIndex = -1;
         },
 
         // Autocomplete: select a suggestion
-        selectSuggestion(book) {
-            this.referenceInput = book + ' ';
+        selectSuggestion(suggestion) {
+            this.suggestRequest++;
             this.showSuggestions = false;
             this.bookSuggestions = [];
-            // Focus back on input for chapter entry
-            this.$nextTick(() => {
-                this.$refs.referenceInput?.focus();
-            });
+            if (BIBLE_BOOKS.includes(suggestion)) {
+                this.referenceInput = suggestion + ' ';
+                // Focus back on input for chapter entry
+                this.$nextTick(() => {
+                    this.$refs.referenceInput?.focus();
+                });
+            } else {
+                // A chapter or verse: go straight there
+                this.referenceInput = suggestion;
+                this.loadPassage();
+            }
         },
 
         // Autocomplete: handle keyboard navigation
@@ -1025,7 +1055,7 @@ function bibleApp() {
             try {
                 const ref = `${this.currentBook} ${this.currentChapter}:${verseNum}`;
                 const response = await fetch(
-                    `/api/passage/${encodeURIComponent(ref)}/crossrefs`
+                    `/api/passage/${encodeURIComponent(ref)}/crossrefs?include_text=true&translation=${this.translation}`
                 );
                 if (response.ok) {
                     const data = await response.json();
@@ -1234,7 +1264,7 @@ function bibleApp() {
         async loadCrossRefs() {
             try {
                 const response = await fetch(
-                    `/api/passage/${encodeURIComponent(this.currentReference)}/crossrefs`
+                    `/api/passage/${encodeURIComponent(this.currentReference)}/crossrefs?include_text=true&translation=${this.translation}`
                 );
 
                 if (response.ok) {
@@ -1260,26 +1290,72 @@ function bibleApp() {
             // Delay slightly to avoid flickering
             this.previewTimeout = setTimeout(async () => {
                 try {
-                    const response = await fetch(
-                        `/api/verse/${encodeURIComponent(ref)}?translation=${this.translation}`
-                    );
+                    const key = `${this.translation}|${ref}`;
+                    if (!(key in this.previewTexts)) {
+                        // First hover: fetch every cross-reference's preview at once
+                        await this.prefetchPreviews();
+                    }
+                    let text = this.previewTexts[key];
+                    if (text === undefined) {
+                        const response = await fetch(
+                            `/api/verse/${encodeURIComponent(ref)}?translation=${this.translation}`
+                        );
+                        if (!response.ok) return;
+                        text = this.previewTexts[key] = (await response.json()).text;
+                    }
+
+                    const rect = event.target.getBoundingClientRect();
+                    this.versePreview = {
+                        show: true,
+                        reference: ref,
+                        text: text,
+                        x: Math.min(rect.left, window.innerWidth - 320),
+                        y: rect.bottom + window.scrollY + 8
+                    };
+                } catch (err) {
+                    console.error('Failed to load verse preview:', err);
+                }
+            }, 200);
+        },
+
+        // Fill previewTexts for every current cross-reference target in one request
+        prefetchPreviews() {
+            if (this.previewPrefetch) return this.previewPrefetch;
+
+            const translation = this.translation;
+            const refs = [];
+            for (const ref of this.crossRefs) {
+                const target = `${ref.target_book} ${ref.target_chapter}:${ref.target_verse}`;
+                const key = `${translation}|${target}`;
+                if (ref.target_text != null) {
+                    this.previewTexts[key] = ref.target_text;
+                } else if (!(key in this.previewTexts)) {
+                    refs.push(target);
+                }
+            }
+            if (!refs.length) return Promise.resolve();
 
+            this.previewPrefetch = (async () => {
+                try {
+                    // POST: a chapter's targets can be too many for a URL
+                    const response = await fetch('/api/verses', {
+                        method: 'POST',
+                        headers: { 'Content-Type': 'application/json' },
+                        body: JSON.stringify({ refs: refs.slice(0, 500), translation })
+                    });
                     if (response.ok) {
                         const data = await response.json();
-                        const rect = event.target.getBoundingClientRect();
-
-                        this.versePreview = {
-                            show: true,
-                            reference: ref,
-                            text: data.text,
-                            x: Math.min(rect.left, window.innerWidth - 320),
-                            y: rect.bottom + window.scrollY + 8
-                        };
+                        for (const [ref, text] of Object.entries(data.verses)) {
+                            this.previewTexts[`${translation}|${ref}`] = text;
+                        }
                     }
                 } catch (err) {
-                    console.error('Failed to load verse preview:', err);
+                    console.error('Failed to prefetch verse previews:', err);
+                } finally {
+                    this.previewPrefetch = null;
                 }
-            }, 200);
+            })();
+            return this.previewPrefetch;
         },
 
         // Hide verse preview
@@ -1559,9 +1635,13 @@ function bibleApp() {
         async loadWordDetails(strongNumber) {
             this.showAllOccurrences = false;
             try {
-                const response = await fetch(`/api/word/${strongNumber}`);
+                const [response, renderingsResponse] = await Promise.all([
+                    fetch(`/api/word/${strongNumber}`),
+                    fetch(`/api/word/${strongNumber}/translations?limit=8`)
+                ]);
                 if (response.ok) {
                     const data = await response.json();
+                    const renderings = renderingsResponse.ok ? (await renderingsResponse.json()).renderings : [];
                     this.selectedWord = {
                         text: data.word.original || strongNumber,
                         original: data.word.original,
@@ -1574,7 +1654,10 @@ function bibleApp() {
                         derivation: data.word.derivation,
                         language: data.word.language,
                         occurrences: data.occurrences,
-                        count: data.count
+                        count: data.count,
+                        books: data.books,
+                        nextCursor: data.next_cursor,
+                        renderings
                     };
                 }
             } catch (err) {
@@ -1582,6 +1665,22 @@ function bibleApp() {
             }
         },
 
+        // Fetch the next page of occurrences for the selected word
+        async loadMoreOccurrences() {
+            const word = this.selectedWord;
+            if (!word?.nextCursor) return;
+            try {
+                const response = await fetch(`/api/word/${word.strong_number}?cursor=${word.nextCursor}`);
+                if (response.ok) {
+                    const data = await response.json();
+                    word.occurrences.push(...data.occurrences);
+                    word.nextCursor = data.next_cursor;
+                }
+            } catch (err) {
+                console.error('Failed to load more occurrences:', err);
+            }
+        },
+
         // Toggle dark mode
         toggleDarkMode() {
             this.darkMode = !this.darkMode;
@@ -1988,13 +2087,17 @@ function bibleApp() {
 
             try {
                 const response = await fetch(
-                    `/api/search?q=${encodeURIComponent(query)}&scope=${this.searchScope}`
+                    `/api/search?q=${encodeURIComponent(query)}&scope=${this.searchScope}&translation=${this.translation}${this.searchFuzzy ? '&mode=fuzzy' : ''}`
                 );
 
                 if (response.ok) {
                     const data = await response.json();
                     this.searchResults = data.results || [];
                     this.searchWordInfo = data.word_info || null;
+                    this.searchTotals = data.totals || {};
+                    this.searchFacets = data.facets || null;
+                    this.searchNextCursor = data.next_cursor || {};
+                    this.searchDidYouMean = data.did_you_mean || null;
                 }
             } catch (err) {
                 console.error('Search failed:', err);
@@ -2055,6 +2158,39 @@ function bibleApp() {
         },
 
         // Get grouped search results
+        // Append the next page of one result type
+        async loadMoreSearchResults(type) {
+            const cursor = this.searchNextCursor[type];
+            if (!cursor) return;
+            try {
+                const response = await fetch(
+                    `/api/search?q=${encodeURIComponent(this.searchQuery.trim())}&scope=${this.searchScope}&translation=${this.translation}${this.searchFuzzy ? '&mode=fuzzy' : ''}&cursor=${encodeURIComponent(cursor)}`
+                );
+                if (response.ok) {
+                    const data = await response.json();
+                    this.searchResults.push(...(data.results || []));
+                    this.searchNextCursor = { ...this.searchNextCursor, [type]: data.next_cursor?.[type] };
+                }
+            } catch (err) {
+                console.error('Failed to load more results:', err);
+            }
+        },
+
+        // Search again with the suggested spelling
+        useSearchSuggestion() {
+            this.searchQuery = this.searchDidYouMean;
+            this.performSearch();
+        },
+
+        // "312 in Psalms, 120 in Isaiah" for the books with the most verse hits
+        getTopSearchBooks(count = 3) {
+            const books = [...(this.searchFacets?.books || [])];
+            books.sort((a, b) => b.count - a.count);
+            return books.slice(0, count)
+                .map(b => `${b.count.toLocaleString()} in ${b.book}`)
+                .join(', ');
+        },
+
         getGroupedResults() {
             const groups = {
                 verse: [],
@@ -2089,6 +2225,10 @@ function bibleApp() {
             this.showSearch = true;
             this.searchResults = [];
             this.searchWordInfo = null;
+            this.searchTotals = {};
+            this.searchFacets = null;
+            this.searchNextCursor = {};
+            this.searchDidYouMean = null;
             this.searchPerformed = false;
             this.selectedResultIndex = -1;
             this.$nextTick(() => this.$refs.searchInput?.focus());
@@ -2854,11 +2994,99 @@ function bibleApp() {
             }
         },
 
+        // Manifest of prebuilt offline bundles, or null if none are built or they are out of date
+        async fetchBundleManifest() {
+            if (!('DecompressionStream' in window)) return null;
+            try {
+                const response = await fetch('/api/offline/manifest');
+                if (!response.ok) return null;
+                const manifest = await response.json();
+                return manifest.current ? manifest : null;
+            } catch (err) {
+                console.warn('Offline bundle manifest unavailable:', err);
+                return null;
+            }
+        },
+
+        findBundle(manifest, kind, translation, book = null) {
+            if (!manifest) return null;
+            return manifest.bundles.find(b =>
+                b.kind === kind && b.translation === translation && (book === null || b.book === book)
+            ) || null;
+        },
+
+        // Stream a bundle (gzip-compressed NDJSON: a header line, then one line per chapter) into IndexedDB
+        async downloadBundle(bundle, onChapter) {
+            const response = await fetch(bundle.url);
+            if (!response.ok) throw new Error(`Failed to fetch ${bundle.url}`);
+
+            const reader = response.body
+                .pipeThrough(new DecompressionStream('gzip'))
+                .pipeThrough(new TextDecoderStream())
+                .getReader();
+            let header = null;
+            let pending = '';
+
+            while (true) {
+                const { value, done } = await reader.read();
+                if (done) break;
+
+                const lines = (pending + value).split('\n');
+                pending = lines.pop();
+                for (const line of lines) {
+                    if (!line) continue;
+                    const data = JSON.parse(line);
+                    if (!header) {
+                        header = data;
+                        continue;
+                    }
+                    await this.saveOfflineChapter(header.translation, data);
+                    onChapter(data);
+                }
+            }
+        },
+
+        // Save every section present in a bundle chapter line
+        async saveOfflineChapter(translation, data) {
+            if (!window.offlineStorage || !(data.verses?.length > 0)) return;
+            const { book, chapter } = data;
+
+            await window.offlineStorage.saveChapterVerses(translation, book, chapter, data.verses);
+            if (data.alignments?.length > 0) {
+                await window.offlineStorage.saveChapterAlignments(translation, book, chapter, data.alignments);
+            }
+            if (data.interlinear?.length > 0) {
+                await window.offlineStorage.saveChapterInterlinear(book, chapter, data.interlinear);
+            }
+            if (data.crossRefs?.length > 0) {
+                await window.offlineStorage.saveChapterCrossRefs(book, chapter, data.crossRefs);
+            }
+            if (data.commentary?.length > 0) {
+                await window.offlineStorage.saveChapterCommentary(book, chapter, data.commentary);
+            }
+        },
+
         // Download an entire book
         async downloadBook(book) {
             const chapterCount = BOOK_CHAPTERS[book] || 1;
             this.downloadProgress.label = `Downloading ${book}...`;
 
+            // One prebuilt bundle when available, otherwise one request per chapter
+            const bundle = this.findBundle(await this.fetchBundleManifest(), 'book', this.translation, book);
+            if (bundle) {
+                try {
+                    let chaptersSaved = 0;
+                    await this.downloadBundle(bundle, (data) => {
+                        chaptersSaved++;
+                        this.downloadProgress.status = `Chapter ${data.chapter} of ${chapterCount}`;
+                        this.downloadProgress.percent = Math.round((chaptersSaved / bundle.chapters) * 100);
+                    });
+                    return;
+                } catch (err) {
+                    console.warn(`Bundle download failed for ${book}, falling back to chapters:`, err);
+                }
+            }
+
             for (let ch = 1; ch <= chapterCount; ch++) {
                 this.downloadProgress.status = `Chapter ${ch} of ${chapterCount}`;
                 this.downloadProgress.percent = Math.round((ch / chapterCount) * 100);
@@ -3013,6 +3241,23 @@ function bibleApp() {
 
             this.downloadProgress.label = `Downloading ${translation}...`;
 
+            // One prebuilt whole-Bible bundle when available, otherwise one request per chapter
+            const bundle = this.findBundle(await this.fetchBundleManifest(), 'bible', translation);
+            if (bundle) {
+                try {
+                    await this.downloadBundle(bundle, (data) => {
+                        chaptersDownloaded++;
+                        this.downloadProgress.status = `${data.book} ${data.chapter}`;
+                        const taskProgress = (chaptersDownloaded / bundle.chapters) * (100 / totalTasks);
+                        this.downloadProgress.percent = Math.round(basePercent + taskProgress);
+                    });
+                    return;
+                } catch (err) {
+                    console.warn(`Bundle download failed for ${translation}, falling back to chapters:`, err);
+                    chaptersDownloaded = 0;
+                }
+            }
+
             for (const book of books) {
                 const chapterCount = BOOK_CHAPTERS[book];
                 for (let ch = 1; ch <= chapterCount; ch++) {
@@ -3668,173 +3913,6 @@ function bibleApp() {
             }
         },
 
-        // Normalize book names (e.g., "Psalm" -> "Psalms")
-        normalizeBookName(book) {
-            // Handle common abbreviations and variations
-            const normalizations = {
-                'Psalm': 'Psalms',
-                'Song of Solomon': 'Song of Songs',
-                // Chronicles abbreviations
-                '1 Chron': '1 Chronicles',
-                '1 Chron.': '1 Chronicles',
-                '1 Chr': '1 Chronicles',
-                '1 Chr.': '1 Chronicles',
-                '2 Chron': '2 Chronicles',
-                '2 Chron.': '2 Chronicles',
-                '2 Chr': '2 Chronicles',
-                '2 Chr.': '2 Chronicles',
-                // Samuel abbreviations
-                '1 Sam': '1 Samuel',
-                '1 Sam.': '1 Samuel',
-                '2 Sam': '2 Samuel',
-                '2 Sam.': '2 Samuel',
-                // Kings abbreviations
-                '1 Kgs': '1 Kings',
-                '1 Kgs.': '1 Kings',
-                '2 Kgs': '2 Kings',
-                '2 Kgs.': '2 Kings',
-                // Other common abbreviations
-                'Gen': 'Genesis',
-                'Gen.': 'Genesis',
-                'Exod': 'Exodus',
-                'Exod.': 'Exodus',
-                'Ex': 'Exodus',
-                'Ex.': 'Exodus',
-                'Lev': 'Leviticus',
-                'Lev.': 'Leviticus',
-                'Num': 'Numbers',
-                'Num.': 'Numbers',
-                'Deut': 'Deuteronomy',
-                'Deut.': 'Deuteronomy',
-                'Josh': 'Joshua',
-                'Josh.': 'Joshua',
-                'Judg': 'Judges',
-                'Judg.': 'Judges',
-                'Neh': 'Nehemiah',
-                'Neh.': 'Nehemiah',
-                'Esth': 'Esther',
-                'Esth.': 'Esther',
-                'Prov': 'Proverbs',
-                'Prov.': 'Proverbs',
-                'Eccl': 'Ecclesiastes',
-                'Eccl.': 'Ecclesiastes',
-                'Isa': 'Isaiah',
-                'Isa.': 'Isaiah',
-                'Jer': 'Jeremiah',
-                'Jer.': 'Jeremiah',
-                'Lam': 'Lamentations',
-                'Lam.': 'Lamentations',
-                'Ezek': 'Ezekiel',
-                'Ezek.': 'Ezekiel',
-                'Dan': 'Daniel',
-                'Dan.': 'Daniel',
-                'Hos': 'Hosea',
-                'Hos.': 'Hosea',
-                'Obad': 'Obadiah',
-                'Obad.': 'Obadiah',
-                'Mic': 'Micah',
-                'Mic.': 'Micah',
-                'Nah': 'Nahum',
-                'Nah.': 'Nahum',
-                'Hab': 'Habakkuk',
-                'Hab.': 'Habakkuk',
-                'Zeph': 'Zephaniah',
-                'Zeph.': 'Zephaniah',
-                'Hag': 'Haggai',
-                'Hag.': 'Haggai',
-                'Zech': 'Zechariah',
-                'Zech.': 'Zechariah',
-                'Mal': 'Malachi',
-                'Mal.': 'Malachi',
-                'Matt': 'Matthew',
-                'Matt.': 'Matthew',
-                'Rom': 'Romans',
-                'Rom.': 'Romans',
-                '1 Cor': '1 Corinthians',
-                '1 Cor.': '1 Corinthians',
-                '2 Cor': '2 Corinthians',
-                '2 Cor.': '2 Corinthians',
-                'Gal': 'Galatians',
-                'Gal.': 'Galatians',
-                'Eph': 'Ephesians',
-                'Eph.': 'Ephesians',
-                'Phil': 'Philippians',
-                'Phil.': 'Philippians',
-                'Col': 'Colossians',
-                'Col.': 'Colossians',
-                '1 Thess': '1 Thessalonians',
-                '1 Thess.': '1 Thessalonians',
-                '2 Thess': '2 Thessalonians',
-                '2 Thess.': '2 Thessalonians',
-                '1 Tim': '1 Timothy',
-                '1 Tim.': '1 Timothy',
-                '2 Tim': '2 Timothy',
-                '2 Tim.': '2 Timothy',
-                'Tit': 'Titus',
-                'Tit.': 'Titus',
-                'Phlm': 'Philemon',
-                'Phlm.': 'Philemon',
-                'Heb': 'Hebrews',
-                'Heb.': 'Hebrews',
-                'Jas': 'James',
-                'Jas.': 'James',
-                '1 Pet': '1 Peter',
-                '1 Pet.': '1 Peter',
-                '2 Pet': '2 Peter',
-                '2 Pet.': '2 Peter',
-                '1 John': '1 John',
-                '2 John': '2 John',
-                '3 John': '3 John',
-                'Rev': 'Revelation',
-                'Rev.': 'Revelation'
-            };
-            return normalizations[book] || book;
-        },
-
-        // Normalize a full reference (book + chapter/verse)
-        normalizeReference(ref) {
-            // Match book name at the start
-            const match = ref.match(/^([A-Za-z\s]+?)(\s+\d.*)$/);
-            if (match) {
-                const book = this.normalizeBookName(match[1].trim());
-                return book + match[2];
-            }
-            return ref;
-        },
-
-        // Parse a reading reference that might be a chapter range (e.g., "Genesis 1-3")
-        // or semicolon-separated references (e.g., "2 Samuel 5; 1 Chron. 11-12")
-        parseReadingReference(ref) {
-            // First, split on semicolons for multiple separate references
-            if (ref.includes(';')) {
-                const parts = ref.split(';').map(p => p.trim()).filter(p => p);
-                let allRefs = [];
-                for (const part of parts) {
-                    allRefs = allRefs.concat(this.parseReadingReference(part));
-                }
-                return allRefs;
-            }
-
-            // Normalize the reference (handles abbreviations like "1 Chron." -> "1 Chronicles")
-            ref = this.normalizeReference(ref);
-
-            // Match chapter ranges like "Genesis 1-3" or "Job 1-3"
-            // Must NOT have a colon (which would indicate verse range like "Psalm 17:1-15")
-            const chapterRangeMatch = ref.match(/^([A-Za-z0-9\s]+?)\s+(\d+)-(\d+)$/);
-            if (chapterRangeMatch && !ref.includes(':')) {
-                const book = chapterRangeMatch[1].trim();
-                const startChapter = parseInt(chapterRangeMatch[2]);
-                const endChapter = parseInt(chapterRangeMatch[3]);
-                const chapters = [];
-                for (let ch = startChapter; ch <= endChapter; ch++) {
-                    chapters.push(`${book} ${ch}`);
-                }
-                return chapters;
-            }
-            // Single chapter, verse reference, or verse range - pass through as-is
-            return [ref];
-        },
-
         // Load all passages for the day into the main reader view
         async startPlanReading() {
             if (!this.currentPlan) return;
@@ -3852,97 +3930,87 @@ function bibleApp() {
             let allVerses = [];
             let allCrossRefs = [];
             let allCommentary = [];
-            let chaptersToLoadCommentary = [];
-
-            // Parse and load each reading
-            const readingTypes = ['chronological', 'psalms', 'proverbs'];
+            this.interlinearData = {};
 
-            for (const type of readingTypes) {
-                const ref = readings[type];
-                if (!ref) continue;
+            // One request for the whole day: every reading's chapters with
+            // cross-references, commentary and interlinear words
+            let sections = [];
+            try {
+                const response = await fetch(
+                    `/api/passages?plan=${encodeURIComponent(this.currentPlan.id)}&day=${this.planDay}` +
+                    `&translation=${this.translation}&include=commentary,interlinear`
+                );
+                if (!response.ok) throw new Error('Failed to load readings');
+                sections = (await response.json()).sections;
+            } catch (err) {
+                console.error('Failed to load plan readings:', err);
+            }
 
-                // Parse the reference - might be multiple chapters
-                const refs = this.parseReadingReference(ref);
+            for (const section of sections) {
+                const type = section.type;
                 const label = type === 'chronological' ? 'Main Reading' : type.charAt(0).toUpperCase() + type.slice(1);
 
                 // Track the section start
                 const sectionStartIndex = allVerses.length;
-
-                try {
-                    let isFirstChapterInSection = true;
-                    for (const singleRef of refs) {
-                        const response = await fetch(`/api/passage/${encodeURIComponent(singleRef)}?translation=${this.translation}`);
-                        if (response.ok) {
-                            const data = await response.json();
-
-                            // Collect cross-references with book/chapter context
-                            if (data.cross_references && data.cross_references.length > 0) {
-                                const crossRefsWithContext = data.cross_references.map(cr => ({
-                                    ...cr,
-                                    _sourceRef: singleRef,
-                                    _sourceBook: data.reference.replace(/\s+\d+.*$/, ''),
-                                    _sourceChapter: parseInt(data.reference.match(/\s+(\d+)/)?.[1] || 1)
-                                }));
-                                allCrossRefs = allCrossRefs.concat(crossRefsWithContext);
-                            }
-
-                            // Track chapters for commentary loading and notes filtering
-                            const bookMatch = data.reference.match(/^(.+?)\s+(\d+)/);
-                            if (bookMatch) {
-                                const chapterInfo = {
-                                    book: bookMatch[1],
-                                    chapter: parseInt(bookMatch[2]),
-                                    ref: `${bookMatch[1]} ${bookMatch[2]}`
-                                };
-                                chaptersToLoadCommentary.push(chapterInfo);
-                                // Also track for notes panel (deduplicated later)
-                                this.planReadingChapters.push({
-                                    book: chapterInfo.book,
-                                    chapter: chapterInfo.chapter
-                                });
-                            }
-
-                            // Filter verses to only highlighted ones if a verse range was requested
-                            let verses = data.verses;
-                            if (data.highlighted_verses && data.highlighted_verses.length > 0 &&
-                                data.highlighted_verses.length < data.verses.length) {
-                                // Filter to only the highlighted/requested verses
-                                const highlightedSet = new Set(data.highlighted_verses);
-                                verses = data.verses.filter(v => highlightedSet.has(v.verse));
-                            }
-
-                            // Add book/chapter context to ALL verses for note-taking
-                            // bookMatch already declared above at line 3005
-                            const verseBook = bookMatch ? bookMatch[1] : 'Unknown';
-                            const verseChapter = bookMatch ? parseInt(bookMatch[2]) : 1;
-
-                            verses = verses.map((v, idx) => ({
-                                ...v,
-                                _book: verseBook,
-                                _chapter: verseChapter,
-                                // Mark first verse of each chapter for section headers
-                                _chapterStart: idx === 0,
-                                _chapterRef: idx === 0 ? singleRef : null,
-                                _sectionType: idx === 0 ? type : null,
-                                _sectionLabel: idx === 0 && isFirstChapterInSection ? label : null
-                            }));
-                            if (verses.length > 0) {
-                                isFirstChapterInSection = false;
-                            }
-                            allVerses = allVerses.concat(verses);
-                        }
+                let isFirstChapterInSection = true;
+
+                for (const chapter of section.chapters) {
+                    const chapterRef = `${chapter.book} ${chapter.chapter}`;
+
+                    // Collect cross-references with book/chapter context
+                    allCrossRefs = allCrossRefs.concat(chapter.cross_references.map(cr => ({
+                        ...cr,
+                        _sourceRef: chapter.reference,
+                        _sourceBook: chapter.book,
+                        _sourceChapter: chapter.chapter
+                    })));
+
+                    // Add book/chapter context to each commentary entry
+                    allCommentary = allCommentary.concat(chapter.commentary.map(entry => ({
+                        ...entry,
+                        _sourceBook: chapter.book,
+                        _sourceChapter: chapter.chapter,
+                        _sourceRef: chapterRef
+                    })));
+
+                    // Store interlinear words with compound key: book|chapter|verse
+                    for (const [verseNum, words] of Object.entries(chapter.interlinear.verses)) {
+                        this.interlinearData[`${chapter.book}|${chapter.chapter}|${verseNum}`] = {
+                            language: chapter.interlinear.language,
+                            words: words
+                        };
                     }
 
-                    // Add section info for the header bar
-                    this.planReadingSections.push({
-                        type,
-                        label,
-                        reference: ref,
-                        startIndex: sectionStartIndex
+                    // Track chapters for the notes panel (deduplicated later)
+                    this.planReadingChapters.push({
+                        book: chapter.book,
+                        chapter: chapter.chapter
                     });
-                } catch (err) {
-                    console.error(`Failed to load ${type}:`, err);
+
+                    // Only the requested verses are returned; add book/chapter
+                    // context to all of them for note-taking
+                    allVerses = allVerses.concat(chapter.verses.map((v, idx) => ({
+                        ...v,
+                        _book: chapter.book,
+                        _chapter: chapter.chapter,
+                        // Mark first verse of each chapter for section headers
+                        _chapterStart: idx === 0,
+                        _chapterRef: idx === 0 ? chapter.reference : null,
+                        _sectionType: idx === 0 ? type : null,
+                        _sectionLabel: idx === 0 && isFirstChapterInSection ? label : null
+                    })));
+                    if (chapter.verses.length > 0) {
+                        isFirstChapterInSection = false;
+                    }
                 }
+
+                // Add section info for the header bar
+                this.planReadingSections.push({
+                    type,
+                    label,
+                    reference: section.reference,
+                    startIndex: sectionStartIndex
+                });
             }
 
             // Set combined verses in the main reader
@@ -3951,65 +4019,14 @@ function bibleApp() {
             this.highlightedVerses = [];
             this.crossRefs = allCrossRefs;
             this.combinedCrossRefs = allCrossRefs;  // Store for restoration after verse deselect
-            this.commentary = [];
+            this.commentary = allCommentary;
+            this.combinedCommentary = allCommentary;  // Store for restoration after verse deselect
             this.loading = false;
 
             // Clear book/chapter since we're in combined mode
             this.currentBook = null;
             this.currentChapter = null;
 
-            // Load commentary for all chapters (deduplicated)
-            const uniqueChapters = [...new Map(chaptersToLoadCommentary.map(c => [c.ref, c])).values()];
-            for (const chapterInfo of uniqueChapters) {
-                try {
-                    const commentaryResponse = await fetch(
-                        `/api/passage/${encodeURIComponent(chapterInfo.ref)}/commentary`
-                    );
-                    if (commentaryResponse.ok) {
-                        const commentaryData = await commentaryResponse.json();
-                        if (commentaryData.entries && commentaryData.entries.length > 0) {
-                            // Add book/chapter context to each entry
-                            const entriesWithContext = commentaryData.entries.map(entry => ({
-                                ...entry,
-                                _sourceBook: chapterInfo.book,
-                                _sourceChapter: chapterInfo.chapter,
-                                _sourceRef: chapterInfo.ref
-                            }));
-                            allCommentary = allCommentary.concat(entriesWithContext);
-                        }
-                    }
-                } catch (err) {
-                    console.error(`Failed to load commentary for ${chapterInfo.ref}:`, err);
-                }
-            }
-            this.commentary = allCommentary;
-            this.combinedCommentary = allCommentary;  // Store for restoration after verse deselect
-
-            // Load interlinear data for all chapters
-            this.interlinearData = {};
-            for (const chapterInfo of uniqueChapters) {
-                try {
-                    const interlinearResponse = await fetch(
-                        `/api/passage/${encodeURIComponent(chapterInfo.ref)}/interlinear?translation=${this.translation}`
-                    );
-                    if (interlinearResponse.ok) {
-                        const interlinearData = await interlinearResponse.json();
-                        if (interlinearData.has_interlinear && interlinearData.verses) {
-                            // Store with compound key: book|chapter|verse
-                            for (const [verseNum, words] of Object.entries(interlinearData.verses)) {
-                                const key = `${chapterInfo.book}|${chapterInfo.chapter}|${verseNum}`;
-                                this.interlinearData[key] = {
-                                    language: interlinearData.language,
-                                    words: words
-                                };
-                            }
-                        }
-                    }
-                } catch (err) {
-                    console.error(`Failed to load interlinear for ${chapterInfo.ref}:`, err);
-                }
-            }
-
             // Setup scroll-based verse tracking
             this.$nextTick(() => {
                 this.observeVerses();
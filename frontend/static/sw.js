@@ -71,6 +71,9 @@ self.addEventListener('fetch', event => {
     // Skip cross-origin requests (like Alpine.js CDN)
     if (url.origin !== location.origin) return;
 
+    // Offline bundles are saved straight to IndexedDB; don't duplicate them in the cache
+    if (url.pathname.startsWith('/bundles/')) return;
+
     // API requests - network first with smart caching
     if (url.pathname.startsWith('/api/')) {
         console.log('[SW] Intercepting API request:', url.pathname);
@@ -0,0 +1,271 @@
+#!/usr/bin/env python3
+"""
+Benchmark API endpoints in-process through the ASGI app.
+
+Drives requests with a fixed number of concurrent clients (no network, no
+uvicorn) and reports throughput plus latency percentiles per endpoint.
+
+Usage:
+    python scripts/benchmark.py "/api/passage/John 3"
+    python scripts/benchmark.py "/api/passage/John 3" "/api/search?q=love" -n 2000 -c 16
+    python scripts/benchmark.py "/api/passage/John 3" --db /tmp/bible.db
+
+    # Verse latency while Psalms offline exports run in the background
+    python scripts/benchmark.py "/api/verse/John 3:16" \
+        --background "/api/offline/book?book=Psalms" --background-clients 4
+
+    # Every route against a synthetic database, saved for comparison
+    python scripts/build_synthetic_db.py /tmp/bible-synthetic.db
+    python scripts/benchmark.py --suite --db /tmp/bible-synthetic.db --json before.json
+    python scripts/benchmark.py --suite --db /tmp/bible-synthetic.db --compare before.json
+
+    # Scoped vs unscoped search with the in-process caches cleared before
+    # every request, so each one runs the FTS queries
+    python scripts/benchmark.py --cold -c 1 "/api/search?q=the&scope=bible" \
+        "/api/search?q=the&scope=nt" "/api/search?q=the&scope=book:Psalms"
+"""
+import argparse
+import asyncio
+import json
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+# One representative request per route in backend/main.py, with the share of
+# --requests to issue (multi-megabyte exports get fewer)
+SUITE = [
+    ("/", 1.0),
+    ("/api/health", 1.0),
+    ("/api/ready", 1.0),
+    ("/api/passage/John 3", 1.0),
+    ("/api/passage/Psalms 119", 1.0),
+    ("/api/passage/John 3:16", 1.0),
+    ("/api/passage/John 3/commentary", 1.0),
+    ("/api/passage/John 3:16-18/crossrefs", 1.0),
+    ("/api/passage/John 3/crossrefs?include_text=true", 1.0),
+    ("/api/passage/Psalms 119/crossrefs?top=3&sort=votes&group=verse", 1.0),
+    ("/api/passage/John 3/interlinear", 0.2),
+    ("/api/verse/John 3:16", 1.0),
+    ("/api/verses?refs=John 3:16; Rom 5:8, 10; 1 Jn 4:9-10; Gen 1:1-3; Ps 23", 1.0),
+    ("/api/search?q=love", 0.2),
+    ("/api/search?q=faith hope&scope=nt", 0.2),
+    ("/api/search?q=the&scope=bible", 0.2),
+    ("/api/search?q=the&scope=ot", 0.2),
+    ("/api/search?q=the&scope=book:Psalms", 0.2),
+    ("/api/search?q=grace&scope=commentary", 0.2),
+    ("/api/search?q=G26", 0.2),
+    ("/api/passages?plan=chronological-year&day=1&include=commentary,interlinear", 0.2),
+    ("/api/suggest?q=1 jo", 1.0),
+    ("/api/suggest?q=John 3:1", 1.0),
+    ("/api/suggest?q=righ", 1.0),
+    ("/api/word-alignment?book=John&chapter=3&verse=16&word_position=2&translation=BSB", 1.0),
+    ("/api/word/G26", 0.2),
+    ("/api/word/H3068", 1.0),
+    ("/api/word/H3068?format=ndjson", 0.1),
+    ("/api/word/H3068/stats", 1.0),
+    ("/api/word/H3068/translations", 1.0),
+    ("/api/devotional?date=01-15", 1.0),
+    ("/api/devotional/sources", 1.0),
+    ("/api/reading-plans", 1.0),
+    ("/api/reading-plans/chronological", 0.2),
+    ("/api/reading-plans/chronological/day/1", 1.0),
+    ("/api/offline/chapter?book=John&chapter=3", 0.2),
+    ("/api/offline/lexicon", 0.02),
+    ("/api/offline/book?book=Psalms", 0.02),
+    ("/api/offline/commentary?book=John", 0.1),
+    ("/api/offline/crossrefs?book=John", 0.1),
+    ("/api/offline/stats", 0.02),
+    ("/api/offline/devotionals", 0.02),
+    ("/api/_metrics", 1.0),
+    ("/plan/chronological/1", 1.0),
+    ("/John/3", 1.0),
+    ("/John/3/16", 1.0),
+]
+
+
+def percentile(samples: list, pct: float) -> float:
+    """Nearest-rank percentile of a list of samples."""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def clear_caches():
+    """Empty the in-process response caches (the next request runs the endpoint)."""
+    from backend.cache import chapter_cache, compressed_cache, search_cache
+
+    for cache in (chapter_cache, compressed_cache, search_cache):
+        cache.clear()
+
+
+async def run_endpoint(client, path: str, requests: int, concurrency: int,
+                       cold: bool = False) -> dict:
+    """Issue `requests` GETs against `path` from `concurrency` workers."""
+    latencies = []
+    errors = 0
+    remaining = iter(range(requests))
+
+    async def worker():
+        nonlocal errors
+        for _ in remaining:
+            if cold:
+                clear_caches()
+            started = time.perf_counter()
+            response = await client.get(path)
+            latencies.append(time.perf_counter() - started)
+            if response.status_code >= 400:
+                errors += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    return {
+        "path": path,
+        "requests": requests,
+        "errors": errors,
+        "req_per_sec": round(requests / elapsed, 1),
+        "p50_ms": round(percentile(latencies, 50) * 1000, 2),
+        "p95_ms": round(percentile(latencies, 95) * 1000, 2),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 2),
+    }
+
+
+async def load_background(client, path: str, clients: int, stop: asyncio.Event) -> int:
+    """Hammer `path` from `clients` workers until `stop` is set; returns requests made."""
+    completed = 0
+
+    async def worker():
+        nonlocal completed
+        while not stop.is_set():
+            await client.get(path)
+            completed += 1
+
+    await asyncio.gather(*(worker() for _ in range(clients)))
+    return completed
+
+
+async def run(paths: list, requests: int, concurrency: int, warmup: int,
+              background: str = None, background_clients: int = 0, cold: bool = False) -> list:
+    """Benchmark `paths`, each a path or a (path, share of `requests`) pair."""
+    import httpx
+    from backend.main import app
+
+    results = []
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench",
+                                     timeout=None) as client:
+            for path in paths:
+                share = 1.0
+                if isinstance(path, tuple):
+                    path, share = path
+                count = max(5, round(requests * share))
+                if warmup:
+                    await run_endpoint(client, path, max(1, round(warmup * share)), concurrency)
+                if background:
+                    stop = asyncio.Event()
+                    loader = asyncio.create_task(
+                        load_background(client, background, background_clients, stop))
+                    result = await run_endpoint(client, path, count, concurrency, cold)
+                    stop.set()
+                    result["background_requests"] = await loader
+                    result["path"] = f"{path} (under load)"
+                else:
+                    result = await run_endpoint(client, path, count, concurrency, cold)
+                results.append(result)
+    return results
+
+
+def build_report(results: list, args) -> dict:
+    """Results plus enough context (commit, database, settings) to compare runs."""
+    from backend import database
+
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True,
+                                text=True, cwd=Path(__file__).parent.parent).stdout.strip()
+    except OSError:
+        commit = None
+    db_path = Path(database.DATABASE_PATH)
+    conn = database.get_db_connection()
+    try:
+        data_version = database.read_data_version(conn, db_path)
+    finally:
+        conn.close()
+
+    return {
+        "generated_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "commit": commit,
+        "database": {"path": str(db_path), "size_bytes": db_path.stat().st_size,
+                     "data_version": data_version},
+        "settings": {"requests": args.requests, "concurrency": args.concurrency,
+                     "warmup": args.warmup, "background": args.background, "cold": args.cold},
+        "results": results,
+    }
+
+
+def print_comparison(results: list, baseline_path: str):
+    """Print req/s and p50/p99 changes against an earlier --json report."""
+    baseline = {r["path"]: r for r in json.loads(Path(baseline_path).read_text())["results"]}
+
+    def change(new, old):
+        return f"{(new - old) / old * 100:+.0f}%" if old else "n/a"
+
+    print(f"\nCompared with {baseline_path}")
+    print(f"{'Endpoint':<45} {'req/s':>9} {'change':>7} {'p50 ms':>8} {'change':>7} "
+          f"{'p99 ms':>8} {'change':>7}")
+    for r in results:
+        old = baseline.get(r["path"])
+        if old is None:
+            print(f"{r['path']:<45} {r['req_per_sec']:>9} {'new':>7}")
+            continue
+        print(f"{r['path']:<45} {r['req_per_sec']:>9} {change(r['req_per_sec'], old['req_per_sec']):>7} "
+              f"{r['p50_ms']:>8} {change(r['p50_ms'], old['p50_ms']):>7} "
+              f"{r['p99_ms']:>8} {change(r['p99_ms'], old['p99_ms']):>7}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark BibleMVP API endpoints")
+    parser.add_argument("paths", nargs="*", help="Request paths, e.g. '/api/passage/John 3'")
+    parser.add_argument("--suite", action="store_true", help="Benchmark every API route")
+    parser.add_argument("-n", "--requests", type=int, default=1000, help="Requests per endpoint")
+    parser.add_argument("-c", "--concurrency", type=int, default=8, help="Concurrent clients")
+    parser.add_argument("--warmup", type=int, default=50, help="Untimed requests per endpoint")
+    parser.add_argument("--db", help="Database file to benchmark against")
+    parser.add_argument("--background", help="Path to request continuously while measuring")
+    parser.add_argument("--background-clients", type=int, default=2,
+                        help="Concurrent clients for --background")
+    parser.add_argument("--cold", action="store_true",
+                        help="Clear the in-process caches before every request")
+    parser.add_argument("--json", help="Write a JSON report to this file")
+    parser.add_argument("--compare", help="Earlier JSON report to compare against")
+    args = parser.parse_args()
+
+    paths = (SUITE if args.suite else []) + args.paths
+    if not paths:
+        parser.error("give request paths or --suite")
+
+    if args.db:
+        from backend import database
+        database.DATABASE_PATH = Path(args.db)
+
+    results = asyncio.run(run(paths, args.requests, args.concurrency, args.warmup,
+                              args.background, args.background_clients, args.cold))
+    if args.json:
+        Path(args.json).write_text(json.dumps(build_report(results, args), indent=2) + "\n")
+
+    print(f"\n{'Endpoint':<45} {'req/s':>9} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'errors':>7}")
+    for r in results:
+        print(f"{r['path']:<45} {r['req_per_sec']:>9} {r['p50_ms']:>8} "
+              f"{r['p95_ms']:>8} {r['p99_ms']:>8} {r['errors']:>7}")
+    if args.compare:
+        print_comparison(results, args.compare)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Measure reference parsing throughput over a large real corpus.
+
+The corpus is every reading in the reading plans, both columns of the
+OpenBible.info cross-references (data/cross_refs.zip, OSIS like
+"Ps.148.4-Ps.148.5") and, with --db, the reference of every commentary link.
+Each pass parses the whole corpus with backend.references: "cold" clears the
+parser's cache first, "cached" reparses with it warm (only the cache's most
+recent REFERENCE_CACHE_SIZE strings stay in it). References that do not
+parse are counted and a few are shown.
+
+Usage:
+    python scripts/benchmark_references.py
+    python scripts/benchmark_references.py --db /tmp/bible-synthetic.db --passes 5
+"""
+import argparse
+import io
+import json
+import re
+import sqlite3
+import sys
+import time
+import zipfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from backend.references import REFERENCE_CACHE_SIZE, parse_references
+
+DATA_DIR = Path(__file__).parent.parent / "data"
+DATA_REF = re.compile(r'data-ref="([^"]*)"')
+
+
+def load_corpus(db_path: str = None) -> dict:
+    """{source: [reference strings]}"""
+    corpus = {}
+
+    plans = []
+    for plan_file in sorted(DATA_DIR.glob("reading-plan-*.json")):
+        plan = json.loads(plan_file.read_text())
+        tracks = [track["id"] for track in plan["tracks"]]
+        plans += [day[track] for day in plan["days"] for track in tracks if day.get(track)]
+    corpus["reading plans"] = plans
+
+    archive = DATA_DIR / "cross_refs.zip"
+    if archive.exists():
+        with zipfile.ZipFile(archive) as zf:
+            with zf.open("cross_references.txt") as f:
+                refs = []
+                for line in io.TextIOWrapper(f, encoding="utf-8"):
+                    parts = line.split("\t")
+                    if len(parts) >= 3 and not line.startswith("From"):
+                        refs += parts[:2]
+        corpus["cross-references"] = refs
+
+    if db_path:
+        conn = sqlite3.connect(db_path)
+        try:
+            refs = []
+            for (content,) in conn.execute(
+                "SELECT content FROM commentary_entries WHERE content LIKE '%data-ref=%'"
+            ):
+                refs += DATA_REF.findall(content)
+            corpus["commentary links"] = refs
+        finally:
+            conn.close()
+    return corpus
+
+
+def timed_pass(refs: list, cold: bool) -> float:
+    """Seconds to parse every reference once."""
+    if cold:
+        parse_references.cache_clear()
+    started = time.perf_counter()
+    for ref in refs:
+        parse_references(ref)
+    return time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark BibleMVP reference parsing")
+    parser.add_argument("--db", help="Database file (adds commentary link references)")
+    parser.add_argument("--passes", type=int, default=3, help="Timed passes per source (best is reported)")
+    args = parser.parse_args()
+
+    corpus = load_corpus(args.db)
+    corpus["all"] = [ref for refs in corpus.values() for ref in refs]
+
+    print(f"Parser cache: {REFERENCE_CACHE_SIZE:,} entries")
+    print(f"{'source':<18} {'refs':>9} {'unique':>8} {'failed':>7} {'cold refs/s':>12} {'cached refs/s':>14}")
+    for source, refs in corpus.items():
+        unique = list(dict.fromkeys(refs))
+        parse_references.cache_clear()
+        failed = [ref for ref in unique if parse_references(ref) is None]
+        cold = min(timed_pass(unique, cold=True) for _ in range(args.passes))
+        # Reparse the most recent strings, which are the ones still cached
+        recent = unique[-REFERENCE_CACHE_SIZE:]
+        cached = min(timed_pass(recent, cold=False) for _ in range(args.passes))
+        print(f"{source:<18} {len(refs):>9,} {len(unique):>8,} {len(failed):>7,} "
+              f"{len(unique) / cold:>12,.0f} {len(recent) / cached:>14,.0f}")
+        if failed and source != "all":
+            print(f"  not parsed: {', '.join(repr(ref) for ref in failed[:5])}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""
+Rebuild the precomputed concordance tables.
+
+word_book_counts, word_stats, word_renderings and word_rendering_totals are
+derived from the interlinear words (import_interlinear.py) and the English
+word alignments (import_bsb.py, build_english_alignments.py). They back the
+occurrence counts of /api/word and the /api/word/{strong_number}/stats and
+/translations endpoints. Run this after any of those imports; it also stamps
+a new data version so running servers drop cached responses.
+
+Usage:
+    python scripts/build_concordance.py
+    python scripts/build_concordance.py --db /tmp/bible-synthetic.db
+"""
+import argparse
+import sqlite3
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from backend.database import DATABASE_PATH, stamp_data_version
+from backend.migrations import refresh_concordance
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Rebuild BibleMVP concordance tables")
+    parser.add_argument("--db", default=str(DATABASE_PATH), help="Database file")
+    args = parser.parse_args()
+
+    conn = sqlite3.connect(args.db)
+    try:
+        started = time.perf_counter()
+        refresh_concordance(conn)
+        for table in ("word_book_counts", "word_stats", "word_renderings", "word_rendering_totals"):
+            count = conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+            print(f"  {table}: {count:,} rows")
+        version = stamp_data_version(conn)
+        print(f"Concordance rebuilt in {time.perf_counter() - started:.1f}s; data version {version}")
+    finally:
+        conn.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -13,36 +13,25 @@ The approach:
 
 import sqlite3
 import re
+import sys
 from pathlib import Path
 from collections import defaultdict
 
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from backend.database import ENGLISH_WORD_ALIGNMENTS_SCHEMA
+from backend.migrations import DEFAULT_BATCH_SIZE, migrate_verse_keys, table_columns
+
 DB_PATH = Path(__file__).parent.parent / "data" / "bible.db"
 
 
 def create_english_alignments_table(conn):
-    """Create the english_word_alignments table."""
-    conn.execute("""
-        CREATE TABLE IF NOT EXISTS english_word_alignments (
-            id INTEGER PRIMARY KEY,
-            translation_id TEXT NOT NULL,     -- KJV, WEB, etc.
-            book TEXT NOT NULL,
-            chapter INTEGER NOT NULL,
-            verse INTEGER NOT NULL,
-            english_word_position INTEGER NOT NULL,  -- 1-based position in English text
-            english_word TEXT NOT NULL,              -- The actual English word
-            original_word_position INTEGER NOT NULL, -- Position in Hebrew/Greek (word_alignments)
-            confidence REAL DEFAULT 1.0,             -- Match confidence (1.0 = exact, <1.0 = inferred)
-            UNIQUE(translation_id, book, chapter, verse, english_word_position)
-        )
-    """)
-    conn.execute("""
-        CREATE INDEX IF NOT EXISTS idx_eng_align_ref
-        ON english_word_alignments(translation_id, book, chapter, verse)
-    """)
-    conn.execute("""
-        CREATE INDEX IF NOT EXISTS idx_eng_align_lookup
-        ON english_word_alignments(translation_id, book, chapter, verse, english_word_position)
-    """)
+    """Create the english_word_alignments table (with its verse keys and indexes)."""
+    columns = table_columns(conn, "english_word_alignments")
+    if columns and "verse_key" not in columns:
+        # A table from before verse keys: add and fill them first
+        migrate_verse_keys(conn, DEFAULT_BATCH_SIZE)
+    conn.executescript(ENGLISH_WORD_ALIGNMENTS_SCHEMA)
     conn.commit()
     print("Created english_word_alignments table")
 
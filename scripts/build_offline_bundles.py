@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Pre-generate offline download bundles and their manifest.
+
+For each translation this writes one gzip-compressed NDJSON bundle per book
+(verses, alignments, interlinear, cross-references, commentary) and one for the
+whole Bible (verses, alignments, interlinear). File names carry a hash of
+their contents, so the server can send them with long-lived cache headers and
+an offline install is a handful of downloads instead of one API call per
+chapter. The manifest (served at /api/offline/manifest) lists every bundle's
+URL, size and SHA-256.
+
+Run it at deploy time, after imports and migrations. Bundles from the previous
+build are kept until the next one, so in-flight downloads are not cut off.
+
+Usage:
+    python scripts/build_offline_bundles.py
+    python scripts/build_offline_bundles.py --translation BSB --translation KJV
+    python scripts/build_offline_bundles.py --db /tmp/bible-synthetic.db --out /tmp/bundles
+"""
+import argparse
+import json
+import os
+import sqlite3
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from backend.database import DATABASE_PATH, read_data_version
+from backend.migrations import schema_version
+from backend.offline import (
+    BIBLE_BUNDLE_SECTIONS, BOOK_BUNDLE_SECTIONS, BUNDLE_DIR, BUNDLE_URL_PREFIX, MANIFEST_NAME,
+    save_bundle,
+)
+
+
+def book_slug(book: str) -> str:
+    return book.lower().replace(" ", "-")
+
+
+def bundle_files(manifest: dict) -> set:
+    return {bundle["url"][len(BUNDLE_URL_PREFIX):] for bundle in manifest.get("bundles", [])}
+
+
+def build(db_path: Path, out: Path, translations=None, level: int = 9) -> dict:
+    """Write every bundle and the manifest; returns the manifest."""
+    conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
+    try:
+        books = [row[0] for row in conn.execute("SELECT name FROM books ORDER BY book_order")]
+        if not translations:
+            translations = [row[0] for row in conn.execute(
+                "SELECT DISTINCT translation_id FROM verses ORDER BY translation_id"
+            )]
+
+        bundles = []
+        for translation in translations:
+            started = time.perf_counter()
+            entry = save_bundle(conn, out, f"{translation}/bible", books, translation,
+                                BIBLE_BUNDLE_SECTIONS, level)
+            bundles.append({"kind": "bible", "translation": translation, **entry})
+            size = entry["size"]
+
+            for book in books:
+                entry = save_bundle(conn, out, f"{translation}/{book_slug(book)}", [book],
+                                    translation, BOOK_BUNDLE_SECTIONS, level)
+                if entry["chapters"]:
+                    bundles.append({"kind": "book", "translation": translation, "book": book, **entry})
+                    size += entry["size"]
+            print(f"  {translation}: {len(books)} books + whole Bible, "
+                  f"{size / 1024 / 1024:.1f} MB in {time.perf_counter() - started:.1f}s")
+
+        return {
+            "generated_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "data_version": read_data_version(conn, db_path),
+            "schema_version": schema_version(conn),
+            "format": "ndjson+gzip",
+            "bundles": bundles,
+        }
+    finally:
+        conn.close()
+
+
+def write_manifest(out: Path, manifest: dict):
+    """Atomically replace the manifest, then drop bundles neither it nor the previous one lists."""
+    path = out / MANIFEST_NAME
+    previous = json.loads(path.read_text()) if path.exists() else {}
+    keep = bundle_files(manifest) | bundle_files(previous)
+
+    tmp = path.with_suffix(".tmp")
+    tmp.write_text(json.dumps(manifest, indent=1))
+    os.replace(tmp, path)
+
+    removed = 0
+    for file in out.glob("*/*.ndjson.gz"):
+        if file.relative_to(out).as_posix() not in keep:
+            file.unlink()
+            removed += 1
+    for file in out.glob("*/*.tmp"):
+        file.unlink()
+    return removed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build BibleMVP offline bundles")
+    parser.add_argument("--db", default=str(DATABASE_PATH), help="Source database")
+    parser.add_argument("--out", default=str(BUNDLE_DIR), help="Bundle directory (OFFLINE_BUNDLE_DIR)")
+    parser.add_argument("--translation", action="append",
+                        help="Translation to bundle (repeatable; default: all)")
+    parser.add_argument("--level", type=int, default=9, help="gzip compression level")
+    args = parser.parse_args()
+
+    out = Path(args.out)
+    out.mkdir(parents=True, exist_ok=True)
+    print(f"Building offline bundles from {args.db} into {out}")
+    started = time.perf_counter()
+    manifest = build(Path(args.db), out, args.translation, args.level)
+    removed = write_manifest(out, manifest)
+
+    total = sum(bundle["size"] for bundle in manifest["bundles"])
+    print(f"Wrote {len(manifest['bundles'])} bundles ({total / 1024 / 1024:.1f} MB) "
+          f"in {time.perf_counter() - started:.1f}s; removed {removed} stale files")
+
+
+if __name__ == "__main__":
+    main()
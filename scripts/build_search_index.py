@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+Rebuild the per-translation verse search indexes and the fuzzy search vocabulary.
+
+Each translation has its own FTS5 index (verses_fts_bsb, verses_fts_web, ...)
+kept in sync by triggers on verses, so /api/search?translation= only ranks
+that translation's verses. Triggers exist only for translations that had an
+index when it was last built: run this after importing a new translation (or
+with --translation to rebuild just one). The trigram-indexed vocabulary
+behind /api/search?mode=fuzzy is derived from these indexes, the commentary
+index and the lexicon, so it is rebuilt every time. A new data version is
+stamped so running servers drop cached search results.
+
+Usage:
+    python scripts/build_search_index.py
+    python scripts/build_search_index.py --translation BSB --db /tmp/bible-synthetic.db
+"""
+import argparse
+import sqlite3
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from backend.database import DATABASE_PATH, stamp_data_version
+from backend.migrations import refresh_search_vocabulary, refresh_verse_search, verses_fts_table
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Rebuild BibleMVP search indexes")
+    parser.add_argument("--db", default=str(DATABASE_PATH), help="Database file")
+    parser.add_argument("--translation", action="append",
+                        help="Translation to rebuild (repeatable; default: all)")
+    args = parser.parse_args()
+
+    conn = sqlite3.connect(args.db)
+    try:
+        started = time.perf_counter()
+        indexed = refresh_verse_search(conn, args.translation)
+        for translation, count in indexed.items():
+            print(f"  {verses_fts_table(translation)}: {count:,} verses")
+        if refresh_search_vocabulary(conn):
+            terms = conn.execute("SELECT COUNT(*) FROM search_vocabulary").fetchone()[0]
+            print(f"  search_vocabulary: {terms:,} terms")
+        else:
+            print("  fuzzy search vocabulary skipped: SQLite has no trigram tokenizer")
+        version = stamp_data_version(conn)
+        print(f"Search indexes rebuilt in {time.perf_counter() - started:.1f}s; data version {version}")
+    finally:
+        conn.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,317 @@
+#!/usr/bin/env python3
+"""
+Build a deterministic synthetic Bible database for benchmarks and local testing.
+
+The real data/bible.db (~200 MB) is not in git. This generates a stand-in with
+the same schema (backend/database.py plus the tables created by the import
+scripts) and realistic cardinalities: 66 books with their real chapter counts,
+~31k verses in each of BSB/WEB/KJV, ~435k original-language words, ~724k BSB
+English alignments, 41k cross-references, 30k commentary entries, the full
+Strong's lexicon and a year of morning/evening devotionals. Text is drawn from
+a Zipf-distributed vocabulary so full-text search behaves like real prose.
+
+The same seed always produces the same content, so benchmark results can be
+compared between commits. No network access is needed.
+
+Usage:
+    python scripts/build_synthetic_db.py /tmp/bible-synthetic.db
+    python scripts/build_synthetic_db.py /tmp/small.db --scale 0.1 --seed 7
+"""
+import argparse
+import random
+import sqlite3
+import sys
+import time
+from itertools import accumulate
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from backend.database import SCHEMA, stamp_data_version
+from backend.migrations import run_migrations
+from scripts.build_english_alignments import create_english_alignments_table
+from scripts.import_speakers import create_table as create_speakers_table
+from scripts.import_spurgeon import create_table as create_devotionals_table
+from scripts.import_stepbible_alignment import canonical_strong, create_alignment_table
+
+# Real chapter counts, in canonical book order
+CHAPTER_COUNTS = [
+    50, 40, 27, 36, 34, 24, 21, 4, 31, 24, 22, 25, 29, 36, 10, 13, 10, 42, 150, 31, 12, 8,
+    66, 52, 5, 48, 12, 14, 3, 9, 1, 4, 7, 3, 3, 3, 2, 14, 4,
+    28, 16, 24, 21, 28, 16, 16, 13, 6, 6, 4, 4, 5, 3, 6, 4, 3, 1, 13, 5, 5, 3, 5, 1, 1, 1, 22,
+]
+
+# Chapters whose length benchmarks rely on
+FIXED_VERSE_COUNTS = {("Psalms", 117): 2, ("Psalms", 119): 176, ("John", 3): 36}
+
+TRANSLATIONS = ["BSB", "WEB", "KJV"]
+HEBREW_LEXICON_SIZE = 8674
+GREEK_LEXICON_SIZE = 5624
+CROSS_REFERENCES = 41000
+COMMENTARY_RATE = 0.965      # share of verses with a commentary entry (~30k)
+DIVINE_SPEECH_RATE = 0.07
+
+COMMON_WORDS = """
+the and of to that in he shall unto for i his a lord they be is him not them it with all
+thou thy was which my me said but ye their have will god are from as were on people man
+land day house son king children israel by hath up out before come went this into then
+when there upon hand so had one let also may did come us heart among christ jesus spirit
+love faith grace light life truth word way mercy peace holy righteous sin father earth
+heaven glory power kingdom water bread blood covenant law prophet servant city fire
+mountain temple altar sword voice name blessed wisdom judgment salvation praise fear
+hope joy good evil death gospel church apostle disciples sea wilderness egypt jerusalem
+david moses abraham jacob isaac joseph aaron solomon paul peter john elijah samuel
+""".split()
+
+SYLLABLES = ["ab", "el", "im", "or", "an", "ek", "ith", "ar", "on", "ul", "ba", "ne", "ra",
+             "sh", "ta", "mi", "za", "ho", "ru", "ke", "di", "lo", "pa", "we", "ya", "ga"]
+
+
+class Vocabulary:
+    """Zipf-weighted word sampler (common words first, then invented ones)."""
+
+    def __init__(self, rnd: random.Random, size: int = 12000):
+        words = list(dict.fromkeys(COMMON_WORDS))
+        seen = set(words)
+        while len(words) < size:
+            word = "".join(rnd.choice(SYLLABLES) for _ in range(rnd.randint(2, 4)))
+            if word not in seen:
+                seen.add(word)
+                words.append(word)
+        self.words = words
+        self.cum_weights = list(accumulate(1.0 / rank for rank in range(1, size + 1)))
+
+    def sample(self, rnd: random.Random, count: int) -> list:
+        return rnd.choices(self.words, cum_weights=self.cum_weights, k=count)
+
+    def sentence(self, rnd: random.Random, low: int, high: int) -> str:
+        words = self.sample(rnd, rnd.randint(low, high))
+        return words[0].capitalize() + " " + " ".join(words[1:]) + "."
+
+
+def strong_sampler(rnd: random.Random, prefix: str, size: int):
+    """Zipf-weighted sampler over padded Strong's numbers (H0430 style)."""
+    numbers = [f"{prefix}{n:04d}" for n in range(1, size + 1)]
+    rnd.shuffle(numbers)
+    cum_weights = list(accumulate(1.0 / rank for rank in range(1, size + 1)))
+    return lambda count: rnd.choices(numbers, cum_weights=cum_weights, k=count)
+
+
+def verse_key(book_order: int, chapter: int, verse: int) -> int:
+    return book_order * 1_000_000 + chapter * 1000 + verse
+
+
+def create_schema(conn):
+    conn.executescript(SCHEMA)
+    # The Spurgeon importer's devotionals table is the one the API queries
+    conn.execute("DROP TABLE IF EXISTS devotionals")
+    create_devotionals_table(conn)
+    create_alignment_table(conn)
+    create_english_alignments_table(conn)
+    create_speakers_table(conn)
+    conn.execute("""
+        INSERT OR IGNORE INTO translations (id, name, language, is_public_domain, license_info)
+        VALUES ('BSB', 'Berean Standard Bible', 'en', 1, 'CC-BY 4.0')
+    """)
+    conn.commit()
+
+
+def build_references(conn, rnd: random.Random, scale: float) -> list:
+    """(book, book_order, testament, chapter, verse) for every verse."""
+    books = conn.execute("SELECT name, book_order, testament FROM books ORDER BY book_order").fetchall()
+    refs = []
+    for (name, order, testament), chapters in zip(books, CHAPTER_COUNTS):
+        for chapter in range(1, max(1, round(chapters * scale)) + 1):
+            verses = FIXED_VERSE_COUNTS.get((name, chapter)) or rnd.randint(10, 42)
+            refs.extend((name, order, testament, chapter, verse) for verse in range(1, verses + 1))
+    return refs
+
+
+def build(path: Path, seed: int = 1, scale: float = 1.0):
+    rnd = random.Random(seed)
+    vocab = Vocabulary(rnd)
+    hebrew = strong_sampler(rnd, "H", HEBREW_LEXICON_SIZE)
+    greek = strong_sampler(rnd, "G", GREEK_LEXICON_SIZE)
+
+    if path.exists():
+        path.unlink()
+    conn = sqlite3.connect(path)
+    conn.execute("PRAGMA journal_mode = OFF")
+    conn.execute("PRAGMA synchronous = OFF")
+    create_schema(conn)
+
+    def step(label, started):
+        print(f"  {label} ({time.perf_counter() - started:.1f}s)")
+        return time.perf_counter()
+
+    started = time.perf_counter()
+    refs = build_references(conn, rnd, scale)
+
+    # Lexicon
+    lexicon = [
+        (f"H{n}", "hebrew", f"heb{n}", f"translit{n}", f"pron{n}",
+         vocab.sentence(rnd, 3, 12), vocab.sentence(rnd, 20, 60), f"from H{max(1, n - 1)}")
+        for n in range(1, HEBREW_LEXICON_SIZE + 1)
+    ] + [
+        (f"G{n}", "greek", f"grk{n}", f"translit{n}", f"pron{n}",
+         vocab.sentence(rnd, 3, 12), vocab.sentence(rnd, 20, 60), f"from G{max(1, n - 1)}")
+        for n in range(1, GREEK_LEXICON_SIZE + 1)
+    ]
+    conn.executemany("""
+        INSERT INTO lexicon (strong_number, language, original, transliteration, pronunciation,
+                             definition, extended_definition, derivation)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+    """, lexicon)
+    started = step(f"lexicon: {len(lexicon):,} entries", started)
+
+    # Verses (FTS is filled by the schema triggers)
+    for translation in TRANSLATIONS:
+        conn.executemany("""
+            INSERT INTO verses (translation_id, book, book_order, chapter, verse, text, verse_key)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+        """, (
+            (translation, book, order, chapter, verse, vocab.sentence(rnd, 14, 34),
+             verse_key(order, chapter, verse))
+            for book, order, _, chapter, verse in refs
+        ))
+    conn.commit()
+    started = step(f"verses: {len(refs) * len(TRANSLATIONS):,}", started)
+
+    # Original-language words: STEPBible alignments plus the WEB interlinear words table
+    web_ids = dict(conn.execute("""
+        SELECT verse_key, id FROM verses WHERE translation_id = 'WEB'
+    """).fetchall())
+    originals = []
+    words = []
+    english = []
+    for book, order, testament, chapter, verse in refs:
+        count = rnd.randint(8, 20)
+        strongs = (hebrew if testament == "OT" else greek)(count)
+        glosses = vocab.sample(rnd, count)
+        verse_id = web_ids[verse_key(order, chapter, verse)]
+        for position, (strong, gloss) in enumerate(zip(strongs, glosses), 1):
+            original = f"orig{strong[1:]}"
+            originals.append((book, chapter, verse, position, original, f"tr{strong[1:]}",
+                              gloss, strong, canonical_strong(strong), "N-NSM"))
+            words.append((verse_id, position, original, canonical_strong(strong), "N-NSM", gloss))
+
+        # BSB English words aligned to those originals (~23 per verse)
+        for position, word in enumerate(vocab.sample(rnd, rnd.randint(16, 32)), 1):
+            if rnd.random() < 0.97:
+                english.append(("BSB", book, chapter, verse, position, word,
+                                rnd.randint(1, count), round(rnd.uniform(0.6, 1.0), 2)))
+
+    conn.executemany("""
+        INSERT INTO word_alignments (book, chapter, verse, word_position, hebrew_text,
+                                     transliteration, english_gloss, strong_number,
+                                     strong_canonical, grammar)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """, originals)
+    conn.executemany("""
+        INSERT INTO words (verse_id, position, text, strong_number, parsing, translation)
+        VALUES (?, ?, ?, ?, ?, ?)
+    """, words)
+    conn.executemany("""
+        INSERT INTO english_word_alignments (translation_id, book, chapter, verse,
+                                             english_word_position, english_word,
+                                             original_word_position, confidence)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+    """, english)
+    conn.commit()
+    started = step(f"word_alignments: {len(originals):,}, words: {len(words):,}, "
+                   f"english_word_alignments: {len(english):,}", started)
+
+    # Cross-references (distinct source/target pairs, vote-weighted like OpenBible.info)
+    pairs = set()
+    target_count = round(CROSS_REFERENCES * scale)
+    while len(pairs) < target_count:
+        source, target = rnd.choice(refs), rnd.choice(refs)
+        if source != target:
+            pairs.add((source, target))
+    conn.executemany("""
+        INSERT INTO cross_references (source_book, source_chapter, source_verse,
+                                      target_book, target_chapter, target_verse,
+                                      target_book_order, relationship_type, votes,
+                                      source_key, target_key)
+        VALUES (?, ?, ?, ?, ?, ?, ?, 'cross-reference', ?, ?, ?)
+    """, (
+        (s[0], s[3], s[4], t[0], t[3], t[4], t[1] - 1, 10 + int(rnd.paretovariate(1.1) * 5),
+         verse_key(s[1], s[3], s[4]), verse_key(t[1], t[3], t[4]))
+        for s, t in sorted(pairs)
+    ))
+    conn.commit()
+    started = step(f"cross_references: {len(pairs):,}", started)
+
+    # Commentary, some entries citing other passages
+    abbrevs = ["Gen", "Exod", "Ps", "Isa", "Matt", "John", "Rom", "Heb", "Rev"]
+    commentary = []
+    for book, order, _, chapter, verse in refs:
+        if rnd.random() >= COMMENTARY_RATE:
+            continue
+        text = " ".join(vocab.sentence(rnd, 8, 24) for _ in range(rnd.randint(2, 8)))
+        if rnd.random() < 0.3:
+            text += f" Compare {rnd.choice(abbrevs)} {rnd.randint(1, 20)}:{rnd.randint(1, 30)}."
+        end = verse + rnd.choice((0, 0, 0, 1))
+        commentary.append(("matthew-henry", book, chapter, verse, end, text, text,
+                           verse_key(order, chapter, verse), verse_key(order, chapter, end)))
+    conn.executemany("""
+        INSERT INTO commentary_entries (source, book, chapter, reference_start, reference_end,
+                                        content, searchable_text, start_key, end_key)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """, commentary)
+    conn.commit()
+    started = step(f"commentary_entries: {len(commentary):,}", started)
+
+    # Red-letter speakers
+    speakers = [
+        (book, chapter, verse, "God" if testament == "OT" else "Jesus", 1)
+        for book, _, testament, chapter, verse in refs
+        if rnd.random() < DIVINE_SPEECH_RATE
+    ]
+    conn.executemany("""
+        INSERT INTO speaker_verses (book, chapter, verse, speaker, is_divine)
+        VALUES (?, ?, ?, ?, ?)
+    """, speakers)
+
+    # A year of Spurgeon morning and evening readings
+    devotionals = []
+    for month, days in enumerate((31, 29, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31), 1):
+        for day in range(1, days + 1):
+            for time_of_day in ("morning", "evening"):
+                book, _, _, chapter, verse = rnd.choice(refs)
+                content = " ".join(vocab.sentence(rnd, 10, 30) for _ in range(rnd.randint(15, 30)))
+                devotionals.append(("Spurgeon", month, day, time_of_day, vocab.sentence(rnd, 3, 7),
+                                    f"{book} {chapter}:{verse}", content, content))
+    conn.executemany("""
+        INSERT INTO devotionals (source, month, day, time_of_day, title, verse_ref,
+                                 content, searchable_text)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+    """, devotionals)
+    conn.commit()
+    started = step(f"speaker_verses: {len(speakers):,}, devotionals: {len(devotionals):,}", started)
+
+    # Derived columns and indexes exactly as a migrated production database has them
+    run_migrations(conn)
+    stamp_data_version(conn, f"synthetic-{seed}-{scale}")
+    conn.execute("VACUUM")
+    conn.close()
+    step("migrations, ANALYZE, VACUUM", started)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build a synthetic full-size Bible database")
+    parser.add_argument("path", help="Output database file (overwritten)")
+    parser.add_argument("--seed", type=int, default=1, help="Random seed")
+    parser.add_argument("--scale", type=float, default=1.0,
+                        help="Fraction of chapters per book to generate (1.0 = full size)")
+    args = parser.parse_args()
+
+    path = Path(args.path)
+    total = time.perf_counter()
+    print(f"Building synthetic database {path} (seed {args.seed}, scale {args.scale})")
+    build(path, args.seed, args.scale)
+    print(f"\nDone in {time.perf_counter() - total:.1f}s: {path.stat().st_size / 1024 / 1024:.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
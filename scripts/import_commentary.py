@@ -24,6 +24,9 @@ import sys
 import time
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from backend.migrations import add_commentary_links
+
 DATABASE_PATH = Path(__file__).parent.parent / "data" / "bible.db"
 API_BASE = "https://bible.helloao.org/api/c"
 
@@ -150,7 +153,9 @@ def import_commentary(commentary_id: str, limit_books: int | None = None):
                             chapter_num,
                             ref_start,
                             ref_end,
-                            content_text,
+                            # Linked the same way as the commentary_links migration,
+                            # which a new database has already been stamped past
+                            add_commentary_links(content_text),
                             content_text.lower()
                         ))
                         book_entries += 1
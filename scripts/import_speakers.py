@@ -11,34 +11,19 @@ from God (OT) or Jesus (NT), for red-letter Bible display.
 
 import sqlite3
 import json
+import sys
 from pathlib import Path
 from collections import defaultdict
 
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from backend import references
+from backend.database import SPEAKER_VERSES_SCHEMA
+
 # Paths
 DATA_DIR = Path(__file__).parent.parent / "data" / "speaker-quotations"
 DB_PATH = Path(__file__).parent.parent / "data" / "bible.db"
 
-# Book name normalization (Clear-Bible uses abbreviated names)
-BOOK_ABBREV_TO_NAME = {
-    # Old Testament
-    'GEN': 'Genesis', 'EXO': 'Exodus', 'LEV': 'Leviticus', 'NUM': 'Numbers', 'DEU': 'Deuteronomy',
-    'JOS': 'Joshua', 'JDG': 'Judges', 'RUT': 'Ruth', '1SA': '1 Samuel', '2SA': '2 Samuel',
-    '1KI': '1 Kings', '2KI': '2 Kings', '1CH': '1 Chronicles', '2CH': '2 Chronicles',
-    'EZR': 'Ezra', 'NEH': 'Nehemiah', 'EST': 'Esther', 'JOB': 'Job', 'PSA': 'Psalms',
-    'PRO': 'Proverbs', 'ECC': 'Ecclesiastes', 'SNG': 'Song of Solomon', 'ISA': 'Isaiah',
-    'JER': 'Jeremiah', 'LAM': 'Lamentations', 'EZK': 'Ezekiel', 'DAN': 'Daniel',
-    'HOS': 'Hosea', 'JOL': 'Joel', 'AMO': 'Amos', 'OBA': 'Obadiah', 'JON': 'Jonah',
-    'MIC': 'Micah', 'NAM': 'Nahum', 'HAB': 'Habakkuk', 'ZEP': 'Zephaniah', 'HAG': 'Haggai',
-    'ZEC': 'Zechariah', 'MAL': 'Malachi',
-    # New Testament
-    'MAT': 'Matthew', 'MRK': 'Mark', 'LUK': 'Luke', 'JHN': 'John', 'ACT': 'Acts',
-    'ROM': 'Romans', '1CO': '1 Corinthians', '2CO': '2 Corinthians', 'GAL': 'Galatians',
-    'EPH': 'Ephesians', 'PHP': 'Philippians', 'COL': 'Colossians', '1TH': '1 Thessalonians',
-    '2TH': '2 Thessalonians', '1TI': '1 Timothy', '2TI': '2 Timothy', 'TIT': 'Titus',
-    'PHM': 'Philemon', 'HEB': 'Hebrews', 'JAS': 'James', '1PE': '1 Peter', '2PE': '2 Peter',
-    '1JN': '1 John', '2JN': '2 John', '3JN': '3 John', 'JUD': 'Jude', 'REV': 'Revelation'
-}
-
 # Speakers we care about for red-letter display
 # God in OT, Jesus in NT - treating them the same for styling
 RED_LETTER_SPEAKERS = {'God', 'Jesus'}
@@ -49,50 +34,17 @@ def parse_verse_ref(ref: str) -> tuple:
     Parse verse reference like 'GEN 1:3' to (book, chapter, verse).
     Returns (book_name, chapter, verse) or None if invalid.
     """
-    try:
-        parts = ref.split()
-        if len(parts) != 2:
-            return None
-        book_abbrev = parts[0]
-        chapter_verse = parts[1].split(':')
-        if len(chapter_verse) != 2:
-            return None
-
-        book_name = BOOK_ABBREV_TO_NAME.get(book_abbrev)
-        if not book_name:
-            return None
-
-        chapter = int(chapter_verse[0])
-        verse = int(chapter_verse[1])
-        return (book_name, chapter, verse)
-    except (ValueError, IndexError):
+    passage = references.parse_reference(ref)
+    if not passage or not passage.has_verse or passage.start != passage.end:
         return None
+    return (passage.book, passage.chapter, passage.verse_start)
 
 
 def create_table(conn):
-    """Create the speaker_verses table if it doesn't exist."""
-    cursor = conn.cursor()
-
+    """Recreate the speaker_verses table, with its verse keys and key index."""
     # Drop existing table to rebuild
-    cursor.execute("DROP TABLE IF EXISTS speaker_verses")
-
-    # Create new table - simple verse-level speaker attribution
-    cursor.execute("""
-        CREATE TABLE speaker_verses (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            book TEXT NOT NULL,
-            chapter INTEGER NOT NULL,
-            verse INTEGER NOT NULL,
-            speaker TEXT NOT NULL,
-            is_divine BOOLEAN DEFAULT 0,
-            UNIQUE(book, chapter, verse, speaker)
-        )
-    """)
-
-    # Create indexes for fast lookup
-    cursor.execute("CREATE INDEX idx_speaker_verses_ref ON speaker_verses(book, chapter, verse)")
-    cursor.execute("CREATE INDEX idx_speaker_verses_divine ON speaker_verses(is_divine)")
-
+    conn.execute("DROP TABLE IF EXISTS speaker_verses")
+    conn.executescript(SPEAKER_VERSES_SCHEMA)
     conn.commit()
     print("Created speaker_verses table")
 
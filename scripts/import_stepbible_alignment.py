@@ -11,8 +11,16 @@ https://github.com/STEPBible/STEPBible-Data
 
 import sqlite3
 import re
+import sys
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from backend.database import WORD_ALIGNMENTS_SCHEMA
+from backend.migrations import (
+    DEFAULT_BATCH_SIZE, canonical_strong, migrate_strong_canonical, migrate_verse_keys, table_columns
+)
+
 DB_PATH = Path(__file__).parent.parent / "data" / "bible.db"
 DATA_DIR = Path(__file__).parent.parent / "data" / "alignment"
 
@@ -40,24 +48,13 @@ BOOK_MAP = {
 
 
 def create_alignment_table(conn):
-    """Create the word_alignments table if it doesn't exist."""
-    conn.execute("""
-        CREATE TABLE IF NOT EXISTS word_alignments (
-            id INTEGER PRIMARY KEY,
-            book TEXT NOT NULL,
-            chapter INTEGER NOT NULL,
-            verse INTEGER NOT NULL,
-            word_position INTEGER NOT NULL,  -- Position in Hebrew text (1-based)
-            hebrew_text TEXT,                -- Original Hebrew with prefixes
-            transliteration TEXT,
-            english_gloss TEXT,              -- English translation/gloss
-            strong_number TEXT,              -- Primary Strong's number (e.g., H0430)
-            grammar TEXT,                    -- Morphology code
-            UNIQUE(book, chapter, verse, word_position)
-        )
-    """)
-    conn.execute("CREATE INDEX IF NOT EXISTS idx_alignment_ref ON word_alignments(book, chapter, verse)")
-    conn.execute("CREATE INDEX IF NOT EXISTS idx_alignment_strongs ON word_alignments(strong_number)")
+    """Create the word_alignments table (with its verse keys and indexes) if it doesn't exist."""
+    columns = table_columns(conn, "word_alignments")
+    if columns and not {"verse_key", "strong_canonical"} <= columns:
+        # A table from before the derived columns: add and fill them first
+        migrate_verse_keys(conn, DEFAULT_BATCH_SIZE)
+        migrate_strong_canonical(conn, DEFAULT_BATCH_SIZE)
+    conn.executescript(WORD_ALIGNMENTS_SCHEMA)
     conn.commit()
     print("Created word_alignments table")
 
@@ -235,7 +232,7 @@ def import_alignment_file(conn, filepath, book_filter=None):
             alignments.append((
                 book, chapter, verse, word_pos,
                 original_text, transliteration, english_gloss,
-                strong_number, grammar
+                strong_number, canonical_strong(strong_number), grammar
             ))
 
     # Insert into database
@@ -243,8 +240,8 @@ def import_alignment_file(conn, filepath, book_filter=None):
         conn.executemany("""
             INSERT OR REPLACE INTO word_alignments
             (book, chapter, verse, word_position, hebrew_text, transliteration,
-             english_gloss, strong_number, grammar)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+             english_gloss, strong_number, strong_canonical, grammar)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
         """, alignments)
         conn.commit()
 
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Apply pending database migrations (see backend/migrations.py).
+
+The server never migrates on startup; run this after deploying a version that
+adds migrations, and with --rerun after an import script recreates a table.
+Migrations work in committed batches, so an interrupted run can simply be
+started again.
+
+Usage:
+    python scripts/migrate.py                  # apply pending migrations
+    python scripts/migrate.py --status         # show schema version and pending migrations
+    python scripts/migrate.py --rerun          # re-apply every migration (idempotent)
+    python scripts/migrate.py --db /data/bible.db --batch-size 2000
+"""
+import argparse
+import sqlite3
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from backend.database import DATABASE_PATH, stamp_data_version
+from backend.migrations import (
+    DEFAULT_BATCH_SIZE, SCHEMA_VERSION, pending_migrations, run_migrations, schema_version
+)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Apply BibleMVP database migrations")
+    parser.add_argument("--db", default=str(DATABASE_PATH), help="Database file to migrate")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE,
+                        help="Rows per committed batch")
+    parser.add_argument("--status", action="store_true", help="Report pending migrations and exit")
+    parser.add_argument("--rerun", action="store_true", help="Re-apply every migration")
+    args = parser.parse_args()
+
+    conn = sqlite3.connect(args.db)
+    try:
+        version = schema_version(conn)
+        pending = pending_migrations(conn)
+        print(f"{args.db}: schema version {version} of {SCHEMA_VERSION}")
+        if args.status:
+            print(f"Pending: {', '.join(pending) if pending else 'none'}")
+            return
+
+        ran = run_migrations(conn, batch_size=args.batch_size, rerun=args.rerun)
+        if ran:
+            # Migrations rewrite content, so running servers must drop their caches
+            stamp_data_version(conn)
+            print(f"Applied: {', '.join(ran)}; now at schema version {schema_version(conn)}")
+        else:
+            print("Nothing to do")
+    finally:
+        conn.close()
+
+
+if __name__ == "__main__":
+    main()
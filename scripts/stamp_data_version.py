@@ -0,0 +1,32 @@
+#!/usr/bin/env python3
+"""
+Record a new data version stamp in the database.
+
+Running servers compare this stamp to decide when in-process caches (such as
+the chapter cache) are stale. Run it after any import script that rewrites
+content. Without a stamp, the database file's size and mtime are used instead.
+
+Usage:
+    python scripts/stamp_data_version.py            # timestamp-based version
+    python scripts/stamp_data_version.py 2026-01-16 # explicit version
+"""
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from backend.database import get_db_connection, stamp_data_version
+
+
+def main():
+    version = sys.argv[1] if len(sys.argv) > 1 else None
+    conn = get_db_connection()
+    try:
+        version = stamp_data_version(conn, version)
+    finally:
+        conn.close()
+    print(f"Data version: {version}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,28 @@
+"""Shared fixtures: a small synthetic database served by the API."""
+import pytest
+
+from backend import database
+from scripts import build_synthetic_db
+
+
+@pytest.fixture(scope="session")
+def synthetic_db(tmp_path_factory):
+    """A migrated synthetic database with 2% of the chapters of a full Bible."""
+    path = tmp_path_factory.mktemp("data") / "bible.db"
+    build_synthetic_db.build(path, seed=1, scale=0.02)
+    return path
+
+
+@pytest.fixture(scope="session")
+def api(synthetic_db):
+    """A TestClient for the app, running against `synthetic_db`."""
+    pytest.importorskip("fastapi")
+    pytest.importorskip("httpx")
+    from fastapi.testclient import TestClient
+
+    from backend.main import app
+
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setattr(database, "DATABASE_PATH", synthetic_db)
+        with TestClient(app) as client:
+            yield client
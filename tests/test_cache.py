@@ -0,0 +1,108 @@
+"""Tests for backend/cache.py."""
+import asyncio
+
+import pytest
+
+from backend.cache import LRUCache, SingleFlight, estimate_size
+
+
+def test_lru_cache_hits_and_misses():
+    cache = LRUCache(100)
+    assert cache.get("john-3", "v1") is None
+    cache.put("john-3", {"verses": [16]}, "v1")
+    assert cache.get("john-3", "v1") == {"verses": [16]}
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["entries"]) == (1, 1, 1)
+    assert stats["bytes"] == estimate_size({"verses": [16]})
+
+
+def test_lru_cache_evicts_least_recently_used():
+    cache = LRUCache(30)
+    cache.put("a", "x", size=10)
+    cache.put("b", "x", size=10)
+    cache.put("c", "x", size=10)
+    cache.get("a")
+    cache.put("d", "x", size=10)
+    assert cache.get("b") is None
+    assert [cache.get(key) for key in "acd"] == ["x", "x", "x"]
+    assert cache.stats()["evictions"] == 1
+    assert cache.stats()["bytes"] == 30
+
+
+def test_lru_cache_replacing_a_key_keeps_the_byte_count():
+    cache = LRUCache(30)
+    cache.put("a", "x", size=10)
+    cache.put("a", "y", size=20)
+    assert cache.get("a") == "y"
+    assert cache.stats()["bytes"] == 20
+
+
+def test_lru_cache_skips_oversized_values():
+    cache = LRUCache(10)
+    cache.put("a", "x", size=11)
+    assert cache.get("a") is None
+    assert cache.stats()["entries"] == 0
+
+
+def test_lru_cache_drops_entries_from_another_data_version():
+    cache = LRUCache(100)
+    cache.put("a", "old", "v1", size=10)
+    assert cache.get("a", "v2") is None
+    stats = cache.stats()
+    assert (stats["entries"], stats["invalidations"], stats["data_version"]) == (0, 1, "v2")
+    cache.put("a", "new", "v2", size=10)
+    assert cache.get("a", "v2") == "new"
+
+
+def test_single_flight_shares_one_build():
+    flight = SingleFlight()
+    builds = []
+
+    async def build():
+        builds.append(1)
+        await asyncio.sleep(0.01)
+        return "payload"
+
+    async def scenario():
+        results = await asyncio.gather(*(flight.run("q", build) for _ in range(5)))
+        assert results == ["payload"] * 5
+        assert flight.stats() == {"in_flight": 0, "coalesced": 4}
+        # A finished build is not reused; the next call builds again
+        assert await flight.run("q", build) == "payload"
+
+    asyncio.run(scenario())
+    assert len(builds) == 2
+
+
+def test_single_flight_shares_failures_and_forgets_them():
+    flight = SingleFlight()
+
+    async def fail():
+        await asyncio.sleep(0.01)
+        raise ValueError("bad query")
+
+    async def scenario():
+        results = await asyncio.gather(*(flight.run("q", fail) for _ in range(3)), return_exceptions=True)
+        assert all(isinstance(result, ValueError) for result in results)
+        assert flight.stats()["in_flight"] == 0
+
+    asyncio.run(scenario())
+
+
+def test_single_flight_survives_a_cancelled_caller():
+    flight = SingleFlight()
+
+    async def build():
+        await asyncio.sleep(0.05)
+        return "payload"
+
+    async def scenario():
+        first = asyncio.ensure_future(flight.run("q", build))
+        second = asyncio.ensure_future(flight.run("q", build))
+        await asyncio.sleep(0.01)
+        first.cancel()
+        assert await second == "payload"
+        with pytest.raises(asyncio.CancelledError):
+            await first
+
+    asyncio.run(scenario())
@@ -0,0 +1,122 @@
+"""Negotiated compression and the compressed side cache from backend/compression.py."""
+import asyncio
+import gzip
+import json
+import zlib
+
+import pytest
+
+main = pytest.importorskip("backend.main", reason="the API needs fastapi")
+
+from backend.compression import COMPRESSION_MIN_BYTES, ENCODERS, negotiate  # noqa: E402
+
+PASSAGE = "/api/passage/John 1"
+SMALL = "/api/verse/John 1:1"
+GZIP = {"Accept-Encoding": "gzip"}
+
+
+@pytest.mark.parametrize("accept_encoding, expected", [
+    ("gzip", "gzip"),
+    ("GZip;q=0.5", "gzip"),
+    ("gzip;q=0", None),
+    ("identity", None),
+    ("", None),
+    ("gzip;q=bad", None),
+])
+def test_negotiate(accept_encoding, expected):
+    assert negotiate(accept_encoding) == expected
+
+
+def test_negotiate_prefers_the_best_accepted_encoding():
+    assert negotiate("gzip, br, zstd") == next(iter(ENCODERS))
+    # A wildcard covers every encoding not refused by name
+    assert negotiate("*;q=0.5, gzip;q=0") == next((name for name in ENCODERS if name != "gzip"), None)
+
+
+def test_large_responses_are_compressed(api):
+    plain = api.get(PASSAGE, headers={"Accept-Encoding": "identity"})
+    assert len(plain.content) >= COMPRESSION_MIN_BYTES
+    assert "content-encoding" not in plain.headers
+    assert plain.headers["vary"] == "Accept-Encoding"
+
+    compressed = api.get(PASSAGE, headers=GZIP)
+    assert compressed.headers["content-encoding"] == "gzip"
+    assert compressed.headers["etag"] == plain.headers["etag"][:-1] + '-gzip"'
+    assert int(compressed.headers["content-length"]) < len(plain.content)
+    # httpx has already decoded the body
+    assert compressed.content == plain.content
+
+
+def test_refused_encoding_is_not_used(api):
+    response = api.get(PASSAGE, headers={"Accept-Encoding": "gzip;q=0"})
+    assert "content-encoding" not in response.headers
+    assert response.headers["vary"] == "Accept-Encoding"
+
+
+def test_small_responses_are_sent_as_is(api):
+    response = api.get(SMALL, headers=GZIP)
+    assert response.status_code == 200
+    assert len(response.content) < COMPRESSION_MIN_BYTES
+    assert "content-encoding" not in response.headers
+
+
+def test_repeat_requests_are_replayed_from_the_side_cache(api, monkeypatch):
+    first = api.get(PASSAGE, params={"translation": "KJV"}, headers=GZIP)
+
+    async def fail(*args, **kwargs):
+        raise AssertionError("the endpoint ran for a cached compressed body")
+
+    monkeypatch.setattr(main, "get_chapter", fail)
+    again = api.get(PASSAGE, params={"translation": "KJV"}, headers=GZIP)
+    assert again.status_code == 200
+    assert again.content == first.content
+    assert again.headers["etag"] == first.headers["etag"]
+    assert again.headers["content-length"] == first.headers["content-length"]
+
+
+async def raw_get(path: str, query: bytes, headers: dict) -> list:
+    """Every ASGI message the app sends for a GET, unbuffered (TestClient joins the body)."""
+    messages = []
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "GET",
+        "scheme": "http", "path": path, "raw_path": path.encode(), "root_path": "",
+        "query_string": query, "server": ("testserver", 80), "client": ("testclient", 50000),
+        "headers": [(b"host", b"testserver")] + [(k.lower().encode(), v.encode()) for k, v in headers.items()],
+    }
+
+    finished = asyncio.Event()
+    requested = []
+
+    async def receive():
+        if not requested:
+            requested.append(True)
+            return {"type": "http.request", "body": b"", "more_body": False}
+        # Streaming responses wait on this for a disconnect
+        await finished.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        messages.append(message)
+        if message["type"] == "http.response.body" and not message.get("more_body"):
+            finished.set()
+
+    await main.app(scope, receive, send)
+    return messages
+
+
+def test_streamed_exports_stay_chunked_when_compressed(api):
+    query = b"book=John&translation=WEB&format=ndjson&include_commentary=false"
+    start, *bodies = api.portal.call(raw_get, "/api/offline/book", query, GZIP)
+    assert dict(start["headers"])[b"content-encoding"] == b"gzip"
+    chunks = [message["body"] for message in bodies if message["body"]]
+    assert len(chunks) > 2
+
+    # Each chunk is flushed, so it decodes to whole lines on arrival
+    decoder = zlib.decompressobj(31)
+    lines = []
+    for chunk in chunks[:-1]:
+        text = decoder.decompress(chunk).decode()
+        assert text.endswith("\n")
+        lines.extend(json.loads(line) for line in text.splitlines())
+    assert lines[0]["book"] == "John"
+    assert gzip.decompress(b"".join(chunks)).decode().count("\n") >= len(lines)
@@ -0,0 +1,43 @@
+"""Concordance endpoints: /api/word/{strong_number}/stats and /translations."""
+import sqlite3
+
+import pytest
+
+
+@pytest.fixture(scope="module")
+def rendered_word(synthetic_db):
+    """(Strong's number, translation) of the word with the most aligned renderings."""
+    conn = sqlite3.connect(synthetic_db)
+    try:
+        return conn.execute("""
+            SELECT strong_number, translation_id FROM word_rendering_totals ORDER BY aligned DESC LIMIT 1
+        """).fetchone()
+    finally:
+        conn.close()
+
+
+def test_word_translations(api, rendered_word):
+    strong_number, translation = rendered_word
+    body = api.get(f"/api/word/{strong_number}/translations",
+                   params={"translation": translation, "limit": 3}).json()
+    assert body["aligned"] > 0
+    assert 0 < len(body["renderings"]) <= min(3, body["distinct_renderings"])
+    counts = [rendering["count"] for rendering in body["renderings"]]
+    assert counts == sorted(counts, reverse=True)
+
+
+def test_word_translations_in_a_translation_without_alignments(api, rendered_word):
+    strong_number, _ = rendered_word
+    body = api.get(f"/api/word/{strong_number}/translations", params={"translation": "KJV"}).json()
+    assert (body["aligned"], body["distinct_renderings"], body["renderings"]) == (0, 0, [])
+
+
+@pytest.mark.parametrize("strong_number, translation, detail", [
+    (None, "XYZ", "Translation not found: XYZ"),
+    ("H999999", "BSB", "Word not found: H999999"),
+])
+def test_word_translations_not_found(api, rendered_word, strong_number, translation, detail):
+    strong_number = strong_number or rendered_word[0]
+    response = api.get(f"/api/word/{strong_number}/translations", params={"translation": translation})
+    assert response.status_code == 404
+    assert response.json()["detail"] == detail
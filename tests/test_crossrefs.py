@@ -0,0 +1,63 @@
+"""Vote-ranked cross-references from /api/passage/{reference}/crossrefs."""
+import sqlite3
+from itertools import groupby
+
+import pytest
+
+
+@pytest.fixture(scope="module")
+def chapter_refs(synthetic_db):
+    """(reference, every cross-reference row) for the chapter with the most repeated sources."""
+    conn = sqlite3.connect(synthetic_db)
+    try:
+        chapter_key, = conn.execute("""
+            SELECT source_key / 1000 FROM cross_references
+            GROUP BY source_key / 1000 ORDER BY COUNT(*) - COUNT(DISTINCT source_key) DESC LIMIT 1
+        """).fetchone()
+        book, = conn.execute("SELECT name FROM books WHERE book_order = ?", (chapter_key // 1000,)).fetchone()
+        rows = conn.execute("""
+            SELECT x.source_key % 1000, tb.name, x.target_key / 1000 % 1000, x.target_key % 1000,
+                   x.votes, x.target_key
+            FROM cross_references x JOIN books tb ON tb.book_order = x.target_key / 1000000
+            WHERE x.source_key / 1000 = ?
+        """, (chapter_key,)).fetchall()
+    finally:
+        conn.close()
+    return f"{book} {chapter_key % 1000}:1-999", rows
+
+
+def expected_top(rows, top, min_votes=0):
+    """The `top` best-voted references per source verse, in source then votes order."""
+    ranked = sorted((r for r in rows if r[4] >= min_votes), key=lambda r: (r[0], -r[4], r[5]))
+    best = [row for _, refs in groupby(ranked, key=lambda r: r[0]) for row in list(refs)[:top]]
+    return [(r[0], r[1], r[2], r[3], r[4]) for r in best]
+
+
+def as_tuples(verses):
+    return [
+        (verse["verse"], ref["target_book"], ref["target_chapter"], ref["target_verse"], ref["votes"])
+        for verse in verses for ref in verse["cross_references"]
+    ]
+
+
+@pytest.mark.parametrize("top", [1, 2, 100])
+def test_top_k_per_source_verse(api, chapter_refs, top):
+    reference, rows = chapter_refs
+    response = api.get(f"/api/passage/{reference}/crossrefs",
+                        params={"top": top, "sort": "votes", "group": "verse"})
+    assert response.status_code == 200
+    assert as_tuples(response.json()["verses"]) == expected_top(rows, top)
+
+
+def test_top_k_with_min_votes(api, chapter_refs):
+    reference, rows = chapter_refs
+    min_votes = sorted(r[4] for r in rows)[len(rows) // 2]
+    response = api.get(f"/api/passage/{reference}/crossrefs",
+                       params={"top": 1, "min_votes": min_votes, "sort": "votes", "group": "verse"})
+    assert as_tuples(response.json()["verses"]) == expected_top(rows, 1, min_votes)
+
+
+def test_top_k_is_bounded(api, chapter_refs):
+    reference, _ = chapter_refs
+    assert api.get(f"/api/passage/{reference}/crossrefs", params={"top": 0}).status_code == 422
+    assert api.get(f"/api/passage/{reference}/crossrefs", params={"top": 101}).status_code == 422
@@ -0,0 +1,111 @@
+"""Tests for backend/database.py."""
+import asyncio
+import importlib
+import sqlite3
+import threading
+
+import pytest
+
+from backend import database
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    path = tmp_path / "bible.db"
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE verses (id INTEGER PRIMARY KEY, text TEXT)")
+    conn.execute("INSERT INTO verses (text) VALUES ('In the beginning')")
+    conn.commit()
+    conn.close()
+    return path
+
+
+@pytest.fixture
+def small_limits(monkeypatch):
+    """backend.database reloaded with DB_MAX_CONCURRENCY=2 and DB_BULK_CONCURRENCY=1."""
+    monkeypatch.setenv("DB_POOL_SIZE", "2")
+    monkeypatch.setenv("DB_MAX_CONCURRENCY", "2")
+    monkeypatch.setenv("DB_BULK_CONCURRENCY", "1")
+    yield importlib.reload(database)
+    monkeypatch.undo()
+    importlib.reload(database)
+
+
+def test_foreground_query_is_not_starved_by_bulk_jobs(small_limits, db_path):
+    assert (small_limits.MAX_CONCURRENCY, small_limits.BULK_CONCURRENCY) == (2, 1)
+    pool = small_limits.ConnectionPool()
+    pool.open(db_path, warm=False)
+    db = small_limits.Database(pool)
+    release = threading.Event()
+    running = []
+
+    def export(conn):
+        running.append(threading.current_thread().name)
+        release.wait(timeout=10)
+        return conn.execute("SELECT COUNT(*) FROM verses").fetchone()[0]
+
+    async def scenario():
+        db.start()
+        try:
+            bulk = [asyncio.ensure_future(db.run(export, bulk=True)) for _ in range(4)]
+            while not running:
+                await asyncio.sleep(0.01)
+            row = await asyncio.wait_for(db.fetch_one("SELECT text FROM verses WHERE id = 1"), timeout=5)
+            assert row["text"] == "In the beginning"
+            # Only one bulk job may hold a worker while the others queue
+            assert len(running) == 1
+            release.set()
+            assert await asyncio.gather(*bulk) == [1, 1, 1, 1]
+        finally:
+            release.set()
+            db.stop()
+            pool.close()
+
+    asyncio.run(scenario())
+
+
+def count_to(conn, emit, n):
+    for i in range(n):
+        emit(i)
+
+
+@pytest.fixture
+def started_db(db_path):
+    pool = database.ConnectionPool(size=2)
+    pool.open(db_path, warm=False)
+    db = database.Database(pool, max_concurrency=2, bulk_concurrency=1)
+    yield db
+    db.stop()
+    pool.close()
+
+
+def test_stream_waits_for_a_slow_consumer(started_db):
+    async def scenario():
+        started_db.start()
+        received = []
+        async for item in started_db.stream(count_to, 5, bulk=True, buffer=1, stall_timeout=5):
+            if not received:
+                # Longer than one poll of the producer's wait, well within the stall timeout
+                await asyncio.sleep(1.2)
+            received.append(item)
+        return received
+
+    assert asyncio.run(scenario()) == [0, 1, 2, 3, 4]
+
+
+def test_stream_releases_its_worker_when_the_consumer_stalls(started_db):
+    async def scenario():
+        started_db.start()
+        received = []
+        with pytest.raises(database.StreamClosed):
+            async for item in started_db.stream(count_to, 100, bulk=True, buffer=1, stall_timeout=0.2):
+                if not received:
+                    await asyncio.sleep(0.6)
+                    # The bulk slot is free again while the consumer is still connected
+                    assert started_db.stats()["bulk_active"] == 0
+                received.append(item)
+        assert len(received) < 100
+        # The next bulk job gets the slot straight away
+        return await asyncio.wait_for(started_db.run(count_to, lambda item: None, 3, bulk=True), timeout=5)
+
+    asyncio.run(scenario())
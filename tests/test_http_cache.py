@@ -0,0 +1,99 @@
+"""Validators, 304s and Cache-Control from backend/http_cache.py."""
+import pytest
+
+main = pytest.importorskip("backend.main", reason="the API needs fastapi")
+
+from backend.http_cache import etag_matches, make_etag  # noqa: E402
+
+PASSAGE = "/api/passage/John 1"
+IDENTITY = {"Accept-Encoding": "identity"}
+FUTURE = "Sat, 01 Jan 2100 00:00:00 GMT"
+PAST = "Mon, 01 Jan 1990 00:00:00 GMT"
+
+
+@pytest.fixture
+def endpoint_calls(monkeypatch):
+    """Count calls into /api/passage's chapter loader."""
+    calls = []
+    get_chapter = main.get_chapter
+
+    async def counted(*args, **kwargs):
+        calls.append(args)
+        return await get_chapter(*args, **kwargs)
+
+    monkeypatch.setattr(main, "get_chapter", counted)
+    return calls
+
+
+def test_content_responses_carry_validators(api):
+    response = api.get(PASSAGE, headers=IDENTITY)
+    assert response.status_code == 200
+    assert response.headers["etag"].startswith('"')
+    assert "last-modified" in response.headers
+    assert response.headers["cache-control"].startswith("public, max-age=3600")
+
+
+@pytest.mark.parametrize("encoding", ["identity", "gzip"])
+def test_matching_if_none_match_is_answered_before_the_endpoint(api, endpoint_calls, encoding):
+    etag = api.get(PASSAGE, headers={"Accept-Encoding": encoding}).headers["etag"]
+    if encoding == "gzip":
+        assert etag.endswith('-gzip"')
+    endpoint_calls.clear()
+
+    response = api.get(PASSAGE, headers={"Accept-Encoding": encoding, "If-None-Match": f'"other", W/{etag}'})
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["etag"] == etag
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert endpoint_calls == []
+
+
+def test_stale_if_none_match_gets_the_body(api):
+    response = api.get(PASSAGE, headers={**IDENTITY, "If-None-Match": '"stale"'})
+    assert response.status_code == 200
+    assert response.json()["verses"]
+
+
+def test_if_modified_since(api, endpoint_calls):
+    response = api.get(PASSAGE, headers={**IDENTITY, "If-Modified-Since": FUTURE})
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert "etag" in response.headers and "cache-control" in response.headers
+    # Unlike an ETag match, the date alone can't show the resource exists
+    assert len(endpoint_calls) == 1
+
+    assert api.get(PASSAGE, headers={**IDENTITY, "If-Modified-Since": PAST}).status_code == 200
+    assert api.get(PASSAGE, headers={**IDENTITY, "If-Modified-Since": "not a date"}).status_code == 200
+
+
+@pytest.mark.parametrize("path", ["/api/word/H999999", "/api/verse/John 1:999"])
+def test_if_modified_since_keeps_errors(api, path):
+    response = api.get(path, headers={"If-Modified-Since": FUTURE})
+    assert response.status_code == 404
+    assert "etag" not in response.headers
+
+
+def test_if_none_match_star(api):
+    assert api.get(PASSAGE, headers={"If-None-Match": "*"}).status_code == 304
+    assert api.get("/api/word/H999999", headers={"If-None-Match": "*"}).status_code == 404
+
+
+@pytest.mark.parametrize("path", ["/api/health", "/api/ready"])
+def test_operational_endpoints_are_never_cached(api, path):
+    response = api.get(path, headers={"If-Modified-Since": FUTURE})
+    assert response.status_code == 200
+    assert response.headers["cache-control"] == "no-store"
+    assert "etag" not in response.headers
+
+
+def test_etag_ignores_query_parameter_order():
+    assert make_etag("v1", "/api/search", b"q=love&limit=5") == make_etag("v1", "/api/search", b"limit=5&q=love")
+    assert make_etag("v1", "/api/search", b"q=love") != make_etag("v2", "/api/search", b"q=love")
+
+
+def test_etag_matches_compressed_variants():
+    etag = '"abc"'
+    assert etag_matches('"abc"', etag) == '"abc"'
+    assert etag_matches('W/"abc-br", "x"', etag) == '"abc-br"'
+    assert etag_matches('"abcd"', etag) is None
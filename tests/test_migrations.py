@@ -0,0 +1,130 @@
+"""Tests for backend/migrations.py."""
+import logging
+import sqlite3
+
+import pytest
+
+from backend.database import SCHEMA
+from backend.migrations import (
+    SCHEMA_VERSION, add_commentary_links, canonical_strong, fill_column, migrate_strong_canonical,
+    migrate_verse_keys, pending_migrations, run_migrations, schema_version,
+)
+from scripts import import_stepbible_alignment
+
+STRONG_NUMBERS = [
+    ("H0430", "H430"),
+    ("H430", "H430"),
+    ("G0026", "G26"),
+    ("G00001", "G1"),
+    ("H0430a", "H430"),
+    ("G2424G", "G2424"),
+    ("h0430", "H430"),
+    ("H0", "H0"),
+    ("X123", "X123"),
+    ("H12ab", "H12ab"),
+    ("", ""),
+    (None, None),
+]
+
+
+@pytest.mark.parametrize("strong_number, expected", STRONG_NUMBERS)
+def test_canonical_strong(strong_number, expected):
+    assert canonical_strong(strong_number) == expected
+
+
+def test_import_and_migration_agree_on_canonical_strong():
+    conn = sqlite3.connect(":memory:")
+    conn.execute("CREATE TABLE word_alignments (strong_number TEXT)")
+    conn.executemany("INSERT INTO word_alignments (strong_number) VALUES (?)",
+                     [(number,) for number, _ in STRONG_NUMBERS])
+
+    migrate_strong_canonical(conn, batch_size=3)
+
+    migrated = conn.execute("SELECT strong_number, strong_canonical FROM word_alignments ORDER BY rowid")
+    for strong_number, canonical in migrated:
+        assert canonical == import_stepbible_alignment.canonical_strong(strong_number)
+
+
+@pytest.mark.parametrize("text, ref", [
+    ("Joh 3:16", "John 3:16"),
+    ("psa 23:1-4", "Psalms 23:1-4"),
+    ("1 Samuel 2:3", "1 Samuel 2:3"),
+    ("Sa1 1:1", "1 Samuel 1:1"),
+    ("Jo2 1:4", "2 John 1:4"),
+    ("Peter 2:5", "1 Peter 2:5"),
+    ("Song of Solomon 2:1", "Song of Solomon 2:1"),
+])
+def test_add_commentary_links(text, ref):
+    assert add_commentary_links(f"See {text}.") == (
+        f'See <a href="#" class="commentary-ref" data-ref="{ref}">{text}</a>.'
+    )
+
+
+@pytest.fixture
+def legacy_db():
+    """A pre-migration database: speaker_verses addressed by book name only."""
+    conn = sqlite3.connect(":memory:")
+    conn.executescript("""
+        CREATE TABLE books (name TEXT PRIMARY KEY, book_order INTEGER);
+        INSERT INTO books VALUES ('Genesis', 1), ('John', 43);
+        CREATE TABLE speaker_verses (
+            id INTEGER PRIMARY KEY, book TEXT, chapter INTEGER, verse INTEGER, speaker TEXT, is_divine BOOLEAN
+        );
+    """)
+    rows = [("John" if i % 2 else "Genesis", 1, i, "God", 1) for i in range(1, 8)]
+    rows[3] = ("Hezekiah", 1, 4, "Isaiah", 0)
+    conn.executemany(
+        "INSERT INTO speaker_verses (book, chapter, verse, speaker, is_divine) VALUES (?, ?, ?, ?, ?)", rows
+    )
+    conn.commit()
+    return conn
+
+
+def test_fill_column_skips_rows_without_a_value(legacy_db, caplog):
+    legacy_db.execute("ALTER TABLE speaker_verses ADD COLUMN verse_key INTEGER")
+    expression = (
+        "(SELECT book_order FROM books WHERE name = book) * 1000000 + chapter * 1000 + verse"
+    )
+    with caplog.at_level(logging.WARNING, logger="backend.migrations"):
+        filled = fill_column(legacy_db, "speaker_verses", "verse_key", expression, batch_size=2)
+
+    assert filled == 6
+    assert "speaker_verses.verse_key: 1 rows left NULL" in caplog.text
+    keys = legacy_db.execute("SELECT verse_key FROM speaker_verses ORDER BY id").fetchall()
+    assert [key for key, in keys] == [43001001, 1001002, 43001003, None, 43001005, 1001006, 43001007]
+
+    # A second pass has nothing left it can fill
+    assert fill_column(legacy_db, "speaker_verses", "verse_key", expression, batch_size=2) == 0
+
+
+def test_fill_column_respects_where(legacy_db):
+    legacy_db.execute("ALTER TABLE speaker_verses ADD COLUMN verse_key INTEGER")
+    filled = fill_column(legacy_db, "speaker_verses", "verse_key", "verse", batch_size=3, where="AND is_divine")
+    assert filled == 6
+    assert legacy_db.execute("SELECT verse_key FROM speaker_verses WHERE NOT is_divine").fetchone() == (None,)
+
+
+def test_migrate_verse_keys_adds_trigger_and_index(legacy_db):
+    migrate_verse_keys(legacy_db, batch_size=2)
+
+    assert legacy_db.execute("SELECT verse_key FROM speaker_verses WHERE id = 3").fetchone() == (43001003,)
+    legacy_db.execute(
+        "INSERT INTO speaker_verses (book, chapter, verse, speaker, is_divine) VALUES ('John', 3, 16, 'Jesus', 1)"
+    )
+    assert legacy_db.execute("SELECT verse_key FROM speaker_verses WHERE verse = 16").fetchone() == (43003016,)
+    indexes = {row[1] for row in legacy_db.execute("PRAGMA index_list(speaker_verses)")}
+    assert "idx_speaker_verses_key" in indexes
+
+
+def test_run_migrations_on_a_new_database():
+    conn = sqlite3.connect(":memory:")
+    conn.executescript(SCHEMA)
+    assert len(pending_migrations(conn)) == SCHEMA_VERSION
+
+    assert len(run_migrations(conn, batch_size=2)) == SCHEMA_VERSION
+    assert schema_version(conn) == SCHEMA_VERSION
+    assert pending_migrations(conn) == []
+    assert run_migrations(conn) == []
+    # Rerunning is safe and leaves the version where it was
+    assert len(run_migrations(conn, rerun=True)) == SCHEMA_VERSION
+    assert schema_version(conn) == SCHEMA_VERSION
@@ -0,0 +1,98 @@
+"""Keyset pagination of /api/word occurrences and /api/search results."""
+import json
+import sqlite3
+
+import pytest
+
+
+@pytest.fixture(scope="module")
+def strong_number(synthetic_db):
+    """The Strong's number with the most occurrences."""
+    conn = sqlite3.connect(synthetic_db)
+    try:
+        return conn.execute("""
+            SELECT strong_number FROM words GROUP BY strong_number ORDER BY COUNT(*) DESC LIMIT 1
+        """).fetchone()[0]
+    finally:
+        conn.close()
+
+
+def occurrence_key(occurrence):
+    return occurrence["book"], occurrence["chapter"], occurrence["verse"], occurrence["position"]
+
+
+def test_word_occurrence_pages_cover_every_occurrence_once(api, strong_number):
+    first = api.get(f"/api/word/{strong_number}", params={"limit": 500}).json()
+    assert first["next_cursor"] is None or len(first["occurrences"]) == 500
+
+    pages, cursor = [], None
+    while True:
+        params = {"limit": 7, **({"cursor": cursor} if cursor else {})}
+        page = api.get(f"/api/word/{strong_number}", params=params).json()
+        assert len(page["occurrences"]) <= 7
+        # Totals and facets describe every occurrence on every page
+        assert page["count"] == sum(book["count"] for book in page["books"])
+        pages.extend(page["occurrences"])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+
+    assert len(pages) == first["count"]
+    assert len({occurrence_key(o) for o in pages}) == len(pages)
+    assert pages[:len(first["occurrences"])] == first["occurrences"]
+
+
+def test_word_occurrences_ndjson_continues_after_cursor(api, strong_number):
+    def stream(**params):
+        response = api.get(f"/api/word/{strong_number}", params={"format": "ndjson", **params})
+        return [json.loads(line) for line in response.text.splitlines()]
+
+    page = api.get(f"/api/word/{strong_number}", params={"limit": 5}).json()
+    header, *everything = stream()
+    _, *rest = stream(cursor=page["next_cursor"])
+    assert header["count"] == len(everything)
+    assert everything[:5] == page["occurrences"]
+    assert rest == everything[5:]
+
+
+@pytest.mark.parametrize("cursor", ["abc", "1001001", "1001001.x"])
+def test_word_occurrences_reject_bad_cursors(api, strong_number, cursor):
+    response = api.get(f"/api/word/{strong_number}", params={"cursor": cursor})
+    assert response.status_code == 400
+
+
+def search_pages(api, result_type, **params):
+    """Every page of one result type, following that type's next_cursor."""
+    first = api.get("/api/search", params=params).json()
+    pages = [first]
+    cursor = first["next_cursor"].get(result_type)
+    while cursor:
+        page = api.get("/api/search", params={**params, "cursor": cursor}).json()
+        assert "totals" not in page
+        assert {result["type"] for result in page["results"]} <= {result_type}
+        pages.append(page)
+        cursor = page["next_cursor"].get(result_type)
+    return first, [r for page in pages for r in page["results"] if r["type"] == result_type]
+
+
+@pytest.mark.parametrize("result_type, scope", [("verse", "bible"), ("commentary", "all")])
+def test_search_pages_cover_every_hit_once(api, result_type, scope):
+    first, results = search_pages(api, result_type, q="grace", scope=scope, limit=9)
+    assert len(results) == first["totals"][result_type] > 9
+    if result_type == "verse":
+        keys = {(r["book"], r["chapter"], r["verse"]) for r in results}
+        assert len(keys) == len(results)
+        facets = first["facets"]
+        assert sum(book["count"] for book in facets["books"]) == len(results)
+        assert sum(facets["testaments"].values()) == len(results)
+
+
+def test_search_pages_by_strongs_number(api, strong_number):
+    _, results = search_pages(api, "verse", q=strong_number, limit=11)
+    word = api.get(f"/api/word/{strong_number}", params={"limit": 500}).json()
+    assert len(results) == word["count"]
+
+
+@pytest.mark.parametrize("cursor", ["verse:1.5", "page:1.5:3", "verse:x:3", "verse:1.5:3.5"])
+def test_search_rejects_bad_cursors(api, cursor):
+    assert api.get("/api/search", params={"q": "grace", "cursor": cursor}).status_code == 400
@@ -0,0 +1,32 @@
+"""Single-chapter routes under /api/passage/{reference}."""
+import pytest
+
+
+@pytest.mark.parametrize("reference, verses", [
+    ("John 1:3-5", [3, 4, 5]),
+    ("jn 1:3", [3]),
+])
+def test_passage_highlights_requested_verses(api, reference, verses):
+    passage = api.get(f"/api/passage/{reference}").json()
+    assert {(verse["book"], verse["chapter"]) for verse in passage["verses"]} == {("John", 1)}
+    assert passage["highlighted_verses"] == verses
+
+
+@pytest.mark.parametrize("reference", ["John 1", "John"])
+def test_passage_without_verses_is_a_chapter(api, reference):
+    passage = api.get(f"/api/passage/{reference}").json()
+    assert {(verse["book"], verse["chapter"]) for verse in passage["verses"]} == {("John", 1)}
+    assert passage["verses"][0]["verse"] == 1
+    assert passage["highlighted_verses"] == []
+
+
+@pytest.mark.parametrize("route", ["", "/commentary", "/crossrefs", "/interlinear"])
+@pytest.mark.parametrize("reference", ["John 1:1; Rom 1:1", "John 1:1, 5", "John 1-2", "John 1:5-2:3", "Genesis 50-Exodus 2"])
+def test_passage_rejects_more_than_one_chapter(api, route, reference):
+    response = api.get(f"/api/passage/{reference}{route}")
+    assert response.status_code == 400
+    assert "/api/passages" in response.json()["detail"]
+
+
+def test_passage_rejects_invalid_references(api):
+    assert api.get("/api/passage/Hezekiah 1").status_code == 400
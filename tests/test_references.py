@@ -0,0 +1,57 @@
+"""Tests for backend/references.py."""
+import pytest
+
+from backend.references import book_name, parse_reference, parse_references, verse_key
+
+REFERENCES = [
+    ("John 3:16", ["John 3:16"]),
+    ("john 3:16-18", ["John 3:16-18"]),
+    ("Rom 5:8, 10", ["Romans 5:8", "Romans 5:10"]),
+    ("John 3:16; 4", ["John 3:16", "John 4"]),
+    ("John 3:16; Rom 5:8", ["John 3:16", "Romans 5:8"]),
+    ("Gen 1:26-2:3", ["Genesis 1:26-2:3"]),
+    ("Genesis 1-3, Jude", ["Genesis 1-3", "Jude"]),
+    ("Ps.148.4-Ps.148.5", ["Psalms 148:4-5"]),
+    ("GEN 1:3", ["Genesis 1:3"]),
+    ("1 Jn 1:9", ["1 John 1:9"]),
+    ("1Sam 17", ["1 Samuel 17"]),
+    ("Song of Solomon 2:1", ["Song of Solomon 2:1"]),
+    ("Ps 25:7b", ["Psalms 25:7"]),
+    ("Matt 5:3–6", ["Matthew 5:3-6"]),
+    ("Mal 4:6-Matt 1:1", ["Malachi 4:6-Matthew 1:1"]),
+]
+
+
+@pytest.mark.parametrize("text, expected", REFERENCES)
+def test_parse_references(text, expected):
+    assert [str(passage) for passage in parse_references(text)] == expected
+
+
+@pytest.mark.parametrize("text", [
+    "", "Hezekiah 1:1", "John 0:1", "John 3:1000", "John 3:18-16", "Rev 1:1-Gen 1:1", "5:8", "John 3:16; Foo 1",
+])
+def test_parse_references_rejects_invalid(text):
+    assert parse_references(text) is None
+
+
+def test_verse_keys():
+    passage = parse_reference("John 3:16-18")
+    assert (passage.start, passage.end, passage.has_verse) == (43003016, 43003018, True)
+    assert passage.start == verse_key(43, 3, 16)
+
+    chapter = parse_reference("John 3")
+    assert (chapter.start, chapter.end, chapter.has_verse) == (43003001, 43003999, False)
+
+    book = parse_reference("Jude")
+    assert (book.start, book.end) == (65001001, 65999999)
+
+
+def test_parse_reference_needs_a_single_passage():
+    assert parse_reference("John 3:16; Rom 5:8") is None
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("1 jn", "1 John"), ("Ps.", "Psalms"), ("JHN", "John"), ("song of solomon", "Song of Solomon"), ("Foo", None),
+])
+def test_book_name(text, expected):
+    assert book_name(text) == expected
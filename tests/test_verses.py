@@ -0,0 +1,62 @@
+"""Batch verse lookups from /api/verses."""
+import sqlite3
+
+import pytest
+
+main = pytest.importorskip("backend.main", reason="the API needs fastapi")
+VERSE_PREVIEW_MAX, VERSES_MAX_REFS = main.VERSE_PREVIEW_MAX, main.VERSES_MAX_REFS
+
+
+@pytest.fixture(scope="module")
+def john_1(synthetic_db):
+    """The WEB text of John 1, verse by verse."""
+    conn = sqlite3.connect(synthetic_db)
+    try:
+        return [text for text, in conn.execute("""
+            SELECT text FROM verses WHERE translation_id = 'WEB' AND book = 'John' AND chapter = 1
+            ORDER BY verse
+        """)]
+    finally:
+        conn.close()
+
+
+def test_get_verses(api, john_1):
+    response = api.get("/api/verses", params={"refs": "John 1:1; John 1:3, 5"})
+    assert response.json() == {
+        "translation": "WEB",
+        "verses": {"John 1:1": john_1[0], "John 1:3": john_1[2], "John 1:5": john_1[4]},
+    }
+
+
+def test_post_verses(api, john_1):
+    response = api.post("/api/verses", json={"refs": ["Jn 1:2", "John 1:2", "John 1:4"]})
+    assert response.json()["verses"] == {"John 1:2": john_1[1], "John 1:4": john_1[3]}
+
+
+def test_ranges_are_cut_to_a_preview(api, john_1):
+    verses = api.post("/api/verses", json={"refs": ["John 1:1-10", "John 1"]}).json()["verses"]
+    preview = " ".join(john_1[:VERSE_PREVIEW_MAX])
+    assert verses == {"John 1:1-10": preview, "John 1": preview}
+
+
+def test_references_without_text_are_left_out(api):
+    assert api.post("/api/verses", json={"refs": ["John 1:999"]}).json()["verses"] == {}
+
+
+def test_empty_refs_are_rejected(api):
+    assert api.post("/api/verses", json={"refs": []}).status_code == 422
+
+
+@pytest.mark.parametrize("refs", [["John 1:1", "Hezekiah 1:1"], [""]])
+def test_invalid_references_are_rejected(api, refs):
+    response = api.post("/api/verses", json={"refs": refs})
+    assert response.status_code == 400
+
+
+def test_reference_count_is_capped(api):
+    refs = [f"Psalms {chapter}:{verse}" for chapter in range(1, 150) for verse in range(1, 5)]
+    assert len(refs) > VERSES_MAX_REFS
+    assert api.post("/api/verses", json={"refs": refs[:VERSES_MAX_REFS]}).status_code == 200
+    response = api.post("/api/verses", json={"refs": refs[:VERSES_MAX_REFS + 1]})
+    assert response.status_code == 400
+    assert str(VERSES_MAX_REFS) in response.json()["detail"]